@@ -0,0 +1,44 @@
+"""Mocked aiohttp ClientResponse for the benchmarks.
+
+A trimmed copy of the response builder in tests/_mock_request.py (vendored/customized from aioresponses).  The tests
+package is not imported, as it requires the test setup (tests/test_data.yaml).
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import Mock
+
+from aiohttp import RequestInfo, StreamReader
+from aiohttp.client import ClientResponse, hdrs
+from aiohttp.client_proto import ResponseHandler
+from aiohttp.helpers import TimerNoop
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+
+def build_response(url: URL | str, method: str = hdrs.METH_GET, payload: Any = None, headers: dict[str, str] = None, status: int = 200) -> ClientResponse:
+    """ClientResponse with a json body built from payload."""
+    url = URL(url)
+    loop = Mock()
+    loop.get_debug = Mock(return_value=True)
+    resp = ClientResponse(
+        method,
+        url,
+        request_info=RequestInfo(url=url, method=method, headers=CIMultiDictProxy(CIMultiDict()), real_url=url),
+        writer=None,
+        continue100=None,
+        timer=TimerNoop(),
+        traces=[],
+        loop=loop,
+        session=None,
+    )
+    _headers = CIMultiDict({hdrs.CONTENT_TYPE: "application/json", **(headers or {})})
+    resp._headers = _headers
+    resp._raw_headers = tuple((k.encode("utf8"), v.encode("utf8")) for k, v in _headers.items())
+    resp.status = status
+    resp.reason = "OK"
+    resp.content = StreamReader(ResponseHandler(loop=loop), limit=2 ** 16, loop=loop)
+    resp.content.feed_data(json.dumps(payload).encode())
+    resp.content.feed_eof()
+    return resp
@@ -0,0 +1,175 @@
+"""Synthetic tenant data for the benchmark suite.
+
+All data is deterministic for a given size/seed, so results are comparable across runs/branches.
+Records are generated in two shapes, cache rows (matching the models in centralcli.models.sql) and
+raw API records (matching what the monitoring API returns, and what the cleaners expect).
+"""
+from __future__ import annotations
+
+import random
+from functools import cached_property
+from typing import Any
+
+DEV_TYPES = {"ap": 0.7, "cx": 0.2, "gw": 0.1}  # distribution of device types in the synthetic tenant
+MODELS = {"ap": "AP-635-US", "cx": "6300M", "gw": "9004-US"}
+DEVS_PER_SITE = 25
+DEVS_PER_GROUP = 500
+CLIENTS_PER_DEV = 3
+
+
+def _mac(idx: int, oui: int = 0x204C03) -> str:
+    value = (oui << 24) | idx
+    return ":".join(f"{b:02x}" for b in value.to_bytes(6, "big"))
+
+
+def _ip(idx: int) -> str:
+    return f"10.{(idx >> 16) & 255}.{(idx >> 8) & 255}.{idx & 255}"
+
+
+class Tenant:
+    """A synthetic Central tenant with size devices
+
+    Args:
+        size (int): The number of devices in the tenant.  Sites, groups, and clients are scaled from this.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+    """
+    def __init__(self, size: int, seed: int = 0) -> None:
+        self.size = size
+        self.seed = seed
+        rand = random.Random(seed)
+        self._types = rand.choices(list(DEV_TYPES), weights=list(DEV_TYPES.values()), k=size)
+        self._status = rand.choices(["Up", "Down"], weights=[0.9, 0.1], k=size)
+
+    def __repr__(self) -> str:  # pragma: no cover  used for debug
+        return f"<{type(self).__name__} {self.size} devices>"
+
+    @property
+    def site_names(self) -> list[str]:
+        return [f"site-{idx:05d}" for idx in range(max(1, self.size // DEVS_PER_SITE))]
+
+    @property
+    def group_names(self) -> list[str]:
+        return [f"group-{idx:03d}" for idx in range(max(1, self.size // DEVS_PER_GROUP))]
+
+    def serial(self, idx: int) -> str:
+        return f"CN{idx:08d}"
+
+    def name(self, idx: int) -> str:
+        return f"{self._types[idx]}-{idx:06d}"
+
+    # -- // cache rows \\ --
+    @cached_property
+    def sites(self) -> list[dict[str, Any]]:
+        return [{"name": name, "id": idx, "city": "Anytown", "state": "TN", "country": "United States", "devices": DEVS_PER_SITE} for idx, name in enumerate(self.site_names)]
+
+    @cached_property
+    def groups(self) -> list[dict[str, Any]]:
+        return [{"name": name, "allowed_types": ["ap", "cx", "gw"], "aos10": True, "wlan_tg": False, "wired_tg": False} for name in self.group_names]
+
+    @cached_property
+    def inventory(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": f"{idx:08x}-0000-0000-0000-000000000000",
+                "serial": self.serial(idx),
+                "mac": _mac(idx),
+                "type": self._types[idx],
+                "model": MODELS[self._types[idx]],
+                "sku": "R7J28A",
+                "subscription": f"advanced-{self._types[idx]}",
+                "subscription_expires": 1924905600,
+                "assigned": True,
+                "archived": False,
+            }
+            for idx in range(self.size)
+        ]
+
+    @cached_property
+    def devices(self) -> list[dict[str, Any]]:
+        sites, groups = self.site_names, self.group_names
+        return [
+            {
+                "name": self.name(idx),
+                "status": self._status[idx],
+                "type": self._types[idx],
+                "model": MODELS[self._types[idx]],
+                "ip": _ip(idx),
+                "serial": self.serial(idx),
+                "mac": _mac(idx),
+                "group": groups[idx % len(groups)],
+                "site": sites[idx // DEVS_PER_SITE % len(sites)],
+                "version": "10.7.1.0_91234",
+                "swack_id": None if self._types[idx] != "ap" else self.serial(idx - idx % 10),
+            }
+            for idx in range(self.size)
+        ]
+
+    @cached_property
+    def clients(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "mac": _mac(idx, oui=0xACDE48),
+                "name": f"client-{idx:07d}",
+                "ip": _ip(idx + (1 << 20)),
+                "type": "wireless" if dev["type"] == "ap" else "wired",
+                "network_port": "corp" if dev["type"] == "ap" else "1/1/1",
+                "connected_serial": dev["serial"],
+                "connected_name": dev["name"],
+                "site": dev["site"],
+                "group": dev["group"],
+                "last_connected": 1760000000 + idx,
+            }
+            for idx, dev in ((idx, self.devices[idx // CLIENTS_PER_DEV]) for idx in range(self.size * CLIENTS_PER_DEV))
+        ]
+
+    # -- // raw API records \\ --
+    @cached_property
+    def api_devices(self) -> list[dict[str, Any]]:
+        """Devices in the format returned by the monitoring API (i.e. /monitoring/v2/aps)"""
+        return [
+            {
+                "name": dev["name"],
+                "status": dev["status"],
+                "model": dev["model"],
+                "ip_address": dev["ip"],
+                "macaddr": dev["mac"],
+                "serial": dev["serial"],
+                "group_name": dev["group"],
+                "site": dev["site"],
+                "firmware_version": dev["version"],
+                "client_count": CLIENTS_PER_DEV,
+                "labels": [],
+                "uptime": 864000,
+                "last_modified": 1760000000,
+                "cpu_utilization": 4,
+                "mem_total": 2048000000,
+                "mem_free": 1024000000,
+                "swarm_id": dev["swack_id"],
+            }
+            for dev in self.devices
+        ]
+
+    @cached_property
+    def api_clients(self) -> list[dict[str, Any]]:
+        """Clients in the format returned by the monitoring API (i.e. /monitoring/v2/clients)"""
+        return [
+            {
+                "name": client["name"],
+                "ip_address": client["ip"],
+                "macaddr": client["mac"],
+                "user_role": "authenticated",
+                "vlan": 10,
+                "network": client["network_port"] if client["type"] == "wireless" else "NA",
+                "interface_port": None if client["type"] == "wireless" else client["network_port"],
+                "connection": "802.11ax" if client["type"] == "wireless" else None,
+                "associated_device": client["connected_serial"],
+                "group_name": client["group"],
+                "site": client["site"],
+                "client_type": client["type"].upper(),
+                "os_type": "Windows 11",
+                "last_connection_time": client["last_connected"] * 1000,
+                "signal_db": -55,
+                "speed": 1200,
+            }
+            for client in self.clients
+        ]
@@ -0,0 +1,102 @@
+"""cencli benchmark suite
+
+Benchmarks for the hot paths (pagination, batch requests, cache writes/lookups, completion, rendering, and cleaners)
+against a synthetic tenant.  Requires the test dependency group plus pytest-benchmark (``uv sync --group bench``).
+The test suite setup (tests/test_data.yaml) is not required, the tests package is not imported.
+
+Run from the repo root:
+    python -m pytest benchmarks                          # default tenant size of 1,000 devices
+    python -m pytest benchmarks --tenant-size 20000      # or set CENCLI_BENCH_TENANT_SIZE
+    python -m pytest benchmarks --benchmark-autosave     # then --benchmark-compare to compare against the previous run
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine
+from yarl import URL
+
+from centralcli import config
+from centralcli.cache.sqlite import Cache, DBAction
+from centralcli.models.sql import Base, Client, Device, Group, InventoryDevice, Site
+
+from ._response import build_response
+from ._tenant import Tenant
+
+DEFAULT_TENANT_SIZE = 1_000
+RL_HEADERS = {
+    "X-RateLimit-Limit-second": "7",
+    "X-RateLimit-Remaining-second": "6",
+    "X-RateLimit-Limit-day": "1000000",
+    "X-RateLimit-Remaining-day": "999999",
+}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--tenant-size",
+        type=int,
+        default=int(os.environ.get("CENCLI_BENCH_TENANT_SIZE", DEFAULT_TENANT_SIZE)),
+        help=f"Number of devices in the synthetic tenant (clients, sites, and groups scale from this). Default: {DEFAULT_TENANT_SIZE}",
+    )
+
+
+@pytest.fixture(scope="session")
+def tenant(request: pytest.FixtureRequest) -> Tenant:
+    return Tenant(request.config.getoption("--tenant-size"))
+
+
+def make_cache(db_file: Path) -> Cache:
+    """Cache object backed by db_file rather than the workspace cache (the workspace cache file is never opened or created)."""
+    with mock.patch.object(Cache, "create_engine", lambda _: create_engine(f"sqlite:///{db_file}")):
+        bench_cache = Cache(config)
+    Base.metadata.create_all(bench_cache.engine)
+    return bench_cache
+
+
+@pytest.fixture
+def new_cache(tmp_path: Path) -> Callable[[], Cache]:
+    """Factory for empty caches, each backed by a new db file (i.e. one per benchmark round)."""
+    db_files = (tmp_path / f"bench{idx}.db" for idx in itertools.count())
+    return lambda: make_cache(next(db_files))
+
+
+@pytest.fixture(scope="session")
+def tenant_cache(tmp_path_factory: pytest.TempPathFactory, tenant: Tenant) -> Cache:
+    """Cache populated with the synthetic tenant.  Shared by all benchmarks, must not be written to."""
+    bench_cache = make_cache(tmp_path_factory.mktemp("bench") / "tenant.db")
+    for table, data in [(Site, tenant.sites), (Group, tenant.groups), (InventoryDevice, tenant.inventory), (Device, tenant.devices), (Client, tenant.clients)]:
+        asyncio.run(bench_cache._update_db(table, data, action=DBAction.REPLACE))
+    return bench_cache
+
+
+@pytest.fixture
+def mock_api(monkeypatch: pytest.MonkeyPatch, tenant: Tenant) -> dict[str, list[dict[str, Any]]]:
+    """Serve paginated synthetic tenant data for monitoring endpoints via the mock response harness.
+
+    The payload is keyed by the last segment of the url path, i.e. /monitoring/v2/aps -> {"aps": [...], "count": ..., "total": ...}.
+    asyncio.sleep is mocked, so the rate limit pauses between batch chunks don't count toward the timings.
+    """
+    endpoints = {
+        "/monitoring/v2/aps": tenant.api_devices,
+        "/monitoring/v2/clients": tenant.api_clients,
+    }
+
+    async def request(session, method: str, url: str, params: dict[str, Any] = None, json: Any = None, **kwargs) -> Any:
+        url = URL(str(url))
+        records = endpoints.get(url.path, [])
+        offset, limit = int((params or {}).get("offset", 0)), int((params or {}).get("limit", 100))
+        page = records[offset:offset + limit]
+        payload = {url.name: page, "count": len(page), "total": len(records)}
+        return build_response(url=url.with_query(params or {}), method=method, payload=payload, headers=RL_HEADERS)
+
+    monkeypatch.setattr("aiohttp.client.ClientSession.request", request)
+    monkeypatch.setattr("asyncio.sleep", mock.AsyncMock(return_value=None))
+    return endpoints
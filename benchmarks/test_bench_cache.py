@@ -0,0 +1,53 @@
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from centralcli.cache.sqlite import Cache, DBAction
+from centralcli.models.sql import Device
+
+from ._tenant import Tenant
+
+
+@pytest.mark.parametrize("rows", [1_000, 10_000, 100_000])
+@pytest.mark.parametrize("action", [DBAction.UPSERT, DBAction.REPLACE])
+def test_bench_update_db(benchmark, new_cache: Callable[[], Cache], action: DBAction, rows: int):
+    data = Tenant(rows).devices
+
+    def setup():  # each round writes to an empty db, otherwise only the first UPSERT round measures inserts
+        return (new_cache(),), {}
+
+    def run(cache: Cache):
+        return asyncio.run(cache._update_db(Device, data, action=action))
+
+    assert benchmark.pedantic(run, setup=setup, rounds=1 if rows >= 100_000 else 3) is True
+
+
+@pytest.mark.parametrize("memo", ["cold", "warm"])
+@pytest.mark.parametrize("query", ["name", "serial", "mac", "fuzzy"])
+def test_bench_get_dev_identifier(benchmark, tenant_cache: Cache, tenant: Tenant, query: str, memo: str):
+    dev = tenant.devices[len(tenant.devices) // 2]
+    query_str = dev[query] if query != "fuzzy" else dev["name"].upper()[:-1]
+    setup = None if memo == "warm" else tenant_cache.resolver_cache.clear
+
+    match = benchmark.pedantic(
+        tenant_cache.get_dev_identifier, args=(query_str,), kwargs={"completion": query == "fuzzy", "retry": False}, setup=setup, rounds=50
+    )
+    assert match
+
+
+@pytest.mark.parametrize("incomplete", ["", "ap-0", "cx-000"])
+def test_bench_dev_completion(benchmark, tenant_cache: Cache, incomplete: str):
+    def run():
+        tenant_cache.resolver_cache.clear()
+        return list(tenant_cache.dev_completion(incomplete, args=["show", "devices"]))
+
+    assert benchmark(run)
+
+
+def test_bench_group_completion(benchmark, tenant_cache: Cache):
+    def run():
+        tenant_cache.resolver_cache.clear()
+        return list(tenant_cache.group_completion("group-", args=[]))
+
+    assert benchmark(run)
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from centralcli import api_clients
+from centralcli.client import BatchRequest, Session
+
+from ._tenant import Tenant
+
+api = api_clients.classic
+
+
+@pytest.mark.parametrize("limit", [100, 1000])
+def test_bench_api_call_pagination(benchmark, mock_api, tenant: Tenant, limit: int):
+    def run():
+        return asyncio.run(api.session.api_call("/monitoring/v2/aps", params={"offset": 0, "limit": limit, "calculate_total": True}))
+
+    resp = benchmark.pedantic(run, setup=Session.requests_clear, rounds=5)
+    assert len(resp.output) == tenant.size
+
+
+def test_bench_batch_request(benchmark, mock_api, tenant: Tenant):
+    limit = 100
+    reqs = [
+        BatchRequest(api.session.exec_api_call, "/monitoring/v2/clients", params={"offset": offset, "limit": limit})
+        for offset in range(0, len(tenant.api_clients), limit)
+    ]
+
+    def run():
+        return asyncio.run(api.session._batch_request(reqs))
+
+    batch_resp = benchmark.pedantic(run, setup=Session.requests_clear, rounds=5)
+    assert sum(len(r.output) for r in batch_resp) == len(tenant.api_clients)
@@ -0,0 +1,25 @@
+import pytest
+
+from centralcli import cleaner, config, render
+from centralcli.cache.sqlite import Cache
+
+from ._tenant import Tenant
+
+
+@pytest.mark.parametrize("tablefmt", ["rich", "json", "yaml", "csv", "tabulate"])
+def test_bench_render_output(benchmark, tenant: Tenant, tablefmt: str):
+    data = cleaner.get_devices(tenant.api_devices, output_format=tablefmt)
+    out = benchmark(render.output, data, tablefmt=tablefmt, title="Devices", config=config)
+    assert out
+
+
+@pytest.mark.parametrize("verbosity", [0, 1])
+def test_bench_cleaner_get_devices(benchmark, tenant: Tenant, verbosity: int):
+    data = benchmark(cleaner.get_devices, tenant.api_devices, verbosity=verbosity, output_format="rich")
+    assert len(data) == tenant.size
+
+
+@pytest.mark.parametrize("verbosity", [0, 1])
+def test_bench_cleaner_get_clients(benchmark, tenant: Tenant, tenant_cache: Cache, verbosity: int):
+    data = benchmark(cleaner.get_clients, tenant.api_clients, verbosity=verbosity, cache=tenant_cache, format="rich")
+    assert len(data) == len(tenant.api_clients)
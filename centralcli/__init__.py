@@ -237,6 +237,9 @@ if "--debug-limit" in sys.argv:
     if len(sys.argv) - 1 >= _idx and sys.argv[_idx].isdigit():
         config.dev.limit = int(sys.argv[_idx])
         _ = sys.argv.pop(_idx)
+if "--no-cache" in sys.argv:  # bypass the response cache (config: response_cache)
+    _ = sys.argv.pop(sys.argv.index("--no-cache"))
+    config.no_cache = True
 if "--sanitize" in sys.argv:
     _ = sys.argv.pop(sys.argv.index("--sanitize"))
     config.dev.sanitize = True
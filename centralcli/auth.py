@@ -0,0 +1,127 @@
+"""Per workspace cache of API auth objects with single-flight token refresh.
+
+The auth object (pycentral ArubaCentralBase for classic, NewCentralBase for GreenLake/new central) is built once per
+workspace and reused by every request, rather than being rebuilt on each access.
+
+Token refresh is serialized per workspace.  When many in-flight requests hit a 401 at once (i.e. during a batch request),
+one refresh is performed and the remaining requests resume with the new token.  The refresh itself (token API call and token
+store I/O) runs in a worker thread so it does not block the event loop.  Tokens with a known expiry are refreshed proactively
+when they are within REFRESH_MARGIN seconds of expiring.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from . import log
+
+REFRESH_MARGIN = 300  # seconds before expiry at which a token is refreshed proactively
+
+
+class AuthManager:
+    _managers: ClassVar[dict[tuple[str, bool], AuthManager]] = {}
+
+    def __init__(self, build: Callable[[], Any], expires: Callable[[Any], float | None] = None, *, refresh_margin: int = REFRESH_MARGIN) -> None:
+        """Cache of the auth object for a single workspace.
+
+        Args:
+            build (Callable[[], Any]): Called (once) to build the auth object.
+            expires (Callable[[Any], float | None], optional): Called with the auth object, returns the epoch timestamp the current
+                access token expires or None if not known.  Defaults to None (tokens are only refreshed on failure).
+            refresh_margin (int, optional): Refresh tokens that will expire within this many seconds. Defaults to REFRESH_MARGIN.
+        """
+        self._build = build
+        self._expires = expires
+        self.refresh_margin = refresh_margin
+        self._auth: Any = None
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self.refresh_count = 0
+        self._failed_token: str | None = None  # proactive refresh is not retried for a token that already failed to refresh
+
+    @classmethod
+    def get(cls, workspace: str, build: Callable[[], Any], expires: Callable[[Any], float | None] = None, *, cnx: bool = False) -> AuthManager:
+        """Get (or create) the AuthManager for a workspace.
+
+        Args:
+            workspace (str): The workspace name.
+            build (Callable[[], Any]): Called to build the auth object if this is the first request for the workspace.
+            expires (Callable[[Any], float | None], optional): See :class:`AuthManager`. Defaults to None.
+            cnx (bool, optional): Classic and GreenLake/new central auth are managed separately. Defaults to False (classic).
+
+        Returns:
+            AuthManager: The AuthManager for the workspace.
+        """
+        key = (workspace, bool(cnx))
+        if key not in cls._managers:
+            cls._managers[key] = cls(build, expires)
+        return cls._managers[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._managers = {}
+
+    @property
+    def auth(self) -> Any:
+        if self._auth is None:
+            self._auth = self._build()
+        return self._auth
+
+    @property
+    def access_token(self) -> str | None:
+        return self.auth.central_info.get("token", {}).get("access_token")
+
+    @property
+    def expires(self) -> float | None:
+        return None if self._expires is None else self._expires(self.auth)
+
+    @property
+    def expiring(self) -> bool:
+        """True if the access token expires (or has expired) within refresh_margin seconds."""
+        expires = self.expires
+        return expires is not None and time.time() > expires - self.refresh_margin
+
+    def _get_lock(self) -> asyncio.Lock:
+        # asyncio.Lock is bound to the loop it's first used in, each asyncio.run uses a new loop.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
+
+    async def refresh(self, refresh: Callable[[], bool], stale_token: str | None = None) -> bool:
+        """Refresh tokens, with single-flight semantics.
+
+        Concurrent callers wait for the refresh in progress.  Once it completes, callers whose stale_token no longer matches the
+        current access token return without refreshing again.
+
+        Args:
+            refresh (Callable[[], bool]): The (blocking) refresh function, ran in a worker thread.
+            stale_token (str, optional): The access token the caller used that was found to be expired/invalid.
+                Defaults to None (always refresh).
+
+        Returns:
+            bool: Bool indicating success/failure of the refresh.
+        """
+        async with self._get_lock():
+            if stale_token is not None and self.access_token != stale_token:
+                log.debug("Token refresh skipped, token was refreshed by another request.")
+                return True
+
+            token = self.access_token
+            success = await asyncio.to_thread(refresh)
+            self.refresh_count += 1
+            self._failed_token = None if success else token
+            return bool(success)
+
+    async def ensure_fresh(self, refresh: Callable[[], bool]) -> None:
+        """Proactively refresh the access token if it's about to expire.
+
+        Args:
+            refresh (Callable[[], bool]): The (blocking) refresh function, ran in a worker thread.
+        """
+        token = self.access_token
+        if self.expiring and token != self._failed_token:
+            log.info(f"Access token expires in {max(int(self.expires - time.time()), 0)}s, refreshing.")
+            await self.refresh(refresh, stale_token=token)
@@ -1,14 +1,22 @@
 import csv
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
 from centralcli import api_clients, common, config, render, utils
 
+from .client import BatchRequest
 from .response import Response
 
 api = api_clients.classic
 
 
+def push_ok(resp: Response) -> bool:
+    """True if the caas API call was successful, and the global result (all commands) was successful."""
+    output = utils.unlistify(resp.output) if resp else None
+    return isinstance(output, dict) and output.get("_global_result", {}).get("status") == 0
+
+
 class BuildCLI:
     """Build equivalent cli commands for caas API from bulk-edit.csv import file"""
     def __init__(self, data: dict = None) -> None:
@@ -16,6 +24,7 @@ class BuildCLI:
         self.dev_info = None
         self.data = data
         self.cmds = []
+        self.dev_cmds: dict[str, list[str]] = {}  # cmds by device (mac)
 
     @staticmethod
     def get_bulkedit_data(filename: Path):  # pragma: no cover
@@ -36,7 +45,8 @@ class BuildCLI:
                     # print(f"{k}: {v}")
                     if k == "mac_address":
                         _mac = v
-                        cli_data[v] = {}
+                        dev_data = cli_data.setdefault(v, {"_common": {}, "vlans": []})  # each device gets its own common/vlans (rows for the same device are combined)
+                        _common, _vlans = dev_data["_common"], dev_data["vlans"]
                     elif k in [
                         "group",
                         "model",
@@ -82,12 +92,13 @@ class BuildCLI:
         else:
             self.data = self.get_bulkedit_data(file)
 
+        resp = api.session.request(api.monitoring.get_devices, "gateways")
+        gateways = resp.output
         for dev in self.data:
             common_data: dict[str, Any] = self.data[dev]["_common"]
             vlans = self.data[dev]["vlans"]
+            cmds = self.dev_cmds[dev] = []
             _pretty_name = f"[bright_green]{common_data.get('hostname', dev)}[/]"
-            resp = api.session.request(api.monitoring.get_devices, "gateways")
-            gateways = resp.output
             self.dev_info = [_dev for _dev in gateways if _dev.get('mac', '').lower() == dev.lower()]
 
             # if dev already exists move to group defined in bulk-edit
@@ -101,23 +112,23 @@ class BuildCLI:
 
             render.console.print(f"Building cmds for {_pretty_name}")
             if common_data.get("hostname"):
-                self.cmds += [f"hostname {common_data['hostname']}", "!"]
+                cmds += [f"hostname {common_data['hostname']}", "!"]
 
             for v in vlans:
-                self.cmds += [f"vlan {v['vlan_id']}", "!"]
+                cmds += [f"vlan {v['vlan_id']}", "!"]
                 if v.get("vlan_ip"):
                     if not v.get("vlan_subnet"):
                         render.econsole.print(f":warning:  [red1]Validation Error[/] No subnet mask for VLAN [cyan]{v['vlan_id']}[/]")
                         # TODO handle the error
-                    self.cmds += [f"interface vlan {v['vlan_id']}", f"ip address {v['vlan_ip']} {v['vlan_subnet']}"]
+                    cmds += [f"interface vlan {v['vlan_id']}", f"ip address {v['vlan_ip']} {v['vlan_subnet']}"]
                     # TODO should VLAN description also be vlan name - check what bulk edit does
                     if v.get("vlan_interface_description"):
-                        self.cmds.append(f"description {v['vlan_interface_description']}")
+                        cmds.append(f"description {v['vlan_interface_description']}")
                     if v.get("vlan_helper_addr"):
-                        self.cmds.append(f"ip helper-address {v['vlan_helper_addr']}")
+                        cmds.append(f"ip helper-address {v['vlan_helper_addr']}")
                     if v.get("vlan_interface_operstate"):
-                        self.cmds.append(f"operstate {v['vlan_interface_operstate']}")
-                    self.cmds.append("!")
+                        cmds.append(f"operstate {v['vlan_interface_operstate']}")
+                    cmds.append("!")
 
                 if v.get("pppoe_username"):
                     print("Warning PPPoE not supported by this tool yet")
@@ -127,47 +138,48 @@ class BuildCLI:
                         _line = f"interface gigabitethernet {v['access_port']}"
                     else:
                         _line = f"interface {v['access_port']}"
-                    self.cmds += [_line, f"switchport access vlan {v['vlan_id']}", "!"]
+                    cmds += [_line, f"switchport access vlan {v['vlan_id']}", "!"]
 
                 if v.get("dhcp_pool_name"):
-                    self.cmds.append(f"ip dhcp pool {v['dhcp_pool_name']}")
+                    cmds.append(f"ip dhcp pool {v['dhcp_pool_name']}")
                     if v.get("dhcp_def_gws"):
                         for gw in v["dhcp_def_gws"]:
-                            self.cmds.append(f"default-router {gw}")
+                            cmds.append(f"default-router {gw}")
                     if v.get("dns_servers"):
-                        self.cmds.append(f"dns-server {' '.join(v['dns_servers'])}")
+                        cmds.append(f"dns-server {' '.join(v['dns_servers'])}")
                     if v.get("domain_name"):
-                        self.cmds.append(f"domain-name {v['domain_name']}")
+                        cmds.append(f"domain-name {v['domain_name']}")
                     if v.get("dhcp_network"):
                         if v.get("dhcp_mask"):
-                            self.cmds.append(f"network {v['dhcp_network']} {v['dhcp_mask']}")
+                            cmds.append(f"network {v['dhcp_network']} {v['dhcp_mask']}")
                         elif v.get("dhcp_network_prefix"):
-                            self.cmds.append(f"network {v['dhcp_network']} /{v['dhcp_network_prefix']}")
-                    self.cmds.append("!")
+                            cmds.append(f"network {v['dhcp_network']} /{v['dhcp_network_prefix']}")
+                    cmds.append("!")
 
                 if v.get("dhcp_excludes"):
                     # dhcp exclude lines are fully formatted as data is collected
                     for _line in v["dhcp_excludes"]:
-                        self.cmds.append(_line)
+                        cmds.append(_line)
 
                 if v.get("vrrp_id"):
                     if v.get("vrrp_ip"):
-                        self.cmds += [f"vrrp {v['vrrp_id']}", f"ip address {v['vrrp_ip']}", f"vlan {v['vlan_id']}"]
+                        cmds += [f"vrrp {v['vrrp_id']}", f"ip address {v['vrrp_ip']}", f"vlan {v['vlan_id']}"]
                         if v.get("vrrp_priority"):
-                            self.cmds.append(f"priority {v['vrrp_priority']}")
-                        self.cmds += ["no shutdown", "!"]
+                            cmds.append(f"priority {v['vrrp_priority']}")
+                        cmds += ["no shutdown", "!"]
                     else:
                         print(f"Validation Error VRRP ID {v['vrrp_id']} VLAN {v['vlan_id']} No VRRP IP provided... Skipped")
 
                 if v.get("bg_peer_ip"):
                     # _as = self.session.get_bgp_as()
-                    # self.cmds.append(f"router bgp neighbor {v['bg_peer_ip']} as {_as}")
+                    # cmds.append(f"router bgp neighbor {v['bg_peer_ip']} as {_as}")
                     render.econsole.print(":warning:  bgp peer ip Not Supported by Script yet")
 
                 if v.get("zs_site_to_site_map_name") or v.get("source_fqdn"):
                     render.econsole.print(":warning:  Zscaler Configuration Not Supported by Script Yet")
 
-            return self.cmds
+        self.cmds = [cmd for cmds in self.dev_cmds.values() for cmd in cmds]
+        return self.cmds
 
     async def show_config(self, group: str, dev_mac: str = None) -> Response:
         show_url = "/caasapi/v1/showcommand"
@@ -213,3 +225,47 @@ class CaasAPI(BuildCLI):
             json_data = {"cli_cmds": cli_cmds or []}
 
             return await api.session.post(url, params=params, json_data=json_data)
+
+    async def push_commands(self, cmds_by_dev: dict[str, list[str]], on_result: Callable[[str, Response], None] = None) -> dict[str, Response]:
+        """Send commands to multiple devices/groups concurrently (via the rate limited batch scheduler).
+
+        Args:
+            cmds_by_dev (dict[str, list[str]]): cli commands keyed by group/device (group_name/mac or group_name).
+            on_result (Callable[[str, Response], None], optional): Called with the group/device and Response as each push completes. Defaults to None.
+
+        Returns:
+            dict[str, Response]: Responses keyed by group/device.
+        """
+        async def _send(group_dev: str, cli_cmds: list[str]) -> Response:
+            resp = await self.send_commands(group_dev, cli_cmds)
+            if on_result:
+                on_result(group_dev, resp)
+            return resp
+
+        reqs = [BatchRequest(_send, group_dev, cli_cmds) for group_dev, cli_cmds in cmds_by_dev.items()]
+        resps = await api.session._batch_request(reqs, continue_on_fail=True)
+        return dict(zip(cmds_by_dev, resps))
+
+    @staticmethod
+    def write_retry_file(file: Path, macs: Iterable[str], outfile: Path = None) -> Path:
+        """Write the rows from a bulk-edit file for the provided devices to a new bulk-edit file, used to retry failed pushes.
+
+        Args:
+            file (Path): The bulk-edit file.
+            macs (Iterable[str]): The mac addresses of the devices to include.
+            outfile (Path, optional): The file to write. Defaults to None (<file stem>_retry<file suffix> in the same directory).
+
+        Returns:
+            Path: The retry file.
+        """
+        macs = {mac.lower() for mac in macs}
+        outfile = outfile or file.with_name(f"{file.stem}_retry{file.suffix}")
+        with file.open() as csv_file:
+            rows = [r for r in csv.reader([line for line in csv_file.readlines() if not line.startswith('#')])]
+
+        header = [k.strip().lower().replace(' ', '_') for k in rows[0]]
+        idx = header.index("mac_address")
+        with outfile.open("w", newline="") as csv_file:
+            csv.writer(csv_file).writerows([rows[0], *[r for r in rows[1:] if len(r) > idx and r[idx].lower() in macs]])
+
+        return outfile
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Sequence
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Literal
+
+from centralcli import log
+
+if find_spec("numpy"):
+    import numpy as np
+    NUMPY = True
+else:  # pragma: no cover  numpy is a dependency of uniplot so this should not occur
+    NUMPY = False
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+JoinType = Literal["left", "right", "inner", "outer"]
+
+
+def _as_array(values: Sequence[Any]) -> NDArray:
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+def _key_array(values: NDArray) -> NDArray:
+    """Fixed width str array used for sort/search on join keys.  None is mapped to an empty str."""
+    return np.where(values == None, "", values).astype(str)  # noqa: E711 (elementwise compare)
+
+
+class ColumnarTable:
+    """Column oriented, read-only snapshot of a cache table (or of a list of dicts).
+
+    Each column is a numpy object array, so filters are evaluated as vectorized masks rather than
+    row-by-row Python comparisons, and joins on a key column (serial) use sort/searchsorted.
+
+    Rows built from dicts that lack some of the keys are tracked in ``present`` (a boolean mask per column, for columns
+    some rows lack), so ``to_dicts`` returns the same keys the rows had.  Missing values are None in the column.
+
+    Args:
+        name (str): Name of the table, used for logging.
+        columns (dict[str, NDArray]): Mapping of column name to array of values.  All arrays must be the same length.
+        present (dict[str, NDArray], optional): Mapping of column name to boolean mask of the rows that have the key. Defaults to None (all rows have all keys).
+    """
+    def __init__(self, name: str, columns: dict[str, NDArray], present: dict[str, NDArray] = None) -> None:
+        self.name = name
+        self.columns = columns
+        self.present = present or {}
+
+    @classmethod
+    def from_rows(cls, name: str, keys: Sequence[str], rows: Sequence[Sequence[Any]]) -> ColumnarTable:
+        start = time.perf_counter()
+        if rows:
+            columns = {key: _as_array(col) for key, col in zip(keys, zip(*rows))}
+        else:
+            columns = {key: _as_array([]) for key in keys}
+        log.debug(f"Columnar snapshot of {len(rows)} {name} rows built in {round(time.perf_counter() - start, 3)}s")
+        return cls(name, columns)
+
+    @classmethod
+    def from_dicts(cls, name: str, data: Sequence[dict[str, Any]]) -> ColumnarTable:
+        keys = list(dict.fromkeys(k for d in data for k in d))
+        out = cls.from_rows(name, keys, [tuple(d.get(k) for k in keys) for d in data])
+        for key in keys:
+            present = np.fromiter((key in d for d in data), dtype=bool, count=len(data))
+            if not present.all():
+                out.present[key] = present
+        return out
+
+    def __len__(self) -> int:
+        return 0 if not self.columns else len(next(iter(self.columns.values())))
+
+    def __getitem__(self, key: str) -> NDArray:
+        return self.columns[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def __repr__(self) -> str:  # pragma: no cover  used for debug
+        return f"<{type(self).__name__} {self.name} ({len(self)} rows, {len(self.columns)} columns)>"
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self.columns.keys())
+
+    def has(self, key: str) -> NDArray:
+        """Boolean mask of the rows that have key."""
+        if key in self.present:
+            return self.present[key]
+        return np.full(len(self), key in self.columns, dtype=bool)
+
+    def get(self, key: str) -> NDArray:
+        """Return column by name, or an array of None if the column does not exist."""
+        if key in self.columns:
+            return self.columns[key]
+        return _as_array([None] * len(self))
+
+    def mask(self, **filters: Any) -> NDArray:
+        """Build a boolean mask from column filters.
+
+        Each keyword is a column name, optionally prefixed with ``not_`` to negate.  A scalar value is an equality
+        check, a list/tuple/set is a membership check.  Filters with a value of None are ignored.
+
+        i.e. ``mask(type=["cx", "sw"], site="HQ", not_group="lab")``
+        """
+        out = np.ones(len(self), dtype=bool)
+        for key, value in filters.items():
+            if value is None:
+                continue
+            negate = key.startswith("not_") and key not in self.columns
+            col = self.get(key if not negate else key.removeprefix("not_"))
+            if isinstance(value, (list, tuple, set, frozenset)):  # np.isin sorts, which fails on object arrays with None
+                this = np.zeros(len(self), dtype=bool)
+                for v in value:
+                    this |= col == v
+            else:
+                this = col == value
+            out &= ~this if negate else this
+        return out
+
+    def isin(self, key: str, values: NDArray | Sequence[Any]) -> NDArray:
+        """Boolean mask of rows where column key is in values.  Intended for large value sets i.e. all serials of another table."""
+        values = np.asarray(values, dtype=object)
+        return np.isin(_key_array(self.get(key)), _key_array(values))
+
+    def lower(self, key: str) -> NDArray:
+        """Return column values as a lower case str array (None -> "")"""
+        return np.char.lower(_key_array(self.get(key)))
+
+    def take(self, idx: NDArray) -> ColumnarTable:
+        """Return a new table with rows selected by a boolean mask or integer index array."""
+        return ColumnarTable(self.name, {k: v[idx] for k, v in self.columns.items()}, present={k: v[idx] for k, v in self.present.items()})
+
+    def where(self, **filters: Any) -> ColumnarTable:
+        """Filter rows, see mask for filter syntax."""
+        return self.take(self.mask(**filters))
+
+    def join(self, other: ColumnarTable, on: str = "serial", how: JoinType = "left", keep: Iterable[str] = ()) -> ColumnarTable:
+        """Join with another table on a key column.
+
+        Matches dict merge semantics of ``{**self_row, **other_row}``, for any column present in both tables the value from
+        other is used for rows that matched.
+
+        Args:
+            other (ColumnarTable): The table to join with.
+            on (str, optional): The key column, expected to be unique in other. Defaults to "serial".
+            how (Literal["left", "right", "inner", "outer"], optional): The type of join. Defaults to "left".
+                right: All rows from other, with values from self for rows that matched.
+            keep (Iterable[str], optional): Columns present in both where the value from self is retained (unless it is None). Defaults to ().
+
+        Returns:
+            ColumnarTable: The joined table.
+        """
+        start = time.perf_counter()
+        left_keys, right_keys = _key_array(self.get(on)), _key_array(other.get(on))
+        idx = np.full(len(self), -1, dtype=np.intp)
+        if len(other) and len(self):
+            order = np.argsort(right_keys, kind="stable")
+            sorted_keys = right_keys[order]
+            pos = np.clip(np.searchsorted(sorted_keys, left_keys), 0, len(sorted_keys) - 1)
+            found = sorted_keys[pos] == left_keys
+            idx[found] = order[pos[found]]
+
+        matched = idx >= 0
+        if how in ["inner", "right"]:
+            left_rows, idx, matched = np.flatnonzero(matched), idx[matched], matched[matched]
+        else:
+            left_rows = np.arange(len(self))
+
+        extra_rows = np.empty(0, dtype=np.intp)
+        if how in ["outer", "right"]:
+            used = np.zeros(len(other), dtype=bool)
+            used[idx[matched]] = True
+            extra_rows = np.flatnonzero(~used)
+
+        columns: dict[str, NDArray] = {}
+        presents: dict[str, NDArray] = {}
+        for key in dict.fromkeys([*self.keys, *other.keys]):
+            col, has = self.get(key)[left_rows], self.has(key)[left_rows]
+            if key in other:
+                col, has = col.copy(), has.copy()
+                other_col, other_has = other[key][idx[matched]], other.has(key)[idx[matched]]
+                this_col = col[matched]
+                if key in keep:
+                    other_col = np.where(this_col == None, other_col, this_col)  # noqa: E711 (elementwise compare)
+                col[matched] = np.where(other_has, other_col, this_col)  # rows in other that lack the key keep the value from self
+                has[matched] |= other_has
+                extra, extra_has = other[key][extra_rows], other.has(key)[extra_rows]
+            else:
+                extra, extra_has = _as_array([None] * len(extra_rows)), np.zeros(len(extra_rows), dtype=bool)
+            columns[key] = np.concatenate([col, extra]) if len(extra_rows) else col
+            has = np.concatenate([has, extra_has]) if len(extra_rows) else has
+            if not has.all():
+                presents[key] = has
+
+        out = ColumnarTable(f"{self.name}+{other.name}", columns, present=presents)
+        log.debug(f"Columnar {how} join {self.name} ({len(self)}) with {other.name} ({len(other)}) on {on} -> {len(out)} rows in {round(time.perf_counter() - start, 3)}s")
+        return out
+
+    def coalesce(self, key: str, *fallbacks: str) -> NDArray:
+        """Return column values with None replaced by the value from the first fallback column that is not None."""
+        out = self.get(key).copy()
+        for fallback in fallbacks:
+            missing = out == None  # noqa: E711 (elementwise compare)
+            if not missing.any():
+                break
+            out[missing] = self.get(fallback)[missing]
+        return out
+
+    def to_dicts(self, keys: Iterable[str] = None) -> list[dict[str, Any]]:
+        """Rows as dicts, keys a row did not have are omitted (rather than set to None)."""
+        keys = list(keys or self.keys)
+        if not len(self):
+            return []
+        out = [dict(zip(keys, row)) for row in zip(*(self.get(k).tolist() for k in keys))]
+        for key in [k for k in keys if k in self.present or k not in self.columns]:
+            for row, has in zip(out, self.has(key).tolist()):
+                if not has:
+                    del row[key]
+        return out
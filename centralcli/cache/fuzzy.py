@@ -0,0 +1,128 @@
+"""Fuzzy match index used for "Did you mean" suggestions on cache misses.
+
+The choices (i.e. device names) are normalized once when the index is built, along with positions by filter column
+(i.e. type, group) and a trigram index.  Lookups then score the pre-processed choices directly.  With rapidfuzz the
+scoring is done in C over the whole list (with an early exit for choices below the score cutoff).  The pure Python
+fallback (fuzzywuzzy) only scores the candidates that share trigrams with the query.
+"""
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from collections.abc import Hashable, Sequence
+from importlib.util import find_spec
+from typing import Any
+
+from centralcli import log
+
+if find_spec("rapidfuzz"):
+    from rapidfuzz import fuzz
+    from rapidfuzz import process as rf_process
+    RAPIDFUZZ = True
+else:  # pragma: no cover
+    RAPIDFUZZ = False
+
+if find_spec("fuzzywuzzy"):
+    from fuzzywuzzy import process
+    FUZZYWUZZY = True
+else:  # pragma: no cover
+    FUZZYWUZZY = False
+
+FUZZ = RAPIDFUZZ or FUZZYWUZZY
+SCORE_CUTOFF = 70
+MAX_CANDIDATES = 500  # pure python fallback, max number of candidates (by # of shared trigrams) that are scored
+
+_non_alnum = re.compile(r"(?ui)\W")
+
+
+def normalize(value: str) -> str:
+    """Same normalization as fuzzywuzzy full_process / rapidfuzz default_process (lower case, non alnum replaced with space)."""
+    return _non_alnum.sub(" ", str(value)).lower().strip()
+
+
+def _trigrams(value: str) -> set[str]:
+    value = f"  {value} "
+    return {value[idx:idx + 3] for idx in range(len(value) - 2)}
+
+
+class FuzzyIndex:
+    def __init__(self, choices: Sequence[str], filters: dict[str, Sequence[Hashable]] = None) -> None:
+        """Index of choices for fuzzy lookups.
+
+        Args:
+            choices (Sequence[str]): The values to match against (i.e. the name of every device).
+            filters (dict[str, Sequence[Hashable]], optional): Column values for each choice, used to limit
+                lookups to a subset of the choices (i.e. {"type": [...]}). Defaults to None.
+        """
+        start = time.perf_counter()
+        self.choices = [str(c) for c in choices]
+        self.processed = [normalize(c) for c in self.choices]
+        self.positions: dict[str, dict[Hashable, list[int]]] = {}
+        for col, values in (filters or {}).items():
+            for pos, value in enumerate(values):
+                self.positions.setdefault(col, {}).setdefault(value, []).append(pos)
+        self._trigram_index: dict[str, list[int]] | None = None
+        log.debug(f"Fuzzy index of {len(self.choices)} choices built in {round(time.perf_counter() - start, 3)}")
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    @property
+    def trigram_index(self) -> dict[str, list[int]]:
+        if self._trigram_index is None:
+            self._trigram_index = {}
+            for pos, value in enumerate(self.processed):
+                for gram in _trigrams(value):
+                    self._trigram_index.setdefault(gram, []).append(pos)
+        return self._trigram_index
+
+    def _allowed(self, **filters: Any) -> list[int] | None:
+        """Positions of choices matching all filters (value may be a list of allowed values).  None if there are no filters."""
+        allowed: set[int] | None = None
+        for col, value in filters.items():
+            if value is None:
+                continue
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            _positions = {pos for v in values for pos in self.positions.get(col, {}).get(v, [])}
+            allowed = _positions if allowed is None else allowed & _positions
+        return None if allowed is None else sorted(allowed)
+
+    def _candidates(self, query: str, allowed: list[int] | None) -> list[int]:
+        counts = Counter(pos for gram in _trigrams(query) for pos in self.trigram_index.get(gram, []))
+        if allowed is not None:
+            allowed_set = set(allowed)
+            counts = Counter({pos: cnt for pos, cnt in counts.items() if pos in allowed_set})
+        return [pos for pos, _ in counts.most_common(MAX_CANDIDATES)]
+
+    def extract(self, query: str, limit: int = 5, score_cutoff: int = SCORE_CUTOFF, **filters: Any) -> list[tuple[str, float]]:
+        """Get the best matches for query.
+
+        Args:
+            query (str): The string to match.
+            limit (int, optional): Max number of matches to return (top-k). Defaults to 5.
+            score_cutoff (int, optional): Min score (0-100) for a choice to be considered a match. Defaults to SCORE_CUTOFF.
+            **filters (Any): Limit matches to choices with the provided value (or one of the values) for filter columns.
+
+        Returns:
+            list[tuple[str, float]]: (choice, score) for the best matches, highest score first.
+        """
+        query = normalize(query)
+        allowed = self._allowed(**filters)
+        if not query or not FUZZ or allowed == []:
+            return []
+
+        if RAPIDFUZZ:
+            choices = self.processed if allowed is None else {pos: self.processed[pos] for pos in allowed}
+            res = rf_process.extract(query, choices, scorer=fuzz.WRatio, processor=None, limit=limit, score_cutoff=score_cutoff)
+            matches = [(self.choices[key], score) for _, score, key in res]
+        else:
+            candidates = self._candidates(query, allowed)
+            res = process.extractBests(query, {pos: self.processed[pos] for pos in candidates}, processor=None, limit=limit, score_cutoff=score_cutoff)
+            matches = [(self.choices[key], score) for _, score, key in res]
+
+        return matches
+
+    def extract_one(self, query: str, score_cutoff: int = SCORE_CUTOFF, **filters: Any) -> tuple[str, float] | None:
+        matches = self.extract(query, limit=1, score_cutoff=score_cutoff, **filters)
+        return None if not matches else matches[0]
@@ -29,7 +29,8 @@ from .tinydb import Cache
 from .sqlite import Cache as NewCache
 
 cache = Cache(config)
-engine = NewCache(config).engine
+new_cache = NewCache(config)
+engine = new_cache.engine
 api = api_clients.classic
 
 
@@ -45,6 +46,7 @@ def populate_db(name: str, items: list[CacheTable], explain: str = None):
         session.commit()
         end = time.perf_counter() - start
         render.econsole.print(f"  :heavy_plus_sign:  Migrated {len(items)} records found in [cyan]{name}[/]{_explain} cache in {round(end, 2)}")
+    new_cache.recount(type(items[0]))  # written outside of _update_db, so table_meta has to be re-seeded
 
 
 def populate_dev_db():
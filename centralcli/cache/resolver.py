@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import inspect
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, ParamSpec, TypeVar
+
+from centralcli import log
+
+if TYPE_CHECKING:
+    from .sqlite import Cache
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class ResolverCache:
+    """Bounded LRU memo for the Cache.get_*_identifier resolvers.
+
+    Entries are stamped with the Cache generation at the time they were stored.  Cache._update_db bumps
+    the generation on every write, so any entry stored before the write is treated as a miss and evicted.
+
+    Args:
+        maxsize (int, optional): Max number of resolved queries retained. Defaults to 256.
+    """
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[int, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:  # pragma: no cover  used for debug
+        return f"<{type(self).__name__} {self.stats}>"
+
+    @property
+    def stats(self) -> str:
+        return f"hits: {self.hits}, misses: {self.misses}, size: {len(self)}/{self.maxsize}"
+
+    def get(self, key: Hashable, generation: int) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] != generation:
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return _MISSING
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, generation: int, value: Any) -> None:
+        self._data[key] = (generation, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = 0
+
+
+def _normalize(name: str, value: Any) -> Hashable:
+    if name == "query_str" and isinstance(value, (list, tuple)):
+        return " ".join(value).strip()
+    if isinstance(value, str):
+        return value.strip() if name == "query_str" else value
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value, key=str))
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+def resolver_cache(func: Callable[P, T]) -> Callable[P, T]:
+    """Memoize a Cache identifier resolver in Cache.resolver_cache
+
+    The key is the resolver name plus the normalized query and filter arguments (after defaults are applied).
+    Failed lookups (None or empty results) are not stored, so the retry / cache refresh logic in the resolver
+    still runs on a subsequent miss.
+    """
+    sig = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(self: Cache, *args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            bound = sig.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__name__, *((k, _normalize(k, v)) for k, v in bound.arguments.items() if k != "self"))
+            hash(key)
+            query = bound.arguments.get("query_str")
+        except TypeError:  # unhashable filter, bypass memo
+            return func(self, *args, **kwargs)
+
+        memo = self.resolver_cache
+        result = memo.get(key, self.generation)
+        if result is not _MISSING:
+            log.debug(f"{func.__name__} resolver cache hit for {query!r} ({memo.stats})")
+            return result if not isinstance(result, list) else [*result]
+
+        result = func(self, *args, **kwargs)
+        log.debug(f"{func.__name__} resolver cache miss for {query!r} ({memo.stats})")
+        if result is not None and not inspect.isgenerator(result) and not (isinstance(result, list) and not result):
+            memo.set(key, self.generation, result if not isinstance(result, list) else [*result])
+
+        return result
+
+    return wrapper
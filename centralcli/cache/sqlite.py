@@ -5,7 +5,6 @@ from collections.abc import Generator, Iterable, Iterator, Sequence
 from copy import deepcopy
 from enum import Enum
 from functools import cached_property, wraps
-from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, overload
 
@@ -14,14 +13,13 @@ import typer
 from pydantic import ValidationError
 from rich.console import Console
 from rich.markup import escape
-from sqlalchemy import Engine, MetaData, String, and_, cast, create_engine, delete, func, insert, or_, select, update
+from sqlalchemy import Engine, Row, String, and_, cast, create_engine, delete, func, insert, or_, select, update
 from sqlalchemy.orm import Session
 
 from centralcli import api_clients, config, constants, log, render, utils
 from centralcli.client import BatchRequest
 from centralcli.client import Session as ClientSession
 from centralcli.cnx.models import cache as cnx_models
-from centralcli.cnx.models.cache import get_inventory_with_sub_data
 from centralcli.environment import env
 from centralcli.models import cache as models
 from centralcli.models.sql import (
@@ -35,6 +33,7 @@ from centralcli.models.sql import (
     Device,
     Event,
     FloorPlanAP,
+    FloorPlanFloor,
     GLPService,
     Group,
     Guest,
@@ -45,6 +44,7 @@ from centralcli.models.sql import (
     Site,
     Subscription,
     SubscriptionName,
+    TableMeta,
     Template,
     WebHookData,
 )
@@ -66,6 +66,7 @@ from centralcli.objects.cache import (
     CacheMpskNetwork,
     CacheObject,
     CachePortal,
+    CacheRecord,
     CacheResponses,
     CacheService,
     CacheSite,
@@ -76,7 +77,10 @@ from centralcli.objects.cache import (
 )
 from centralcli.response import BatchResponse, CombinedResponse, Response
 from centralcli.strings import emoji
-from centralcli.typedefs import typed_lru_cache
+
+from .columnar import NUMPY, ColumnarTable
+from .fuzzy import FUZZ, FuzzyIndex
+from .resolver import ResolverCache, resolver_cache
 
 if TYPE_CHECKING:
 
@@ -84,13 +88,6 @@ if TYPE_CHECKING:
     from centralcli.typedefs import MPSKStatus, SiteData
 
 
-if find_spec("fuzzywuzzy"):
-    from fuzzywuzzy import process
-    FUZZ = True
-else:
-    FUZZ = False
-
-
 class DBAction(str, Enum):
     INSERT = "INSERT"
     UPDATE = "UPDATE"
@@ -139,19 +136,25 @@ def _handle_multi_word_incomplete(incomplete: str) -> tuple[str, str]:
 
 
 class TableInfo:
-    def __init__(self, name: str, table: CacheTable, records: int, engine: Engine):
+    def __init__(self, name: str, table: CacheTable, records: int, engine: Engine, updated: float | None = None):
         self.name = name
         self.records = records
+        self.updated = updated
         self._table = table
         self._engine = engine
 
+    @property
+    def fields(self) -> list[str]:
+        return list(self._table.columns.keys())
+
     def all(self):
         with self._engine.connect() as connection:
             start = time.perf_counter()
             result = connection.execute(select(self._table))
-            end = time.perf_counter() - start
-            log.debug(f"All ({self.records}) {self.name} fetched via TableInfo.all()  in {round(end - start, 3)}")
-            return [dict(row) for row in result.mappings()]
+            keys = tuple(result.keys())
+            out = [dict(zip(keys, row)) for row in result]
+            log.debug(f"All ({self.records}) {self.name} fetched via TableInfo.all()  in {round(time.perf_counter() - start, 3)}")
+            return out
 
     def __len__(self):
         return self.records
@@ -176,6 +179,10 @@ class Cache:
         self.config = config
         self.engine = self.create_engine()
         self.responses = CacheResponses()
+        self.resolver_cache = ResolverCache()
+        self.generation: int = 0  # bumped on every cache write, invalidates resolver_cache entries
+        self._snapshots: dict[str, tuple[int, ColumnarTable]] = {}
+        self._fuzzy_indexes: dict[tuple[str, str], tuple[int, FuzzyIndex]] = {}
         if config.valid and config.cache_dir.exists():
             self._tables: list[CacheTable] = [Device, InventoryDevice, Site, Group, Template, Label, Client, SubscriptionName]
             if config.glp.ok:
@@ -189,7 +196,7 @@ class Cache:
         yield from self.all_tables
 
     def __len__(self) -> int:
-        return len(list(self.all_tables))
+        return len(self._table_names)
 
     def __repr__(self) -> str:  # pragma: no cover  used for debug
         return f"<{self.__module__}.{type(self).__name__} ({self.config.workspace}) object at {hex(id(self))}>"
@@ -236,22 +243,103 @@ class Cache:
         Base.metadata.create_all(engine)
         return engine
 
+    def rows(self, table: CacheTable, *columns: str, where: Any = None, yield_per: int = None) -> Generator[Row, None, None]:
+        """Core level read of a cache table, returns plain row tuples (no ORM instances / identity map).
+
+        Args:
+            table (CacheTable): The table to query i.e. Device, InventoryDevice, Client
+            *columns (str): Names of the columns to return (projection), in the order they should appear in each row.  Defaults to all columns in table order.
+            where (Any, optional): A where clause i.e. ``Device.type == "ap"``. Defaults to None (all rows).
+            yield_per (int, optional): Stream the results in partitions of this many rows, rather than fetching them all up front.
+                The connection remains open until the generator is exhausted. Defaults to None.
+
+        Yields:
+            Row: named tuple like rows supporting index and attribute access (row.serial)
+        """
+        stmt = select(*[table.__table__.c[col] for col in columns or table.__table__.c.keys()])
+        if where is not None:
+            stmt = stmt.where(where)
+
+        start = time.perf_counter()
+        if yield_per:
+            with self.engine.connect() as connection:
+                result = connection.execution_options(yield_per=yield_per).execute(stmt)
+                for partition in result.partitions():
+                    yield from partition
+            return
+
+        with self.engine.connect() as connection:
+            rows = connection.execute(stmt).all()
+        log.debug(f"{len(rows)} {table.__tablename__} rows fetched via Cache.rows in {round(time.perf_counter() - start, 3)}s")
+        yield from rows
+
     def _get_all(self, table: CacheTable, obj: CacheObject | Callable | None = None) -> Generator[CacheObject | CacheTable, None, None]:
-        with Session(self.engine) as session:
-            start = time.perf_counter()
-            matches: list[CacheTable] = session.scalars(select(table)).all()
-            log.debug(f"All ({len(matches)}) {table.__name__} fetched via Cache._get_all in {round(time.perf_counter() - start, 3)}s")
-            if obj:
-                kwargs = {} if obj not in [CacheGuest, CacheFloorPlanAP] else {"cache": self}
-                if obj is not CacheCert:
-                    yield from (obj(m.to_dict(), **kwargs) for m in matches)
-                else:
-                    yield from (obj(**m.to_dict(), **kwargs) for m in matches)
+        if obj is None:  # ORM instances are only hydrated when explicitly requested (no cache object)
+            with Session(self.engine) as session:
+                start = time.perf_counter()
+                matches: list[CacheTable] = session.scalars(select(table)).all()
+                log.debug(f"All ({len(matches)}) {table.__name__} fetched via Cache._get_all in {round(time.perf_counter() - start, 3)}s")
+            yield from matches
+        elif isinstance(obj, type) and issubclass(obj, CacheRecord):  # slot based objects are built directly from the row tuples
+            yield from (obj.from_row(row) for row in self.rows(table, *obj.fields))
+        else:
+            kwargs = {} if obj not in [CacheGuest, CacheFloorPlanAP] else {"cache": self}
+            if obj is not CacheCert:
+                yield from (obj(row._asdict(), **kwargs) for row in self.rows(table))
             else:
-                yield from (m for m in matches)
+                yield from (obj(**row._asdict(), **kwargs) for row in self.rows(table))
+
+    @property
+    def columnar_ok(self) -> bool:
+        return NUMPY and bool(getattr(self.config, "columnar_cache", False))
+
+    def snapshot(self, table: CacheTable) -> ColumnarTable:
+        """Return a columnar (numpy) snapshot of a cache table.
+
+        The snapshot is built from plain row tuples (no ORM objects) and is reused until the next cache write.
+
+        Args:
+            table (CacheTable): The table to snapshot i.e. Device, InventoryDevice, Client, Site
+
+        Returns:
+            ColumnarTable: Column oriented snapshot of the table supporting vectorized filters / joins.
+        """
+        name = table.__tablename__
+        if name in self._snapshots and self._snapshots[name][0] == self.generation:
+            return self._snapshots[name][1]
+
+        with self.engine.connect() as connection:
+            result = connection.execute(select(table))
+            snapshot = ColumnarTable.from_rows(name, list(result.keys()), result.all())
+
+        self._snapshots[name] = (self.generation, snapshot)
+        return snapshot
+
+    def fuzzy_index(self, table: CacheTable, field: str = "name") -> FuzzyIndex:
+        """Return the fuzzy match index for a column of a cache table.
+
+        The index is built from plain row tuples on first use and is reused until the next cache write.
+
+        Args:
+            table (CacheTable): The table to index i.e. Device, Client, Site
+            field (str, optional): The column to index. Defaults to "name".
+
+        Returns:
+            FuzzyIndex: Index supporting top-k fuzzy lookups, optionally filtered by type, group, or portal_id (if the table has the column).
+        """
+        key = (table.__tablename__, field)
+        if key in self._fuzzy_indexes and self._fuzzy_indexes[key][0] == self.generation:
+            return self._fuzzy_indexes[key][1]
+
+        filter_cols = [col for col in ("type", "group", "portal_id") if col in table.__table__.c and col != field]
+        rows = list(self.rows(table, field, *filter_cols, where=table.__table__.c[field].is_not(None)))
+        index = FuzzyIndex([row[0] for row in rows], filters={col: [row[idx] for row in rows] for idx, col in enumerate(filter_cols, start=1)})
+        self._fuzzy_indexes[key] = (self.generation, index)
+        return index
 
     async def _update_db(self, table: CacheTable, data: list[dict[str, Any]], action: DBAction = DBAction.UPSERT, column: str | tuple = None) -> bool:
         data = utils.listify(data)
+        records, delta = None, None  # used to maintain the record count in table_meta, counted if neither is known (i.e. on failure)
         try:
             with render.Spinner(f"{_SPIN_EMOJI_MAP[action.value]}  [medium_spring_green]{table.__tablename__}[/] cache {action.value} {len(data)} records"):
                 if action == DBAction.DELETE:
@@ -265,7 +353,9 @@ class Cache:
                     with Session(self.engine) as session:
                         start = time.perf_counter()
                         results = [session.merge(table(**item)) for item in data]  # This returns a list of the Table objects (that matched the where clause)
+                        new = len(session.new)  # records that did not exist prior to the merge
                         session.commit()
+                        delta = new
                         workspace_msg = '' if self.config.workspace == self.config.default_workspace else f"({self.config.workspace} workspace) "
                         log.info(f"{action.value} {len(results)} items in {table.__tablename__} table {workspace_msg}in {round(time.perf_counter() - start, 3)}s")
                         return len(results) == len(data)
@@ -277,6 +367,10 @@ class Cache:
                     statements = [insert(table).values(chunk) for chunk in utils.chunker(data, 999)]  # sqlite can process 999 entries at a time beyond that will throw "too many variables"
 
                 updated_rows = await self._execute_statements(statements, action=action, table_name=table.__tablename__, record_cnt=len(data))
+                if action == DBAction.REPLACE:
+                    records = updated_rows
+                else:
+                    delta = -updated_rows if action == DBAction.DELETE else updated_rows if action == DBAction.INSERT else 0
                 return updated_rows == len(data)
         except Exception as e:
             log.exception(f"{repr(e)} occured during attempt to {action.value} {len(data)} records from {table.__tablename__} cache (Cache._update_db)", caption=True, log=True)
@@ -287,14 +381,69 @@ class Cache:
                 log.error(f"Data that caused the sqlite3.IntegrityError exception written to {dump_file}", show=True, caption=True, log=True)
             if env.is_pytest:
                 raise e
+        finally:
+            self._bump_generation(table)
+            self._update_table_meta(table, records=records, delta=delta)
+
+    def _bump_generation(self, table: CacheTable) -> None:
+        self.generation += 1
+        log.debug(f"{table.__tablename__} cache updated, generation -> {self.generation}, resolver cache {self.resolver_cache.stats}")
+
+    def _update_table_meta(self, table: CacheTable, *, records: int = None, delta: int = None, updated: bool = True) -> TableMeta:
+        """Store the current row count (and update time) for table in the table_meta table.
+
+        Args:
+            table (CacheTable): The table that was written to.
+            records (int, optional): The number of records in the table after the write (i.e. rows inserted by a replace). Defaults to None.
+            delta (int, optional): The change in the number of records from the write, applied to the stored count. Defaults to None.
+                If neither records or delta are known (or there is no stored count to apply delta to) the rows are counted.
+            updated (bool, optional): Set the updated timestamp to now. Defaults to True.
+                False is used to seed the record count for a table that has no table_meta entry yet.
+
+        Returns:
+            TableMeta: The stored table_meta row.
+        """
+        name = table.__tablename__
+        with Session(self.engine) as session:
+            if records is None and delta is not None:
+                stored = session.scalar(select(TableMeta.records).where(TableMeta.name == name))
+                records = None if stored is None else max(stored + delta, 0)
+            if records is None:
+                records = session.scalar(select(func.count()).select_from(table))
+            meta = session.merge(TableMeta(name=name, records=records, updated=None if not updated else time.time()))
+            session.commit()
+            log.debug(f"table_meta updated for {name}: {records} records")
+            return TableMeta(name=meta.name, records=meta.records, updated=meta.updated)
+
+    def recount(self, *tables: CacheTable) -> None:
+        """Re-seed the table_meta record count for tables written outside of _update_db (i.e. cache migration) via a COUNT(*) on each table.
+
+        Args:
+            *tables (CacheTable): The tables to recount. Defaults to all tables.
+        """
+        mappers = {mapper.local_table.name: mapper.class_ for mapper in Base.registry.mappers}
+        for table in tables or [mappers[name] for name in self._table_names]:
+            self._update_table_meta(table)
+
+    def count(self, table: CacheTable) -> int:
+        """Number of records in table, read from the table_meta table rather than a COUNT(*) on the table."""
+        row = next(self.rows(TableMeta, "records", where=TableMeta.name == table.__tablename__), None)
+        return row.records if row is not None else self._update_table_meta(table, updated=False).records
+
+    def last_updated(self, table: CacheTable) -> float | None:
+        """Epoch timestamp of the last write to table (None if it has not been updated since table_meta was introduced)."""
+        row = next(self.rows(TableMeta, "updated", where=TableMeta.name == table.__tablename__), None)
+        return None if row is None else row.updated
 
     async def _delete_from_db(self, table: CacheTable, data: list[dict[str, Any]], column: str):
         statements = [delete(table).where(getattr(table, column) == dev[column]) for dev in data]  # TODO list comp w/ compound where clause using or_
         with Session(self.engine) as session:
             start = time.perf_counter()
-            [session.execute(statement) for statement in statements]
+            deleted = sum(session.execute(statement).rowcount for statement in statements)
             session.commit()
             log.debug(f"Removed ({len(data)}) devices from {table.__name__} table in {round(time.perf_counter() - start, 3)}")
+        self._bump_generation(table)
+        self._update_table_meta(table, delta=-deleted)
 
     @property
     def size(self) -> str:
@@ -312,18 +461,18 @@ class Cache:
         return "0"
 
     @property
-    def all_tables(self) -> Generator[TableInfo, None, None]:
-        metadata = MetaData()
-        metadata.reflect(bind=self.engine)
-        tables = []
-        with Session(self.engine) as session:
-            for table_name, table in metadata.tables.items():
-                count_stmt = select(func.count()).select_from(table)
-                row_count = session.scalar(count_stmt)
-                tables += [TableInfo(table_name, table, row_count, engine=self.engine)]
+    def _table_names(self) -> list[str]:
+        return [name for name in Base.metadata.tables if name != TableMeta.__tablename__]
 
-        for t in tables:
-            yield t
+    @property
+    def all_tables(self) -> Generator[TableInfo, None, None]:
+        """Record counts come from the table_meta table (maintained by _update_db), tables without an entry are counted once and seeded."""
+        meta = {row.name: row for row in self.rows(TableMeta)}
+        mappers = {mapper.local_table.name: mapper.class_ for mapper in Base.registry.mappers}
+        for name in self._table_names:
+            if name not in meta:
+                meta[name] = self._update_table_meta(mappers[name], updated=False)
+            yield TableInfo(name, Base.metadata.tables[name], meta[name].records, engine=self.engine, updated=meta[name].updated)
 
     @property
     def key_tables(self) -> Generator[TableInfo, None, None]:
@@ -420,12 +569,10 @@ class Cache:
 
     @property
     def services(self) -> Generator[CacheService, None, None]:
-        svc = self._get_all(GLPService, CacheService)
-        if not svc:  # pragma: no cover
+        if self.last_updated(GLPService) is None and not self.count(GLPService):  # services have never been cached
             asyncio.run(self.refresh_svc_db())
-            svc = self._get_all(GLPService, CacheService)
 
-        yield from svc
+        yield from self._get_all(GLPService, CacheService)
 
     @property
     def services_by_name(self) -> dict[str, CacheService]:
@@ -548,6 +695,27 @@ class Cache:
     def floor_plan_aps_by_serial(self) -> dict[str, CacheFloorPlanAP]:
         return {ap.serial: ap for ap in self.floor_plan_aps}
 
+    def get_floor_plan_locations(self, serials: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Location (building name / floor level) of APs placed on a floor plan, from the floor plan cache tables in a single query.
+
+        Args:
+            serials (Iterable[str], optional): Only return locations for these AP serials. Defaults to None (all APs in the floor plan cache).
+
+        Returns:
+            dict[str, dict[str, Any]]: {serial: {"id": ..., "serial": ..., "building": ..., "floor": ...}} for each AP found.
+        """
+        stmt = select(FloorPlanAP.id, FloorPlanAP.serial, Building.name, FloorPlanAP.level).join(Building, FloorPlanAP.building_id == Building.id)
+        with self.engine.connect() as connection:
+            rows = connection.execute(stmt).all()
+
+        serials = None if serials is None else set(serials)
+        # level is stored as a float, whole levels are returned as int (1 not 1.0), as the location lookup via API always has
+        return {
+            serial: {"id": ap_id, "serial": serial, "building": building, "floor": level if level is None or not float(level).is_integer() else int(level)}
+            for ap_id, serial, building, level in rows
+            if serials is None or serial in serials
+        }
+
     @property
     def hook_data(self) -> list[dict[str, str | int | bool]]:
         return self._get_all(WebHookData, dict)
@@ -567,27 +735,14 @@ class Cache:
         return [m.to_dict() for m in matches]
 
     def fuzz_lookup(self, query_str: str, table: CacheTable, cache_object: CacheObject, field: str = "name", group: str = None, portal_id: str = None, dev_type: list[constants.LibAllDevTypes] = None) -> list[CacheTable]:  # pragma: no cover  Requires tty
-        cache_items = self._get_all(table, cache_object)
-        if not render.console.is_terminal or not cache_items:
+        if not render.console.is_terminal:
             return []
 
-        def _conditions(item: CacheObject, group: str = None, portal_id: str = None, dev_type: list[constants.LibAllDevTypes] = None) -> bool:
-            if not any([group, portal_id, dev_type]):
-                return True
-            if group:
-                return item.group == group
-            if portal_id:
-                return item.portal_id == portal_id
-            if dev_type:
-                return item.type in dev_type
-
-        fuzz_resp = process.extract(
-            query_str, [getattr(item, field) for item in cache_items if _conditions(item, group=group, portal_id=portal_id, dev_type=dev_type)], limit=1
-        )
+        fuzz_resp = self.fuzzy_index(table, field).extract_one(query_str, group=group, portal_id=portal_id, type=dev_type)
         matches = []
         if fuzz_resp:
-            fuzz_match, fuzz_confidence = fuzz_resp[0]
-            if fuzz_confidence >= 70 and render.confirm(prompt=f"Did you mean [green3]{fuzz_match}[/]?", abort=False):
+            fuzz_match, _ = fuzz_resp
+            if render.confirm(prompt=f"Did you mean [green3]{fuzz_match}[/]?", abort=False):
                 with Session(self.engine) as session:
                     start = time.perf_counter()
                     stmt = select(table).where(getattr(table, field) == fuzz_match)
@@ -632,6 +787,26 @@ class Cache:
         else:
             res = [self.responses.dev or Response()]
 
+        if self.columnar_ok:
+            combined = self._get_devices_with_inventory_columnar(no_refresh=no_refresh, device_type=device_type, status=status)
+        else:
+            combined = self._get_devices_with_inventory(no_refresh=no_refresh, device_type=device_type, status=status)
+
+        # TODO this may be an issue if check_fresh has a failure, don't think it returns Response object
+        resp: Response = min([r for r in res if r is not None], key=lambda x: x.rl)  # TODO update to use BatchResponse
+
+        resp.output = combined
+        # Both are None if a partial error occured in show all.  To test change url in-flight so one of the 3 calls fails
+        try:
+            resp.raw = {**self.responses.dev.raw, **self.responses.inv.raw}
+        except AttributeError:
+            if isinstance(resp, CombinedResponse):
+                resp.raw = {**resp.raw, **{f.url.path: f.raw for f in resp.failed}}
+            else:
+                resp.raw = {"Error": "raw output not available due to partial failure."}
+        return resp
+
+    def _get_devices_with_inventory(self, no_refresh: bool = False, device_type: constants.GenericDeviceTypes = None, status: constants.DeviceStatus = None) -> list[dict[str, Any]]:
         _inv_by_ser = self.inventory_by_serial if not self.responses.inv else {d["serial"]: d for d in self.responses.inv.output}
         # _dev_by_ser = {d["serial"]: d for d in self.responses.dev.output}  # Need to use the resp value not what was just stored in cache (self.devices_by_serial) as we don't store all fields
         _dev_by_ser = self.devices_by_serial if not self.responses.dev else {d["serial"]: d for d in self.responses.dev.output}
@@ -657,7 +832,7 @@ class Cache:
                     log.error(f"Attempt to fetch [green]GreenLake[/] inventory data from {len(inv_refresh_serials)} devices that appear to be missing from cache failed ({inv_resp.error}).  Inventory data may be incomplete.", show=True, caption=True)
                     log.error(f"The following {len(inv_refresh_serials)} appear in monitoring cache with status Up, so should be in inventory cache.  Attempt to update inventory cache failed: ({inv_resp.error}).\n{inv_refresh_serials = }")
 
-        combined = [
+        return [
             {
                 **_inv_by_ser.get(serial, {}),
                 **_dev_by_ser.get(serial, {}),
@@ -665,19 +840,32 @@ class Cache:
             } for serial in _all_serials
         ]
 
-        # TODO this may be an issue if check_fresh has a failure, don't think it returns Response object
-        resp: Response = min([r for r in res if r is not None], key=lambda x: x.rl)  # TODO update to use BatchResponse
+    def _get_devices_with_inventory_columnar(self, no_refresh: bool = False, device_type: constants.GenericDeviceTypes = None, status: constants.DeviceStatus = None) -> list[dict[str, Any]]:
+        """Vectorized equivalent of _get_devices_with_inventory, used when columnar_cache is enabled in the config."""
+        inv = self.snapshot(InventoryDevice) if not self.responses.inv else ColumnarTable.from_dicts("inventory", self.responses.inv.output)
+        dev = self.snapshot(Device) if not self.responses.dev else ColumnarTable.from_dicts("devices", self.responses.dev.output)
 
-        resp.output = combined
-        # Both are None if a partial error occured in show all.  To test change url in-flight so one of the 3 calls fails
-        try:
-            resp.raw = {**self.responses.dev.raw, **self.responses.inv.raw}
-        except AttributeError:
-            if isinstance(resp, CombinedResponse):
-                resp.raw = {**resp.raw, **{f.url.path: f.raw for f in resp.failed}}
-            else:
-                resp.raw = {"Error": "raw output not available due to partial failure."}
-        return resp
+        if device_type:
+            _dev_types = [device_type] if device_type != "switch" else ["cx", "sw", "mas"]
+            dev, inv = dev.where(type=_dev_types), inv.where(type=_dev_types)
+
+        if status:
+            dev = dev.where(status=status.capitalize())
+
+        if no_refresh and len(dev):  # update inv cache for any devices that indicate status up but lack an inv entry (they are obviously in the inventory)
+            missing = (dev.lower("status") == "up") & ~dev.isin("serial", inv.get("serial"))
+            inv_refresh_serials = dev.get("serial")[missing].tolist()
+            if inv_refresh_serials:
+                inv_resp = asyncio.run(self.refresh_inv_db(dev_type=device_type, serial_numbers=inv_refresh_serials))
+                if inv_resp.ok:
+                    inv = ColumnarTable.from_dicts("inventory", [*inv.to_dicts(), *inv_resp.output])
+                else:
+                    log.error(f"Attempt to fetch [green]GreenLake[/] inventory data from {len(inv_refresh_serials)} devices that appear to be missing from cache failed ({inv_resp.error}).  Inventory data may be incomplete.", show=True, caption=True)
+                    log.error(f"The following {len(inv_refresh_serials)} appear in monitoring cache with status Up, so should be in inventory cache.  Attempt to update inventory cache failed: ({inv_resp.error}).\n{inv_refresh_serials = }")
+
+        # The model from inv is more concise, better for confirmation prompts
+        combined = inv.join(dev, on="serial", how="right" if status else "outer", keep=["model"])
+        return combined.to_dicts()
 
     def _get_filtered_devices_w_inventory(self, refresh: bool = True, site: CacheSite = None, group: CacheGroup = None, not_group: CacheGroup = None, dev_type: constants.GroupDevTypes = None, not_dev_type: constants.GroupDevTypes = None, site_import: Path = None) -> list[dict[str, Any]]:
         resp = self.cache.get_devices_with_inventory(device_type=dev_type, no_refresh=not refresh)
@@ -791,13 +979,13 @@ class Cache:
         with Session(self.engine) as session:
             with session.bind.connect() as connection:
                 mon_cache_result = connection.execute(mon_cache_stmt)
-                mon_cache_found = [CacheDevice(dict(row)) for row in mon_cache_result.mappings()]
+                mon_cache_found = [CacheDevice.from_row(row) for row in mon_cache_result]
                 mon_cache_by_serial = {dev.serial: dev for dev in mon_cache_found}
 
                 inv_cache_by_serial = {}
                 if (len(found_by_serial) + len(mon_cache_by_serial)) != len(serial_numbers):
                     inv_cache_result = connection.execute(inv_cache_stmt)
-                    inv_cache_found = [CacheInvDevice(dict(row)) for row in inv_cache_result.mappings()]
+                    inv_cache_found = [CacheInvDevice.from_row(row) for row in inv_cache_result]
                     inv_cache_by_serial = {dev.serial: dev for dev in inv_cache_found}
 
         return [found_by_serial.get(serial, mon_cache_by_serial.get(serial, inv_cache_by_serial.get(serial))) for serial in serial_numbers]
@@ -842,13 +1030,9 @@ class Cache:
 
         for idx in range(2):
             found = []
-            stmt = select(InventoryDevice).where(or_(*expressions))
-            with Session(self.engine) as session:
-                with session.bind.connect() as connection:
-                    result = connection.execute(stmt)
-                    found = [CacheInvDevice(dict(row)) for row in result.mappings()]
-                    if not unique_id_qry:
-                        return found
+            found = [CacheInvDevice.from_row(row) for row in self.rows(InventoryDevice, *CacheInvDevice.fields, where=or_(*expressions))]
+            if not unique_id_qry:
+                return found
 
             if len(serial_numbers) == len(found):
                 break
@@ -905,13 +1089,9 @@ class Cache:
 
         for idx in range(2):
             found = []
-            stmt = select(Device).where(or_(*expressions))
-            with Session(self.engine) as session:
-                with session.bind.connect() as connection:
-                    result = connection.execute(stmt)
-                    found = [CacheDevice(dict(row)) for row in result.mappings()]
-                    if not unique_id_qry:
-                        return found
+            found = [CacheDevice.from_row(row) for row in self.rows(Device, *CacheDevice.fields, where=or_(*expressions))]
+            if not unique_id_qry:
+                return found
 
             if len(serial_numbers) == len(found):
                 break
@@ -2256,10 +2436,17 @@ class Cache:
 
             return True
 
-        cache_devices = {cd["serial"]: cd for cd in self.devices if include_device(cd)}
+        if self.columnar_ok:
+            cache_snapshot = self.snapshot(Device)
+            excluded = cache_snapshot.mask(type=cache_type or None, site=site, group=group) & ~cache_snapshot.isin("serial", list(new_by_serial))
+            cache_devices = {cd["serial"]: cd for cd in cache_snapshot.take(~excluded).to_dicts()}
+            cache_count = len(cache_snapshot)
+        else:
+            cache_devices = {cd["serial"]: cd for cd in self.devices if include_device(cd)}
+            cache_count = self.count(Device)
 
         update_data = {**cache_devices, **new_by_serial}
-        log.info(f"Data prepared for device cache update.  Filters: {filter_msg}. Add/update {len(new_by_serial)} devices.  Devices in cache: Now: {len(list(self.devices))}, After Update: {len(update_data)}.")
+        log.info(f"Data prepared for device cache update.  Filters: {filter_msg}. Add/update {len(new_by_serial)} devices.  Devices in cache: Now: {cache_count}, After Update: {len(update_data)}.")
 
         return list(update_data.values())
 
@@ -2351,9 +2538,7 @@ class Cache:
             raw_data = await self.format_raw_devices_for_cache(resp)
             with econsole.status(f"preparing {len(resp)} records for cache update"):
                 _start_time = time.perf_counter()
-                raw_models_by_type = models.Devices(**raw_data)
-                raw_models = [*raw_models_by_type.aps, *raw_models_by_type.switches, *raw_models_by_type.gateways]
-                update_data = [dev.model_dump() for dev in raw_models]
+                update_data = models.device_cache_rows(raw_data)
                 log.debug(f"prepared {len(resp)} records for dev cache update in {round(time.perf_counter() - _start_time, 2)}")
 
             action = DBAction.UPSERT
@@ -2414,6 +2599,36 @@ class Cache:
         _ = asyncio.create_task(self._update_db(db, data=data.cache_dump(), action=DBAction.REPLACE))
         return True
 
+    async def refresh_floor_plan_db(self, concurrency: int = None) -> list[Response]:
+        """Crawl all VisualRF campuses/buildings/floors/APs and update the floor plan cache tables.
+
+        Args:
+            concurrency (int, optional): Max number of concurrent calls for each level of the crawl. Defaults to None (VisualRFAPI default).
+
+        Returns:
+            list[Response]: All responses from the crawl.  Cache is only replaced if all calls were successful, otherwise
+                successfully retrieved data is merged into the cache.
+        """
+        crawl = await api.visualrf.crawl_floor_plans(**({} if concurrency is None else {"concurrency": concurrency}))
+        if crawl.failed:
+            log.warning(f"{len(crawl.failed)} of {len(crawl.responses)} calls failed during floor plan crawl, floor plan cache will be updated with partial results.", caption=True)
+
+        try:
+            buildings = models.BuildingResponses([r for r in crawl.buildings if r.ok]).cache_dump()
+            floors = models.BuildingFloors([r for r in crawl.floors if r.ok]).cache_dump()
+            aps = models.Floors([r for r in crawl.aps if r.ok]).cache_dump()
+        except ValidationError as e:  # pragma: no cover
+            log.error(utils.clean_validation_errors(e), show=True, caption=True, log=True)
+            return crawl.responses
+
+        action = DBAction.REPLACE if crawl.ok else DBAction.UPSERT
+        log.info(f"Floor plan crawl: {len(buildings)} buildings, {len(floors)} floors, {len(aps)} APs.")
+        for table, data in [(Building, buildings), (FloorPlanFloor, floors), (FloorPlanAP, aps)]:
+            if data or action == DBAction.REPLACE:
+                _ = await self._update_db(table, data=data, action=action)
+
+        return crawl.responses
+
     async def update_inv_db(
             self,
             data: list[dict[str, Any]] | dict[str, Any],
@@ -2516,29 +2731,33 @@ class Cache:
 
         inv_resp, sub_resp = batch_resp  # if first call failed above it doesn't get this far.
 
+        # each device is validated once (cnx_models.Inventory), cache rows are built directly from the validated inventory
         inv_data, sub_data = None, None
         if not sub_resp.ok:
             log.error(f"Call to fetch subscription details failed.  {sub_resp.error}.  Subscription details provided from previously cached values.", caption=True)
             inv_data = cnx_models.Inventory(**inv_resp.raw)
-            _inv_by_ser = {} if not inv_resp.ok else {dev["serialNumber"]: dev for dev in inv_resp.raw["items"]}
-            combined = {serial: {**_inv_by_ser[serial], **self.inventory_by_serial.get(serial, {})} for serial in _inv_by_ser.keys()}
-            inv_model = models.Inventory(list(combined.values()))
+            inv_rows = inv_data.cache_rows()
+            sub_fields = ["subscription", "subscription_key", "subscription_expires"]
+            for row in inv_rows:
+                cached = self.inventory_by_serial.get(row["serial"])
+                if cached:
+                    row.update({k: cached.get(k) for k in sub_fields})
         else:
             with render.Spinner("Preparing inventory data for cache update", spinner="runner"):
                 sub_data = cnx_models.Subscriptions(**sub_resp.raw)
                 inv_data = cnx_models.Inventory(**inv_resp.raw)
-                combined = await get_inventory_with_sub_data(inv_data, sub_data)
-                inv_model = models.Inventory(combined)
+                inv_rows = inv_data.cache_rows(sub_data)
+        inv_rows = models.inventory_cache_rows(inv_rows)
 
         if dev_type and dev_type != "all":  # prepare data for cache
             dev_type: list[str] = [dev_type] if dev_type != "switch" else ["cx", "sw"]
-            inv_model = models.Inventory([i for i in inv_model.model_dump() if i["type"] in dev_type])
+            inv_rows = [row for row in inv_rows if row["type"] in dev_type]
 
         resp = [r for r in batch_resp if r.ok][-1]
         resp.rl = sorted([r.rl for r in batch_resp])[0]
         resp.raw = {r.url.path: r.raw for r in batch_resp}
 
-        resp.output = inv_model.model_dump()
+        resp.output = inv_rows
         if inv_data is not None:
             resp.caption = inv_data.counts
 
@@ -2549,9 +2768,9 @@ class Cache:
             self.responses.serial_numbers = serial_numbers
 
         if (dev_type is None or dev_type == "all") and not archived and not serial_numbers:
-            _ = await self._update_db(InventoryDevice, data=inv_model.cache_dump(), action=DBAction.REPLACE)
+            _ = await self._update_db(InventoryDevice, data=inv_rows, action=DBAction.REPLACE)
         else:
-            _ = await self._update_db(InventoryDevice, data=inv_model.cache_dump(), action=DBAction.UPSERT)
+            _ = await self._update_db(InventoryDevice, data=inv_rows, action=DBAction.UPSERT)
 
         if sub_data:
             self.responses.sub = sub_resp
@@ -2802,10 +3021,10 @@ class Cache:
 
         resp.output = utils.listify(resp.output)
         with econsole.status(f"Preparing [cyan]{len(resp.output)}[/] clients for cache update"):
-            new_clients = models.Clients(resp.output)  # TODO we can use model_dump to update resp.output negating need for the cleaner
-            if "wireless" in [new_clients[0].type, new_clients[-1].type]:
+            new_clients = models.client_cache_rows(resp.output)
+            if "wireless" in [new_clients[0]["type"], new_clients[-1]["type"]]:
                 self.responses.client = resp
-        _ = await self._update_db(Client, data=new_clients.cache_dump(), action=DBAction.UPSERT)
+        _ = await self._update_db(Client, data=new_clients, action=DBAction.UPSERT)
 
         return resp
 
@@ -3435,6 +3654,7 @@ class Cache:
         exit_on_fail: bool = False,
     ) -> CacheDevice | CacheInvDevice | None: ...  # pragma: no cover
 
+    @resolver_cache
     def get_dev_identifier(
         self,
         query_str: str | Iterable[str],
@@ -3551,14 +3771,7 @@ class Cache:
                 out = [CacheInvDevice(dev.to_dict()) for dev in inv_matches]
                 break
 
-        # handle stacks
-        if len(out) > 1 and (swack or swack_only):
-            unique_swack_ids = set([d.swack_id for d in out if d.swack_id])
-            stacks = [d for d in out if d.swack_id in unique_swack_ids and (d.ip or (d.switch_role and d.switch_role == 2))]
-            if swack:
-                out = [*stacks, *[d for d in out if not d.swack_id]]
-            elif swack_only:
-                out = stacks
+        out = self._filter_swack(out, swack=swack, swack_only=swack_only)
 
         if completion:
             return out or []
@@ -3579,7 +3792,137 @@ class Cache:
             if exit_on_fail:
                 raise typer.Exit(1)
 
-    @typed_lru_cache
+    @staticmethod
+    def _filter_swack(out: list[CacheDevice | CacheInvDevice], swack: bool = False, swack_only: bool = False) -> list[CacheDevice | CacheInvDevice]:
+        """Reduce matches for members of a stack/swarm to the conductor/VC (see get_dev_identifier swack and swack_only)."""
+        if len(out) > 1 and (swack or swack_only):
+            unique_swack_ids = set([d.swack_id for d in out if d.swack_id])
+            stacks = [d for d in out if d.swack_id in unique_swack_ids and (d.ip or (d.switch_role and d.switch_role == 2))]
+            if swack:
+                out = [*stacks, *[d for d in out if not d.swack_id]]
+            elif swack_only:
+                out = stacks
+        return out
+
+    def _get_exact_dev_matches(
+        self, query_strs: Iterable[str], dev_type: list[constants.LibAllDevTypes] = None
+    ) -> tuple[dict[str, list[CacheDevice]], dict[str, list[CacheDevice]]]:
+        """Set based exact (then case insensitive) match on name, serial, mac, or ip for all query_strs.
+
+        Returns:
+            tuple[dict[str, list[CacheDevice]], dict[str, list[CacheDevice]]]: matches by query_str, and the matches excluded as device type != dev_type by query_str.
+        """
+        query_strs = list(query_strs)
+        macs = {q: utils.Mac(q).cols.lower() for q in query_strs if utils.Mac(q)}
+        found: list[CacheDevice] = []
+        for chunk in utils.chunker(query_strs, 500):  # keep the IN lists well within sqlite's max variables
+            lower = {q.lower() for q in chunk}
+            where = or_(
+                func.lower(Device.name).in_(lower),
+                func.lower(Device.serial).in_(lower),
+                Device.mac.in_([macs[q] for q in chunk if q in macs]),
+                Device.ip.in_({q.split("/")[0] for q in chunk}),
+            )
+            found += [CacheDevice.from_row(row) for row in self.rows(Device, *CacheDevice.fields, where=where)]
+
+        exact: dict[str, list[CacheDevice]] = {}
+        insensitive: dict[str, list[CacheDevice]] = {}
+        for dev in found:
+            for key in set(filter(None, [dev.name, dev.serial, dev.mac, dev.ip])):
+                exact.setdefault(key, []).append(dev)
+            for key in set(filter(None, [(dev.name or "").lower(), (dev.serial or "").lower()])):
+                insensitive.setdefault(key, []).append(dev)
+
+        matches, excluded = {}, {}
+        for q in query_strs:
+            keys = set(filter(None, [q, macs.get(q), q.split("/")[0]]))
+            devs = list({dev.serial: dev for k in keys for dev in exact.get(k, [])}.values()) or insensitive.get(q.lower(), [])
+            if dev_type and devs:
+                if not [d for d in devs if d.type in dev_type]:
+                    excluded[q] = devs
+                devs = [d for d in devs if d.type in dev_type]
+            if devs:
+                matches[q] = devs
+        return matches, excluded
+
+    def get_dev_identifiers(
+        self,
+        query_strs: Iterable[str],
+        dev_type: Optional[constants.LibAllDevTypes | list[constants.LibAllDevTypes]] = None,
+        swack: Optional[bool] = False,
+        swack_only: Optional[bool] = False,
+        retry: Optional[bool] = True,
+        silent: Optional[bool] = False,
+        include_inventory: Optional[bool] = False,
+        exit_on_fail: Optional[bool] = True,
+    ) -> list[CacheDevice | CacheInvDevice | None]:
+        """Get multiple Devices from local cache.
+
+        Equivalent to calling get_dev_identifier for each query_str, but exact matches are resolved for all of the query_strs
+        with set based queries.  Those that do not match exactly fall back to the less exact (prefix) matching of get_dev_identifier,
+        then a single cache update is performed for all that still do not match, then fuzzy matching (if not silent).
+
+        Args:
+            query_strs (Iterable[str]): The query strings to attempt to match.
+            dev_type, swack, swack_only, retry, silent, include_inventory, exit_on_fail: See get_dev_identifier.
+
+        Raises:
+            typer.Exit: Exit CLI / command, occurs if any query_str does not match unless exit_on_fail is set to False (or retry=False).
+
+        Returns:
+            list[CacheDevice | CacheInvDevice | None]: Matches in the same order as query_strs (None for query_strs with no match).
+        """
+        if dev_type:
+            dev_type = utils.listify(dev_type)
+            if "switch" in dev_type:
+                dev_type = list(set(filter(lambda t: t != "switch", [*dev_type, "cx", "sw"])))
+
+        query_strs = list(query_strs)
+        resolved: dict[str, CacheDevice | CacheInvDevice] = {}
+        excluded: dict[str, list[CacheDevice]] = {}
+
+        def _resolve(pending: list[str]) -> list[str]:
+            matches_by_query, excluded_by_query = self._get_exact_dev_matches(pending, dev_type=dev_type)
+            excluded.update(excluded_by_query)
+            for q, matches in matches_by_query.items():
+                out = self._filter_swack(matches, swack=swack, swack_only=swack_only)
+                if out:
+                    resolved[q] = out[0] if len(out) == 1 else self.handle_multi_match(sorted(out, key=lambda m: m.get("name", "")), query_str=q)[0]
+            for q in [q for q in pending if q not in resolved]:  # prefix / inventory match
+                match = self.get_dev_identifier(q, dev_type=dev_type, swack=swack, swack_only=swack_only, retry=False, silent=True, include_inventory=include_inventory, exit_on_fail=False)
+                if match:
+                    resolved[q] = match
+            return [q for q in pending if q not in resolved]
+
+        misses = _resolve(list(dict.fromkeys(query_strs)))
+        # as in get_dev_identifier, no refresh if the devices of dev_type were already refreshed in this session
+        if misses and retry and self.responses.dev is None and not (dev_type and self.responses.device_type == dev_type):
+            econsole.print(f"{emoji.warn} [bright_red]No Match found[/] for {utils.summarize_list(misses, color='cyan', pad=0, sep=', ')}.")
+            econsole.print(f":arrows_clockwise: Updating Device{' & Inventory ' if include_inventory else ' '}Cache.")
+            self.check_fresh(refresh=True, dev_type=dev_type, dev_db=True, inv_db=include_inventory)
+            misses = _resolve(misses)
+
+        if misses and retry and FUZZ and not silent:
+            for q in misses:
+                out = self._filter_swack([CacheDevice(dev.to_dict()) for dev in self.fuzz_lookup(q, table=Device, cache_object=CacheDevice, dev_type=dev_type)], swack=swack, swack_only=swack_only)
+                if out:
+                    resolved[q] = out[0]
+            misses = [q for q in misses if q not in resolved]
+
+        if misses and retry:
+            log.error(f"Unable to gather device info from provided identifier{'s' if len(misses) > 1 else ''} {utils.summarize_list(misses, color='cyan', pad=0, sep=', ')}", show=not silent)
+            all_matches = list({dev.serial: dev for q in misses for dev in excluded.get(q, [])}.values())
+            if all_matches:
+                log.error(
+                    f"The Following {len(all_matches)} devices matched {utils.summarize_list(all_matches)} excluded as device type != {escape(str(utils.unlistify(dev_type)))}",
+                    show=True,
+                )
+            if exit_on_fail:
+                raise typer.Exit(1)
+
+        return [resolved.get(q) for q in query_strs]
+
+    @resolver_cache
     def get_inv_identifier(
         self,
         query_str: str | Iterable[str],
@@ -3663,20 +4006,15 @@ class Cache:
                         dev_type_sfx = "" if not dev_type else f" [dim italic](Device Type: {utils.unlistify(dev_type)})[/]"
                         econsole.print(f"{emoji.warn} {_msg} for [cyan]{query_str}[/]{dev_type_sfx}.")
                     if FUZZ and self.inventory and not silent:  # pragma: no cover  requires tty
-                        if dev_type:
-                            inv_generator = {"id": (d["id"] for d in self.inventory if "id" in d and d["type"] in dev_type), "serial": (d["serial"] for d in self.inventory if "serial" in d and d["type"] in dev_type)}
-                        else:
-                            inv_generator = {"id": (d["id"] for d in self.inventory if "id" in d), "serial": (d["serial"] for d in self.inventory if "serial" in d)}
-
                         fuzz_match, fuzz_confidence = None, 0
-                        for _field, inv_devices in inv_generator.items():
-                            _fuzz_match = process.extractOne(query_str, inv_devices)
+                        for _field in ["id", "serial"]:
+                            _fuzz_match = self.fuzzy_index(InventoryDevice, _field).extract_one(query_str, type=dev_type)
                             if _fuzz_match:
                                 _match, _confidence = _fuzz_match
                                 if _confidence > fuzz_confidence:
                                     field, fuzz_match, fuzz_confidence = _field, _match, _confidence
 
-                        if fuzz_confidence >= 70:
+                        if fuzz_match:
                             confirm_str = render.rich_capture(f"Did you mean [green3]{fuzz_match}[/]?")
                             if typer.confirm(confirm_str):
                                 matches = session.scalars(select(InventoryDevice).where(getattr(InventoryDevice, field) == fuzz_match)).all()
@@ -3708,7 +4046,7 @@ class Cache:
             if exit_on_fail:
                 raise typer.Exit(1)
 
-    @typed_lru_cache
+    @resolver_cache
     def get_combined_inv_dev_identifier(
         self,
         query_str: str | Iterable[str],
@@ -3795,7 +4133,7 @@ class Cache:
         exit_on_fail: bool,
     ) -> CacheSite | None: ...  # pragma: no cover
 
-    # @typed_lru_cache
+    @resolver_cache
     def get_site_identifier(
         self,
         query_str: str | Sequence[str],
@@ -3891,6 +4229,7 @@ class Cache:
 
     # TODO change all get_*_identifier functions to continue to look for matches when match is found when
     #       completion is True
+    @resolver_cache
     def get_group_identifier(
         self,
         query_str: str,
@@ -3938,12 +4277,11 @@ class Cache:
                     econsole.print(f"{emoji.warn} [bright_red]No Match found for[/] [cyan]{query_str}[/]{dev_type_sfx}.")
                     if FUZZ and self.groups and not silent:    # pragma: no cover  Requires tty
                         if dev_type:
-                            fuzz_match, fuzz_confidence = process.extract(query_str, [g["name"] for g in self.groups if "name" in g and bool([t for t in g["allowed_types"] if t in dev_type])], limit=1)[0]
+                            fuzz_resp = FuzzyIndex([g["name"] for g in self.groups if "name" in g and bool([t for t in g["allowed_types"] if t in dev_type])]).extract_one(query_str)
                         else:
-                            fuzz_match, fuzz_confidence = process.extract(query_str, [g["name"] for g in self.groups], limit=1)[0]
-                        confirm_str = render.rich_capture(f"Did you mean [green3]{fuzz_match}[/]?")
-                        if fuzz_confidence >= 70 and typer.confirm(confirm_str):
-                            matches = session.scalars(select(Group).where(Group.name == fuzz_match)).all()
+                            fuzz_resp = self.fuzzy_index(Group).extract_one(query_str)
+                        if fuzz_resp and typer.confirm(render.rich_capture(f"Did you mean [green3]{fuzz_resp[0]}[/]?")):
+                            matches = session.scalars(select(Group).where(Group.name == fuzz_resp[0])).all()
                     if not matches:
                         econsole.print(":arrows_clockwise: Updating [cyan]group[/] Cache")
                         self.check_fresh(refresh=True, group_db=True)
@@ -4265,7 +4603,7 @@ class Cache:
         return match
 
     # TODO make this a wrapper for other specific get_portal_identifier.... calls
-    @typed_lru_cache
+    @resolver_cache
     def get_name_id_identifier(
         self,
         cache_name: Literal["dev", "site", "sub", "template", "group", "label", "mpsk_network", "mpsk", "portal", "building"],
@@ -4376,7 +4714,7 @@ class Cache:
             econsole.print(f"\n[bright_green]Valid Names[/]:\n--\n{valid}\n--\n")
             raise typer.Exit(1)
 
-    @typed_lru_cache
+    @resolver_cache
     def get_sub_identifier(
         self,
         query_str: str,
@@ -8,6 +8,7 @@ from centralcli.typedefs import UNSET
 
 from ... import config as cfg
 from ...client import Session
+from ...runner import PooledContext
 from .aiops import AiOpsAPI
 from .central import CentralAPI
 from .cloudauth import CloudAuthAPI
@@ -29,7 +30,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from ...typedefs import StrOrURL
 
 
-class ClassicAPI:  # this object is a singleton per workspace
+class ClassicAPI(PooledContext):  # this object is a singleton per workspace
     _by_workspace: dict[str, ClassicAPI] = {}
 
     def __init__(self, config: Config = None, *, base_url: StrOrURL = None, silent: bool = True, limit_per_host: int | None = None, total_timeout: int | None = UNSET):
@@ -904,7 +904,7 @@ class MonitoringAPI:
         return await self.session.get(url)
 
     # API-FLAW total changes during subsequent pagination calls i.e. offset: 0 limit: 1000 = total 2420, offset: 1000 limit: 1000 = total 2408 or 2426 could go up or down.
-    # This is handled in Response __add__ method.
+    # This is handled in Response __add__ method (PageAccumulator).
     async def get_events(
         self,
         group: str = None,
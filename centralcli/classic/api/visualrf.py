@@ -1,16 +1,62 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 if TYPE_CHECKING:
     from ...client import Session
     from ...response import Response
 
+MAX_CONCURRENCY = 7  # max concurrent calls per level of the floor plan crawl
+
+
+@dataclass
+class FloorPlanCrawl:
+    """Responses from each level of a VisualRF campus -> building -> floor -> AP crawl."""
+    campus: list[Response] = field(default_factory=list)
+    buildings: list[Response] = field(default_factory=list)
+    floors: list[Response] = field(default_factory=list)
+    aps: list[Response] = field(default_factory=list)
+
+    @property
+    def responses(self) -> list[Response]:
+        return [*self.campus, *self.buildings, *self.floors, *self.aps]
+
+    @property
+    def failed(self) -> list[Response]:
+        return [r for r in self.responses if not r.ok]
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.campus) and not self.failed
+
 
 class VisualRFAPI:
     def __init__(self, session: Session):
         self.session = session
 
+    async def _get_all_pages(self, url: str, key: str, *, count_key: str = None, offset: int = 0, limit: int = 100, **params: Any) -> Response:
+        """Page through a VisualRF endpoint, combining the items under key from each page into the last Response.
+
+        VisualRF responses do not provide a total, pages are fetched until a page returns less than limit items.
+        """
+        items = []
+        while True:
+            resp = await self.session.get(url, params={"offset": offset, "limit": limit, **params})
+            if not resp.ok:
+                break
+
+            page = resp.raw.get(key) or []
+            items += page
+            if len(page) < limit:
+                resp.output = resp.raw = {**resp.raw, key: items, **({count_key: len(items)} if count_key else {})}
+                break
+
+            offset = offset + limit
+
+        return resp
+
     async def get_all_campuses(
         self,
         offset: int = 0,
@@ -27,12 +73,7 @@ class VisualRFAPI:
         """
         url = "/visualrf_api/v1/campus"
 
-        params = {
-            "offset": offset,
-            "limit": limit,
-        }
-
-        return await self.session.get(url, params=params)
+        return await self._get_all_pages(url, "campus", count_key="campus_count", offset=offset, limit=limit)
 
     # API-FLAW: offset does not work the way stated in swagger, it works the way it does everywhere else i.e. offset 50 will return items 50 on, not the 50th page (as swagger indicates)
     # Response does not indicate total # of buildings, so there is no way to know how many calls are necessary when campus has > 100 buildings
@@ -55,25 +96,7 @@ class VisualRFAPI:
         """
         url = f"/visualrf_api/v1/campus/{campus_id}"
 
-        buildings = []
-        while True:
-            params = {
-                "offset": offset,
-                "limit": limit,
-            }
-            resp = await self.session.get(url, params=params)
-
-            if not resp.ok:
-                break
-
-            buildings += resp.raw.get("buildings", [])
-            if resp.raw.get("building_count", 9999) < limit:
-                resp.output = resp.raw = {**resp.raw, "buildings": buildings, "building_count": len(buildings)}
-                break
-
-            offset = offset + limit
-
-        return resp
+        return await self._get_all_pages(url, "buildings", count_key="building_count", offset=offset, limit=limit)
 
     async def get_floors_for_building(
         self,
@@ -97,13 +120,7 @@ class VisualRFAPI:
         """
         url = f"/visualrf_api/v1/building/{building_id}"
 
-        params = {
-            "offset": offset,
-            "limit": limit,
-            "units": units
-        }
-
-        return await self.session.get(url, params=params)
+        return await self._get_all_pages(url, "floors", count_key="floor_count", offset=offset, limit=limit, units=units)
 
     async def get_floor_details(
         self,
@@ -157,13 +174,42 @@ class VisualRFAPI:
         """
         url = f"/visualrf_api/v1/floor/{floor_id}/access_point_location"
 
-        params = {
-            "offset": offset,
-            "limit": limit,
-            "units": units
-        }
+        return await self._get_all_pages(url, "access_points", count_key="access_point_count", offset=offset, limit=limit, units=units)
 
-        return await self.session.get(url, params=params)
+    async def crawl_floor_plans(
+        self,
+        concurrency: int = MAX_CONCURRENCY,
+    ) -> FloorPlanCrawl:
+        """Walk the campus -> building -> floor -> AP tree breadth first.
+
+        Each level is fetched concurrently (bounded by concurrency) once the level above it completes.
+        Pagination is handled for every level.
+
+        Args:
+            concurrency (int, optional): Max number of calls in flight at once. Defaults to MAX_CONCURRENCY.
+
+        Returns:
+            FloorPlanCrawl: The responses from each level of the crawl.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(call: Awaitable[Response]) -> Response:
+            async with semaphore:
+                return await call
+
+        async def gather(func: Callable[[str], Awaitable[Response]], ids: list[str]) -> list[Response]:
+            return list(await asyncio.gather(*[bounded(func(_id)) for _id in ids]))
+
+        crawl = FloorPlanCrawl(campus=[await self.get_all_campuses()])  # first call is made alone (token refresh)
+        if not crawl.campus[0].ok:
+            return crawl
+
+        crawl.buildings = await gather(self.get_buildings_for_campus, [c["campus_id"] for c in crawl.campus[0].raw.get("campus") or []])
+        crawl.floors = await gather(self.get_floors_for_building, [b["building_id"] for r in crawl.buildings if r.ok for b in r.raw["buildings"]])
+
+        crawl.aps = await gather(self.get_aps_for_floor, [f["floor_id"] for r in crawl.floors if r.ok for f in r.raw["floors"]])
+
+        return crawl
 
     async def get_ap_location(
         self,
@@ -8,7 +8,7 @@ from __future__ import annotations
 import ipaddress
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Container, Sequence
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -17,7 +17,7 @@ import yaml
 from rich.console import Console
 from rich.markup import escape
 
-from centralcli import log, utils
+from centralcli import log, utils, workers
 
 from .constants import STRIP_KEYS, LLDPCapabilityTypes, PoEDetectionStatus, RadioBandOptions, SwitchRolesShort
 from .models.cache import Sites
@@ -26,7 +26,7 @@ from .objects import DateTime
 from .render import tty
 
 if TYPE_CHECKING:
-    from .cache import Cache, CacheDevice
+    from .cache import CacheDevice
     from .constants import DevTypes, LibAllDevTypes, StatusOptions
     from .typedefs import CertType, InsightSeverityType
 
@@ -331,6 +331,37 @@ def short_value(key: str, value: Any):
     return short_key(key), utils.unlistify(value)
 
 
+def _convert_bool(value: Any, show_false: bool = True) -> Any:
+    if not isinstance(value, bool):
+        return value
+
+    return '\u2705' if value is True else '\u274c' if show_false else ''  # /u2705 = white_check_mark (✅) \u274c :x: (❌)
+
+
+def format_record(data: dict[str, Any], *, keys: Sequence[str] = None, present_only: bool = False, strip_keys: Container[str] = (), emoji_bools: bool = False, show_false: bool = True) -> dict[str, Any]:
+    """Send the key/value pairs of a single record through the short_key/short_value formatters.
+
+    Stateless per-record formatter, suitable for workers.map_records.
+
+    Args:
+        data (dict[str, Any]): The record.
+        keys (Sequence[str], optional): Keys (in order) to include in the output. Defaults to None (all keys in data).
+        present_only (bool, optional): Only include keys from keys that exist in data. Defaults to False (missing keys have value None).
+        strip_keys (Container[str], optional): Keys to exclude from the output. Defaults to ().
+        emoji_bools (bool, optional): Replace boolean values with emoji ✅ for True ❌ for False. Defaults to False.
+        show_false (bool, optional): When emoji_bools is True.  Set this to False to only show ✅ for True items, leave blank for False.
+
+    Returns:
+        dict[str, Any]: The formatted record.
+    """
+    keys = keys if keys is not None else data.keys()
+    return dict(
+        short_value(k, data.get(k) if not emoji_bools else _convert_bool(data.get(k), show_false=show_false))
+        for k in keys
+        if k not in strip_keys and (not present_only or k in data)
+    )
+
+
 def simple_kv_formatter(data: list[dict[str, Any]], key_order: list[str] = None, strip_keys: list[str] = None, strip_null: bool = False, emoji_bools: bool = False, show_false: bool = True, filter: Callable = None) -> list[dict[str, Any]]:
     """Default simple formatter
 
@@ -351,27 +382,11 @@ def simple_kv_formatter(data: list[dict[str, Any]], key_order: list[str] = None,
         log.warning(f"cleaner.simple_kv_formatter expected a list but rcvd {type(data)}")
         return data
 
-    def convert_bools(value: Any) -> Any:
-        if not emoji_bools or not isinstance(value, bool):
-            return value
-
-        return '\u2705' if value is True else '\u274c' if show_false else ''  # /u2705 = white_check_mark (✅) \u274c :x: (❌)
-
     strip_keys = strip_keys or []
     if key_order:
         data = [{k: inner_dict.get(k) for k in key_order} for inner_dict in data if not filter or filter(inner_dict)]
 
-    data = [
-        dict(
-            short_value(
-                k,
-                convert_bools(v),
-            )
-            for k, v in d.items()
-            if k not in strip_keys
-        )
-        for d in data
-    ]
+    data = workers.map_records(format_record, data, strip_keys=set(strip_keys), emoji_bools=emoji_bools, show_false=show_false)
 
     return data if not strip_null else utils.strip_no_value(data)
 
@@ -431,7 +446,7 @@ def get_labels(
 
 def _client_concat_associated_dev(
     data: dict[str, Any],
-    cache: Cache,
+    dev_names: dict[str, str],
     verbose: bool = False,
 ) -> dict[str, Any]:
     strip_keys = [
@@ -450,24 +465,18 @@ def _client_concat_associated_dev(
         "swarm_id",
     ]
 
-    dev, _gw = "", ""
-    if data.get("associated_device"):
-        dev = cache.get_dev_identifier(data["associated_device"], retry=False, exit_on_fail=False)
-    else:  # pragma: no cover
-        ...
-
     if data.get("gateway_serial"):
-        _gw = cache.get_dev_identifier(data["gateway_serial"], retry=False, exit_on_fail=True)
+        _gw_name = dev_names.get(data["gateway_serial"])
         _gateway = {
-            "name": None if not _gw else _gw.name,
+            "name": _gw_name,
             "serial": data.get("gateway_serial", ""),
         }
         if verbose:
             data["gateway"] = utils.unlistify(utils.strip_no_value([_gateway]))
         else:
-            data["gateway"] = None if not _gw else _gw.name or data["gateway_serial"]
+            data["gateway"] = _gw_name or data["gateway_serial"]
     _connected = {
-        "name": data.get("associated_device") if not hasattr(dev, "name") else dev.name,
+        "name": dev_names.get(data.get("associated_device"), data.get("associated_device")),
         "type": data.get("connected_device_type"),
         "serial": data.get("associated_device"),
         "mac": data.get("associated_device_mac"),
@@ -520,6 +529,18 @@ def _client_concat_associated_dev(
     return data
 
 
+def _clean_client(data: dict[str, Any], *, dev_names: dict[str, str], verbosity: int, keys: list[str] | None, max_keys: list[str], wired_network: bool) -> dict[str, Any]:
+    data = _client_concat_associated_dev(data, dev_names=dev_names, verbose=verbosity)
+    return dict(
+        short_value(
+            k,
+            f"wired ({data.get('interface_port', '?')})" if wired_network and k == "network" and data.get(k) == "NA" else data.get(k),
+        )
+        for k in keys or [*max_keys, *data.keys()]  # All keys if verbosity level exceeds what's defined
+        if k != "interface_port"  # it's collapsed into the network key, so don't need it as separate key
+    )
+
+
 def get_clients(
     data: list[dict],
     verbosity: int = 0,
@@ -581,19 +602,17 @@ def get_clients(
         key_order = verbosity_keys.get(verbosity) or [*verbosity_keys[max(verbosity_keys)], *[k for k in utils.all_keys(data) if k not in verbosity_keys[max(verbosity_keys)]]]
         data = utils.format_table(data, key_order=key_order)
 
-    data = [_client_concat_associated_dev(d, cache=cache, verbose=verbosity) for d in data]
-
-    data = [
-        dict(
-            short_value(
-                k,
-                f"wired ({data[idx].get('interface_port', '?')})" if d.get(k) == "NA" and k == "network" else d.get(k),
-            ) if not verbosity or format == "csv" else short_value(k, d.get(k))
-            for k in verbosity_keys.get(verbosity, [*verbosity_keys[max(verbosity_keys.keys())], *d.keys()])  # All keys if verbosity level exceeds what's defined
-            if k != "interface_port"  # it's collapsed into the network key, so don't need it as separate key
-        )
-        for idx, d in enumerate(data)
-    ]
+    # device names for connected device / gateway serials, resolved once rather than a cache lookup per client
+    dev_names = {} if not cache or not data else {dev.serial: dev.name for dev in cache.devices}
+    data = workers.map_records(
+        _clean_client,
+        data,
+        dev_names=dev_names,
+        verbosity=verbosity,
+        keys=verbosity_keys.get(verbosity),
+        max_keys=verbosity_keys[max(verbosity_keys)],
+        wired_network=not verbosity or format == "csv",
+    )
 
     data = utils.strip_no_value(data, aggressive=bool(verbosity and format not in TABULAR_FORMATS))
 
@@ -769,13 +788,9 @@ def get_devices(data: list[dict[str, Any]] | dict[str, Any], *, verbosity: int =
 
     data = sort_result_keys(data)
 
-    data = [
-        {k: v for k, v in inner.items() if k in verbosity_keys.get(verbosity, all_keys)}
-        for inner in data
-    ]
-
     _short_key["subscription_key"] = "subscription key"
-    data = simple_kv_formatter(data)
+    keep_keys = verbosity_keys.get(verbosity, all_keys)
+    data = simple_kv_formatter(data, strip_keys=[k for k in utils.all_keys(data) if k not in keep_keys])
 
     if filter_params or version:
         filter_rows = FilterRows(version=version, **filter_params)
@@ -810,7 +825,7 @@ def get_audit_logs(data: list[dict], cache_update_func: Callable = None, verbosi
     if not verbosity:
         data = [inner for inner in data if inner.get("user") != "periodic_system_default_app_task"]
 
-    data = [dict(short_value(k, d.get(k)) for k in field_order) for d in data]
+    data = workers.map_records(format_record, data, keys=field_order)
     data = utils.strip_no_value(data)
 
     idx, cache_list = 1, []
@@ -908,7 +923,7 @@ def get_event_logs(data: list[dict], cache_update_func: Callable = None) -> list
         if cache_list:
             cache_update_func(cache_list)
 
-    data = [dict(short_value(k, d[k]) for k in field_order if k in d) for d in data]
+    data = workers.map_records(format_record, data, keys=field_order, present_only=True)
     data = utils.strip_no_value(data)
 
     return data
@@ -1496,15 +1511,13 @@ def show_interfaces(data: list[dict] | dict, verbosity: int = 0, dev_type: DevTy
     # send all key/value pairs through formatters
     if verbosity == 0:
         key_order = verbosity_keys[verbosity]  # Only include keys defined for verbosity level 0
-        data = [
-            dict(short_value(k, d[k],) for k in key_order if k in d) for d in data
-        ]
+        data = workers.map_records(format_record, data, keys=key_order, present_only=True)
         data = utils.strip_no_value(data)
     else:
         all_keys = utils.all_keys(data)
         _ = [key_order.append(k) for k in all_keys if k not in key_order]  # append any additional keys in payload to end of key_order
         key_order = [k for k in key_order if k in all_keys]  # strip any keys that don't exist for any interfaces
-        data = [dict(short_value(k, d.get(k),) for k in key_order if k not in strip_keys) for d in data]
+        data = workers.map_records(format_record, data, keys=key_order, strip_keys=strip_keys)
         data = utils.strip_no_value(data, aggressive=verbosity == 1)
 
         # arrange output as dictionary keyed by the interface for verbose listings
@@ -1934,29 +1947,30 @@ def show_radios(data: list[dict[str, str | int]], band: RadioBandOptions | None
     return data
 
 
-def get_bssids(data: list[dict[str, str | int]], output_format: TableFormat = "rich", band: RadioBandOptions | None = None, ssid: str = None) -> list[dict[str, str | int]]:
-    key_order = ["name", "serial", "macaddr", "radio_bssids"]  # "swarm_id",
+def _ap_bssids(data: dict[str, Any], *, output_format: TableFormat, band: RadioBandOptions | None, ssid: str | None) -> list[dict[str, str | int]]:
     pretty_band = {0: "5Ghz", 1: "2.4Ghz", 2: "6Ghz"}
-    data = simple_kv_formatter(data, key_order=key_order)
+    ap = format_record(data, keys=["name", "serial", "macaddr", "radio_bssids"])  # "swarm_id",
+
+    ap_data = []
+    for radio in ap["radio bssids"]:
+        bssids = radio["bssids"] or [{"essid": None, "macaddr": radio["macaddr"]}]
+        if output_format == "rich":
+            ap_data += [
+                {"ap": f'{ap["name"]} [dim]({ap["serial"]})[/dim]', "band": pretty_band[radio["index"]], "ssid": r["essid"], "bssid": r["macaddr"]}
+                for r in bssids if (band is None or pretty_band[radio["index"]].removesuffix("Ghz") == band) and (ssid is None or r["essid"] == ssid)
+            ]
+        else:
+            ap_data += [
+                {**{k: v for k, v in ap.items() if "bssid" not in k}, "band": pretty_band[radio["index"]], "ssid": r["essid"], "bssid": r["macaddr"]}
+                for r in bssids if (band is None or pretty_band[radio["index"]].removesuffix("Ghz") == band) and (ssid is None or r["essid"] == ssid)
+            ]
 
-    data_out = []
-    for ap in data:
-        ap_data = []
-        for radio in ap["radio bssids"]:
-            bssids = radio["bssids"] or [{"essid": None, "macaddr": radio["macaddr"]}]
-            if output_format == "rich":
-                ap_data += [
-                    {"ap": f'{ap["name"]} [dim]({ap["serial"]})[/dim]', "band": pretty_band[radio["index"]], "ssid": r["essid"], "bssid": r["macaddr"]}
-                    for r in bssids if (band is None or pretty_band[radio["index"]].removesuffix("Ghz") == band) and (ssid is None or r["essid"] == ssid)
-                ]
-            else:
-                ap_data += [
-                    {**{k: v for k, v in ap.items() if "bssid" not in k}, "band": pretty_band[radio["index"]], "ssid": r["essid"], "bssid": r["macaddr"]}
-                    for r in bssids if (band is None or pretty_band[radio["index"]].removesuffix("Ghz") == band) and (ssid is None or r["essid"] == ssid)
-                ]
-        data_out += sorted(ap_data, key=lambda r: r["band"])
+    return sorted(ap_data, key=lambda r: r["band"])
 
-    return data_out
+
+def get_bssids(data: list[dict[str, str | int]], output_format: TableFormat = "rich", band: RadioBandOptions | None = None, ssid: str = None) -> list[dict[str, str | int]]:
+    data = workers.map_records(_ap_bssids, data, output_format=output_format, band=band, ssid=ssid)
+    return [bssid for ap_data in data for bssid in ap_data]
 
 
 def get_guests(data: list[dict[str, Any]], output_format: TableFormat = "yaml") -> list[dict[str, Any]]:
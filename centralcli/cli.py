@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import atexit
 import subprocess
 import sys
 from pathlib import Path
@@ -8,7 +9,7 @@ from time import sleep
 import typer
 
 from centralcli import api_clients, cache, common, config, log, render, utils
-from centralcli.client import BatchRequest
+from centralcli.client import BatchRequest, Session
 from centralcli.clitree import add, assign, caas, cancel, check, clone, convert, export, generate, kick, migrate, refresh, rename, test, ts, unassign, update, upgrade
 from centralcli.clitree import dev as clidev
 from centralcli.clitree.batch import batch
@@ -142,7 +143,7 @@ def move(
     if not group and not site:
         common.exit("Missing Required Argument, group and/or site is required.")
 
-    devices = [common.cache.get_dev_identifier(d, include_inventory=True, swack=True, silent=True, exit_on_fail=False) for d in device]
+    devices = common.cache.get_dev_identifiers(device, include_inventory=True, swack=True, silent=True, exit_on_fail=False)
     if not utils.strip_none(devices):
         common.exit("None of the devices provided were found.  Nothing to move.  Exiting...")
 
@@ -198,7 +199,7 @@ def remove(
 ) -> None:
     """Remove device(s) from a site."""
     devs = (d for d in devices if d != "site")
-    devices: list[CacheDevice] = [common.cache.get_dev_identifier(dev, swack=True) for dev in devs]
+    devices: list[CacheDevice] = common.cache.get_dev_identifiers(devs, swack=True)
     site: CacheSite = common.cache.get_site_identifier(site)
 
     render.econsole.print(f"Remov{'e' if not yes else 'ing'} {utils.summarize_list([dev.rich_help_text for dev in devices], color=None)}\n  from site [bright_green]{site.name}[/]")
@@ -235,7 +236,7 @@ def reboot(
 
     Use -S|--swarm to reboot the swarm associated with the specified device (The device can be any AP in the swarm)
     """
-    devs: list[CacheDevice] = [common.cache.get_dev_identifier(dev, swack=True) for dev in devices]
+    devs: list[CacheDevice] = common.cache.get_dev_identifiers(devices, swack=True)
 
     batch_reqs, confirm_msgs = [], []
     _confirm_pfx = "Reboot:" if not yes else "Rebooting:"
@@ -596,7 +597,7 @@ def unarchive(
     if config.glp.ok:
         return common.batch_archive_unarchive_devices_glp([{"serial": s} for s in serials], yes=True, operation="unarchive")
 
-    _serials: list[CacheDevice | CacheInvDevice | str] = [common.cache.get_dev_identifier(dev, silent=True, retry=False, include_inventory=True, exit_on_fail=False) or dev for dev in serials]
+    _serials: list[CacheDevice | CacheInvDevice | str] = [d or dev for d, dev in zip(common.cache.get_dev_identifiers(serials, silent=True, retry=False, include_inventory=True, exit_on_fail=False), serials)]
 
     word = "device" if len(_serials) == 1 else f"{len(_serials)} devices"
     _msg_devs = utils.summarize_list(_serials).lstrip('\n')
@@ -688,7 +689,7 @@ def renew_license(
 
     raise NotImplementedError()
     from centralcli.cache import CacheInvDevice
-    devices = [common.cache.get_dev_identifier(d) for d in device]
+    devices = common.cache.get_dev_identifiers(device)
     inv_data = [CacheInvDevice(common.cache.inventory_by_serial[s]) for s in [s.serial for s in devices]]
     calls_by_sub = {}
     dev_types = []
@@ -757,6 +758,7 @@ def callback(
     Aruba Central API CLI.  A CLI for interacting with Aruba Central APIs.
 
     Use [cyan]--raw[/] which is supported globally, to see the raw unformatted response from Aruba Central.
+    Use [cyan]--no-cache[/] which is supported globally, to bypass cached responses (see [cyan]response_cache[/] in the config).
     Append [cyan]--again[/] to any command to re-display the output of the [bright_green]last[/] command from local cache.
        - This is intended for use with up arrow. It's the equivalent of [cyan]cencli show last[/].
        - Ignores the command on the command line and converts it to [cyan]cencli show last[/]
@@ -769,6 +771,8 @@ def callback(
 
 
 log.debugv(f'[cyan]cencli[/] called with Arguments: {" ".join(sys.argv[1:])}')
+if config.debug:
+    atexit.register(Session.log_request_stats)
 
 if __name__ == "__main__":
     app()
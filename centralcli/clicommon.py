@@ -40,11 +40,12 @@ from centralcli.strings import emoji
 from centralcli.utils import ToBool
 from centralcli.cache.sqlite import DBAction
 
-from . import APIClients, api_clients as _api_clients
+from . import APIClients, api_clients as _api_clients, onboard
 from .client import BatchRequest, Session
 from .environment import env, env_var
 from .models.common import APUpdate, APUpdates
 from .models.imports import ImportDevices
+from .onboard import Onboarding
 from .response import BatchResponse, Response
 from .ws_client import follow_logs
 
@@ -61,6 +62,14 @@ MsgType = Literal["initial", "previous", "forgot", "will_forget", "previous_will
 api = _api_clients.classic
 
 
+def _onboard_progress(onboarding: Onboarding) -> None:
+    counts = onboarding.counts()
+    render.econsole.print(
+        f"Onboarding: [bright_green]{counts[onboard.DONE]}[/] complete, [red]{counts[onboard.FAILED]}[/] failed, "
+        f"{', '.join([f'[cyan]{counts[stage]}[/] {stage}' for stage in onboard.STAGES])} pending of {len(onboarding.devices)} devices."
+    )
+
+
 @dataclass
 class BuiltRequests:
     requests: list[BatchRequest] = field(default_factory=list)
@@ -1281,7 +1290,18 @@ class CLICommon:
 
         glp_api = api_clients.glp
         add_data = [{k: v for k, v in dev.items() if k != "subscription"} for dev in import_devs.model_dump()]  # strip the subscription from the add, as it's whatever the user put in the import.  We send it in the update below where it is flipped to the necessary subscription.id
-        if not manual_flow:
+        onboarding = None
+        if not manual_flow and len(add_data) > onboard.CHUNK_SIZE:  # large imports stream through add -> service -> subscription assignment in chunks
+            onboard_data = [{**dev, "subscription": import_dev.sub and import_dev.sub.id} for dev, import_dev in zip(add_data, import_devs)]
+            onboarding = Onboarding.plan(
+                onboard_data,
+                application_id=self.cache.my_service.id,
+                region=self.cache.my_service.region,
+                tags=tags,
+                file=config.outdir / f"onboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            )
+            add_resp = self.run_onboarding(onboarding, api_clients=api_clients)
+        elif not manual_flow:
             add_resp: list[Response] = glp_api.session.request(glp_api.devices.add_devices, devices=add_data, application_id=self.cache.my_service.id, region=self.cache.my_service.region, cache=self.cache)
             if any([r.exit_code == 1 for r in add_resp]):  # exit_code 1 from devices.add_devices indicates iventory call has already been attempted, add failed.
                 return add_resp
@@ -1311,9 +1331,10 @@ class CLICommon:
             else:
                 self.exit(f"Unable to fetch [green]GreenLake[/] ids for [bold]any[/] of the {len(serials)} devices.  Aborting... Verify Device addition in [green]GreenLake[/] Inventory")
 
-        # pre-provision devices to groups / classic API
+        # pre-provision devices to groups / classic API (onboarding pre-provisions devices as they complete, see run_onboarding)
         to_group, group_resp = {}, []
-        [utils.update_dict(to_group, d["group"], d["serial"]) for d in data if "group" in d and d["group"]]
+        if onboarding is None:
+            [utils.update_dict(to_group, d["group"], d["serial"]) for d in data if "group" in d and d["group"]]
         if to_group:
             api = api_clients.classic
             group_reqs = [BatchRequest(api.configuration.preprovision_device_to_group, group, serials) for group, serials in to_group.items()]
@@ -1321,7 +1342,7 @@ class CLICommon:
 
         # cache update.  We query for the serials that were added vs parsing the async response to determine if it's OK to continue as we need the device id and an Add failure could indicate already claimed, which doesn't prevent us from continuing.
         update_resp = []
-        if tags or subscription or import_devs.has_subs or import_devs.has_tags:
+        if onboarding is None and (tags or subscription or import_devs.has_subs or import_devs.has_tags):  # onboarding assigns subscriptions and tags
             serial_numbers = [d["serial"] for d in data]
             for _ in range(3):
                 inv_devs = [self.cache.get_inv_identifier(s, serial_numbers=tuple(serial_numbers), exit_on_fail=False, silent=True) for s in serial_numbers]
@@ -1339,6 +1360,44 @@ class CLICommon:
 
         return [*add_resp, *update_resp, *group_resp]
 
+    def run_onboarding(self, onboarding: Onboarding, *, api_clients: APIClients = None) -> list[Response]:
+        """Run (or resume) pipelined onboarding of devices to GreenLake, checkpointing progress to the onboarding state file.
+
+        Devices that completed onboarding (in this or a previous run) are then pre-provisioned to their group.
+        """
+        api_clients = api_clients or _api_clients
+        glp_api = api_clients.glp
+        render.econsole.print(f"Onboarding state is saved to [cyan]{onboarding.file}[/]")
+        onboarding.save()
+        try:
+            resp: list[Response] = glp_api.session.request(onboarding.run, glp_api, cache=self.cache, on_update=_onboard_progress)
+        except KeyboardInterrupt:  # pragma: no cover
+            self.exit(f"Onboarding interrupted.  Use [cyan]cencli batch add devices --resume {onboarding.file}[/] to resume.")
+
+        failed = [dev for dev in onboarding.devices.values() if dev.state == onboard.FAILED]
+        if failed:
+            log.warning(
+                f"{len(failed)} of {len(onboarding.devices)} devices failed onboarding: {utils.color([f'{d.serial} ({d.detail})' for d in failed[:10]], color_str='cyan')}{'...' if len(failed) > 10 else ''}  "
+                f"Use [cyan]cencli batch add devices --resume {onboarding.file} --retry-failed[/] to retry.",
+                caption=True,
+                log=True
+            )
+            if resp:
+                resp[-1].exit_code = 1
+
+        group_resp = []
+        to_group = onboarding.pre_provision()
+        if to_group:
+            api = api_clients.classic
+            group_reqs = [BatchRequest(api.configuration.preprovision_device_to_group, group, serials) for group, serials in to_group.items()]
+            group_resp = api.session.batch_request(group_reqs)
+            for serials, r in zip(to_group.values(), group_resp):
+                for serial in serials if r.ok else []:
+                    onboarding.devices[serial].pre_provisioned = True
+            onboarding.save()
+
+        return [*(resp or [Response(error="No devices were onboarded", ok=False)]), *group_resp]
+
     def batch_add_devices(self, import_file: Path = None, data: list[dict[str, Any]] | None = None, yes: int = None, *, tags: dict[str, str] = None, subscription: str = None, migrate: bool = False, api_clients: APIClients = None, manual_flow: bool = False, no_pre_prov: bool = False) -> List[Response]:
         if api_clients is not None:
             global config
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import copy
 import sys
 import time
-from collections.abc import Callable
+from collections import Counter, deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
 from functools import wraps
 from pathlib import Path
 from types import TracebackType
@@ -20,14 +22,18 @@ from rich.console import Console
 from rich.markup import escape
 from yarl import URL
 
-from . import cleaner, log, utils
+from . import cleaner, codec, log, utils
 from . import config as cfg
+from .auth import AuthManager
 from .cnx.base import NewCentralBase
+from .coalesce import Coalescer
 from .config import Config
 from .constants import STRIP_KEYS, lib_to_api
 from .exceptions import InvalidConfigException
+from .httpcache import MUTATING_METHODS, ResponseCache
 from .render import Spinner
-from .response import Response
+from .response import PageAccumulator, Response
+from .runner import PooledContext, get_client, runner
 from .typedefs import UNSET, Method, StrOrURL, typed_lru_cache
 
 
@@ -39,6 +45,22 @@ DEFAULT_SPIN_TXT = "\U0001f4a9 DEFAULT_SPIN_TXT \U0001f4a9"  # should never see
 MAX_CALLS_PER_CHUNK = 7
 econsole = Console(stderr=True)
 INIT_TS = time.monotonic()
+REQUEST_JOURNAL_SIZE = 5_000  # LoggedRequests retained per journal, older requests are dropped (stats are retained)
+RL_LOG_SIZE = 5_000
+response_cache = ResponseCache(cfg)
+coalescer: Coalescer[Response | list[Response]] = Coalescer()
+IDEMPOTENT_METHODS = ("GET", "HEAD")  # identical requests in flight concurrently share a single call
+LATENCY_SAMPLES = 500  # most recent latencies retained per endpoint for p50/p95
+
+
+def _share_response(resp: Response | list[Response]) -> Response | list[Response]:
+    """Copy of a coalesced Response for each caller that joined the in-flight call, callers commonly update resp.output."""
+    if isinstance(resp, list):
+        return [_share_response(r) for r in resp]
+    shared = object.__new__(type(resp))  # not copy.copy, Response.__getattr__ recurses on an instance without output
+    shared.__dict__.update(resp.__dict__)
+    shared.output, shared.raw = copy.deepcopy(resp.output), copy.deepcopy(resp.raw)
+    return shared
 
 
 class LoggedRequests:
@@ -49,6 +71,7 @@ class LoggedRequests:
         self.ok = ok
         self.reason = None
         self.status = None
+        self.elapsed = None
         self.remain_day = None
         self.remain_sec = None
         self.remain_min = None
@@ -56,17 +79,124 @@ class LoggedRequests:
     def __repr__(self):
         return f"<{self.__module__}.{type(self).__name__} ({self.reason or ('OK' if self.ok else '?')}) object at {hex(id(self))}>"
 
-    def update(self, response: ClientResponse):
+    @property
+    def path(self) -> str:
+        return self.url.split("?")[0]
+
+    def update(self, response: ClientResponse, elapsed: float = None):
         rh = response.headers
         self.reason = response.reason
         self.ok = response.ok
         self.status = response.status
+        self.elapsed = elapsed
         self.remain_day = int(f"{rh.get('X-RateLimit-Remaining-day', 0)}")
         self.remain_sec = int(f"{rh.get('X-RateLimit-Remaining-second', 0)}")
         self.remain_min = int(f"{rh.get('ratelimit-remaining', 0)}")
         return self
 
 
+class EndpointStats:
+    """Aggregated stats for requests to a single endpoint (method + path)."""
+    def __init__(self, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+        self.count = 0
+        self.failed = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.latency: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def __repr__(self) -> str:  # pragma: no cover  used for debug
+        return f"<{self.__module__}.{type(self).__name__} ([{self.method}]{self.path} {self.count}) object at {hex(id(self))}>"
+
+    def add(self, request: LoggedRequests, retry: bool = False) -> None:
+        self.count += 1
+        self.failed += int(request.ok is False)
+        self.retries += int(retry)
+        self.rate_limited += int(request.status == 429)
+        if request.elapsed is not None:
+            self.latency.append(request.elapsed)
+
+    def percentile(self, pct: int) -> float | None:
+        if not self.latency:
+            return None
+        samples = sorted(self.latency)
+        return samples[min(len(samples) - 1, round(pct / 100 * (len(samples) - 1)))]
+
+    def as_dict(self) -> dict[str, str | int | float]:
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            "method": self.method,
+            "path": self.path,
+            "count": self.count,
+            "failed": self.failed,
+            "retries": self.retries,
+            "429s": self.rate_limited,
+            "p50": None if p50 is None else round(p50, 3),
+            "p95": None if p95 is None else round(p95, 3),
+        }
+
+
+class RequestJournal:
+    """Bounded journal of LoggedRequests, with per url try counters and per endpoint stats.
+
+    Retains the most recent maxlen requests, so long running processes (webhook watcher/hook proxy) don't grow without bound.
+    Try counts (used to determine if a request is a retry) are tracked for the requests retained in the journal.
+
+    Args:
+        maxlen (int, optional): Max number of requests retained. Defaults to REQUEST_JOURNAL_SIZE.
+    """
+    def __init__(self, maxlen: int = REQUEST_JOURNAL_SIZE) -> None:
+        self._requests: deque[LoggedRequests] = deque(maxlen=maxlen)
+        self._tries: Counter[str] = Counter()
+        self.stats: dict[tuple[str, str], EndpointStats] = {}
+        self.total = 0
+
+    def __repr__(self) -> str:  # pragma: no cover  used for debug
+        return f"<{self.__module__}.{type(self).__name__} ({len(self)}/{self.total} requests) object at {hex(id(self))}>"
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def __bool__(self) -> bool:
+        return bool(self._requests)
+
+    def __iter__(self) -> Iterator[LoggedRequests]:
+        return iter(self._requests)
+
+    def __getitem__(self, idx: int) -> LoggedRequests:
+        return self._requests[idx]
+
+    def tries(self, url: str) -> int:
+        """Number of requests to url (path + query) in the journal."""
+        return self._tries[url]
+
+    def append(self, request: LoggedRequests) -> None:
+        if len(self._requests) == self._requests.maxlen:
+            evicted = self._requests[0].url
+            self._tries[evicted] -= 1
+            if not self._tries[evicted]:
+                del self._tries[evicted]
+
+        retry = request.url in self._tries
+        self._requests.append(request)
+        self._tries[request.url] += 1
+        self.total += 1
+
+        key = (request.method, request.path)
+        if key not in self.stats:
+            self.stats[key] = EndpointStats(*key)
+        self.stats[key].add(request, retry=retry)
+
+    def extend(self, requests: list[LoggedRequests]) -> None:
+        for request in requests:
+            self.append(request)
+
+    def summary(self) -> list[dict[str, str | int | float]]:
+        """Per endpoint stats (count, failed, retries, 429s, p50/p95 latency), busiest endpoint first."""
+        return [stat.as_dict() for stat in sorted(self.stats.values(), key=lambda s: s.count, reverse=True)]
+
+
 class BatchRequest:
     def __init__(self, func: Callable, *args, **kwargs) -> None:
         """Constructor object for for api requests.
@@ -87,9 +217,9 @@ class BatchRequest:
         return f"<{self.__module__}.{type(self).__name__} ({self.func.__name__}) object at {hex(id(self))}>"
 
 
-class Session():
-    requests: list[LoggedRequests] = []
-    glp_requests: list[LoggedRequests] = []
+class Session(PooledContext):
+    requests: RequestJournal = RequestJournal()
+    glp_requests: RequestJournal = RequestJournal()
 
     def __init__(
         self,
@@ -115,7 +245,7 @@ class Session():
         self.throttle: int = 0
         self.spinner = Spinner("Collecting Data...")
         self.updated_at = time.monotonic()
-        self.rl_log = [f"{self.updated_at - INIT_TS:.2f} [INIT] {type(self).__name__} object at {hex(id(self))}"]
+        self.rl_log: deque[str] = deque([f"{self.updated_at - INIT_TS:.2f} [INIT] {type(self).__name__} object at {hex(id(self))}"], maxlen=RL_LOG_SIZE)
         self.BatchRequest = BatchRequest
         self.running_spinners: List[str] = []  # TODO this should probably be a class attribute of the Spinner class, which is already a singleton
         self.is_cnx = cnx if isinstance(cnx, bool) else (self.base_url and ("greenlake" in self.base_url or ".api.central." in self.base_url))
@@ -134,20 +264,58 @@ class Session():
         return kwargs
 
     @property
-    def auth(self):
-        return self.get_conn_from_file(self.config.workspace) if not self.is_cnx else self.get_glp_conn_from_file()
+    def auth(self) -> ArubaCentralBase | NewCentralBase:
+        return self.auth_manager.auth
+
+    @property
+    def auth_manager(self) -> AuthManager:
+        """The (cached) auth object and token refresh coordinator for the current workspace."""
+        return AuthManager.get(
+            self.config.workspace,
+            lambda: self.get_conn_from_file(self.config.workspace) if not self.is_cnx else self.get_glp_conn_from_file(),
+            self._token_expires,
+            cnx=self.is_cnx,
+        )
+
+    @staticmethod
+    def _token_expires(auth: ArubaCentralBase | NewCentralBase) -> float | None:
+        if isinstance(auth, NewCentralBase):
+            return auth.expires
+        return auth.central_info.get("token", {}).get("expires_at")
 
     @classmethod
     def requests_clear(cls):
-        cls.requests = []  # used by pytest
-        cls.glp_requests = []
+        cls.requests = RequestJournal()  # used by pytest
+        cls.glp_requests = RequestJournal()
 
     @classmethod
     def requests_append(cls, requests: LoggedRequests | list[LoggedRequests], is_cnx: bool = False):
         if not is_cnx:
-            cls.requests += utils.listify(requests)
+            cls.requests.extend(utils.listify(requests))
         else:
-            cls.glp_requests += utils.listify(requests)
+            cls.glp_requests.extend(utils.listify(requests))
+
+    @classmethod
+    def request_stats(cls) -> list[dict[str, str | int | float]]:
+        """Aggregated per endpoint request stats for all requests (classic and GreenLake/new central) performed by this process.
+
+        Returns:
+            list[dict[str, str | int | float]]: Stats (count, failed, retries, 429s, p50/p95 latency in seconds) for each endpoint.
+        """
+        return [*cls.requests.summary(), *cls.glp_requests.summary()]
+
+    @classmethod
+    def log_request_stats(cls) -> None:
+        """Log a summary of requests performed by endpoint (used for --debug)."""
+        stats = cls.request_stats()
+        if not stats:
+            return
+
+        lines = [
+            f"  [{s['method']}]{s['path']} count: {s['count']} failed: {s['failed']} retries: {s['retries']} 429s: {s['429s']} p50: {s['p50']}s p95: {s['p95']}s"
+            for s in stats
+        ]
+        log.debug("API request summary by endpoint:\n" + "\n".join(lines))
 
     def get_glp_conn_from_file(self) -> NewCentralBase:
         """Creates an instance of NewCentralBase based on config file.
@@ -200,6 +368,8 @@ class Session():
                 if token_cache.stat().st_mtime > self.config.file.stat().st_mtime:
                     conn.central_info["retry_token"] = conn.central_info["token"]
                     conn.central_info["token"] = cache_token
+                    if cache_token.get("expires_in"):  # token cache is written when the token is issued
+                        conn.central_info["token"] = {**cache_token, "expires_at": token_cache.stat().st_mtime + cache_token["expires_in"]}
                 else:
                     conn.central_info["retry_token"] = cache_token
 
@@ -225,27 +395,36 @@ class Session():
 
     @property
     def headers(self) -> Dict[str, str]:
-        headers = DEFAULT_HEADERS
-        if self.auth is not None:
-            headers["authorization"] = f"Bearer {self.auth.central_info['token']['access_token']}"
+        headers = {**DEFAULT_HEADERS}
+        auth = self.auth
+        if auth is not None:
+            headers["authorization"] = f"Bearer {auth.central_info['token']['access_token']}"
 
         return headers
 
-    async def __aenter__(self) -> ClientSession:
-        return self.aio_session
-
     async def __aexit__(
         self,
         exc_type: Optional[Type[BaseException]],
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
+        await super().__aexit__(exc_type, exc_val, exc_tb)
         await self.close()
 
     async def close(self) -> None:
         if self._aio_session is not None and not self._aio_session.closed:
             await self._aio_session.close()
 
+    @asynccontextmanager
+    async def _client_session(self) -> AsyncIterator[ClientSession]:
+        """The pooled aiohttp session if calls are pooled (persistent loop or async with), otherwise a session for this call."""
+        client = get_client((self.base_url, self.total_timeout, self.limit_per_host), lambda: ClientSession(base_url=self.base_url, **self.session_kwargs))
+        if client is not None:
+            yield client
+        else:
+            async with ClientSession(base_url=self.base_url, **self.session_kwargs) as client:
+                yield client
+
     def _get_spin_text(self, spin_txt: str = None):
         if spin_txt:
             if "retry" in spin_txt:
@@ -300,6 +479,7 @@ class Session():
 
     async def exec_api_call(self, url: str, data: dict = None, json_data: dict | list = None,
                             method: str = "GET", headers: dict = {}, params: dict = {}, **kwargs) -> Response:
+        await self.auth_manager.ensure_fresh(self._refresh)
         auth = self.auth
         resp = None
         _url = URL(url).with_query(params)
@@ -333,14 +513,14 @@ class Session():
             if self.config.debugv:
                 asyncio.create_task(self.vlog_api_req(method=method, url=url, params=params, data=data, json_data=json_data, kwargs=kwargs))
 
-            headers = self.headers if not headers else {**self.headers, **headers}
+            _headers = self.headers if not headers else {**self.headers, **headers}
             try:
                 req_log = LoggedRequests(_url.path_qs, method)
 
                 _start = time.perf_counter()
                 now = time.perf_counter() - INIT_TS
 
-                _try_cnt = [u.url for u in self.requests].count(_url.path_qs) + 1
+                _try_cnt = (type(self).requests if not self.is_cnx else type(self).glp_requests).tries(_url.path_qs) + 1
                 self.rl_log += [
                     f'{now:.2f} [{method}]{_url.path_qs} Try: {_try_cnt}'
                 ]
@@ -348,22 +528,22 @@ class Session():
                 self.spinner.start(self._get_spin_text(spin_txt_run), spinner="dots")
                 self.req_cnt += 1  # TODO may have deprecated now that logging requests
 
-                async with ClientSession(base_url=self.base_url, **self.session_kwargs) as client:  # TODO find out what impact is of opening/closing sessions for every call.  Common aio_session property is being stepped on by multiple calls/async threads
+                async with self._client_session() as client:
                     resp = await client.request(
                         method=method,
                         url=url,
                         params=params,
                         data=data,
                         json=json_data,
-                        headers=headers,
+                        headers=_headers,
                         ssl=self.ssl,
                         **kwargs
                     )
                     elapsed = time.perf_counter() - _start
-                    self.requests_append(req_log.update(resp), is_cnx=self.is_cnx)
+                    self.requests_append(req_log.update(resp, elapsed=elapsed), is_cnx=self.is_cnx)
 
                     try:
-                        output = await resp.json()
+                        output = await resp.json(loads=codec.loads)
                         try:
                             raw_output = output.copy()
                         except AttributeError:
@@ -371,7 +551,7 @@ class Session():
 
                         # Strip outer key sent by central
                         output = cleaner.strip_outer_keys(output)
-                    except (json.decoder.JSONDecodeError, ContentTypeError):
+                    except (codec.JSONDecodeError, ContentTypeError):
                         output = raw_output = await resp.text()
 
                     mock_key_append = utils.get_mock_append(method, json_data=json_data, headers=resp.headers)  # for testing w/ mock responses
@@ -400,11 +580,11 @@ class Session():
 
                 if resp.status == 401:
                     spin_txt_retry = "(retry after token refresh)"
-                    self.refresh_token()
+                    await self.auth_manager.refresh(self._refresh, stale_token=_headers.get("authorization", "").removeprefix("Bearer "))
                 elif "errorCode" in resp.raw and "HPE_GL_ERROR" in resp.raw["errorCode"] and "signature has expired" in resp.raw.get("message", "").lower():
                     spin_txt_retry = "(retry after token refresh)"
                     if hasattr(self.auth, "handle_expired_token"):
-                        self.auth.handle_expired_token()
+                        await self.auth_manager.refresh(self._refresh, stale_token=_headers.get("authorization", "").removeprefix("Bearer "))
                 elif resp.status == 500:
                     if url == "/configuration/v1/devices/move" and "group move has been initiated" in resp.output.get("description", ""):
                         break  # API-FLAW move endpoint returns 500 to indicate success for gw move
@@ -525,6 +705,34 @@ class Session():
         Returns:
             Response: CentralAPI Response object
         """
+        async def call() -> Response | list[Response]:
+            return await self._api_call(url, data=data, json_data=json_data, method=method, headers=headers, params=params, callback=callback, callback_kwargs=callback_kwargs, count=count, **kwargs)
+
+        ttl = response_cache.ttl(method, url if str(url).startswith("http") else f"{self.base_url or ''}{url}", headers=headers)
+        coalesce = method.upper() in IDEMPOTENT_METHODS and data is None and json_data is None and callback is None
+        if not ttl and not coalesce:
+            try:
+                return await call()
+            finally:  # the call may have changed what a cached GET of the path would return
+                if method.upper() in MUTATING_METHODS and response_cache.enabled:
+                    await asyncio.to_thread(response_cache.invalidate, method, url)
+
+        key = response_cache.key(method, url if self.base_url is None else f"{self.base_url}{url}", params=params, headers=headers, workspace=self.config.workspace, count=count, **kwargs)
+
+        async def cached_call() -> Response | list[Response]:  # sqlite reads/writes are done in a thread, to not block the event loop
+            resp = await asyncio.to_thread(response_cache.get, key)
+            if resp is None:
+                resp = await call()
+                if isinstance(resp, Response) and resp.ok:
+                    await asyncio.to_thread(response_cache.set, key, resp, ttl)
+            return resp
+
+        func = call if not ttl else cached_call
+        return await func() if not coalesce else await coalescer.do(key, func, share=_share_response)
+
+    async def _api_call(self, url: StrOrURL, data: dict = None, json_data: dict | list = None,
+                        method: str = "GET", headers: dict = {}, params: dict = {}, callback: Callable = None,
+                        callback_kwargs: Any = {}, count: int = None, **kwargs: Any) -> Response | list[Response]:
 
         # TODO cleanup, if we do strip_none here can remove from calling funcs.
         params = params and utils.strip_none(params) or {}
@@ -615,8 +823,7 @@ class Session():
                         log_sfx = "" if len(failures) > 1 else f"?{offset_key}={failures[-1].url.query.get(offset_key)}&limit={failures[-1].url.query.get('limit')}..."
                         log.error(f"Output incomplete.  {len(failures)} failure occured: [{failures[-1].method}] {failures[-1].url.path}{log_sfx}", caption=True)
 
-                    for res in successful:  # Combines responses into a sigle Response object
-                        r += res
+                    r = PageAccumulator(r).extend(successful).merge()  # Combines responses into a single Response object
                     break
 
             _limit = params.get("limit", 0)
@@ -694,7 +901,7 @@ class Session():
                     auth.storeToken(token)
                     self.get_conn_from_file.cache_clear()  # clear lru_cache
                     log.debug("get_conn_from_file lru_cache cleared")
-                    auth.central_info["token"] = token
+                    auth.central_info["token"] = token if not token.get("expires_in") else {**token, "expires_at": time.time() + token["expires_in"]}
                     if not silent:
                         self.spinner.stop()
                     break
@@ -702,7 +909,6 @@ class Session():
                 log.exception(f"Attempt to refresh token returned {e.__class__.__name__} {e}")
 
         if token:
-            self.headers["authorization"] = f"Bearer {self.auth.central_info['token']['access_token']}"
             if not silent:
                 self.spinner.succeed()
         elif not silent:
@@ -748,6 +954,10 @@ class Session():
             token_data = self.get_token_from_user()
             return self._refresh_token(token_data)
 
+    def _refresh(self) -> bool:
+        """Blocking token refresh used by the AuthManager (ran in a worker thread)."""
+        return self.refresh_token()
+
     def get_token_from_user(self) -> dict:  # pragma: no cover  requires tty
         """Handle invalid or expired tokens
 
@@ -793,8 +1003,7 @@ class Session():
 
     async def _request(self, func: Callable, *args, **kwargs) -> Response | list[Response]:
         self.remaining_calls += 1
-        async with ClientSession(base_url=self.base_url, **self.session_kwargs) as self.aio_session:
-            return await func(*args, **kwargs)
+        return await func(*args, **kwargs)
 
     def request(self, func: Callable, *args, **kwargs) -> Response | list[Response]:
         """non async to async wrapper for all API calls
@@ -806,7 +1015,7 @@ class Session():
             centralcli.response.Response object
         """
         log.debug(f"sending request to {func.__name__} with args {args}, kwargs {kwargs}")
-        return asyncio.run(self._request(func, *args, **kwargs))
+        return runner.run(self._request(func, *args, **kwargs))
 
     async def _semaphore_batch_request(self, api_calls: List[BatchRequest], continue_on_fail: bool = False, retry_failed: bool = False) -> List[Response]:
         self.remaining_calls += len(api_calls)
@@ -986,7 +1195,7 @@ class Session():
         Returns:
             List[Response]: List of centralcli.response.Response objects.
         """
-        return asyncio.run(self._batch_request(api_calls, continue_on_fail=continue_on_fail, retry_failed=retry_failed))
+        return runner.run(self._batch_request(api_calls, continue_on_fail=continue_on_fail, retry_failed=retry_failed))
 
     def build_url(func: Callable):
         @wraps(func)
@@ -123,7 +123,7 @@ def label_(
     """Assign label to device(s)"""
     api = api_clients.classic
     label: CacheLabel = common.cache.get_label_identifier(label)
-    devices: list[CacheDevice] = [common.cache.get_dev_identifier(dev) for dev in devices]
+    devices: list[CacheDevice] = common.cache.get_dev_identifiers(devices)
 
     _msg = f"Assign [bright_green]{label.name}[/bright_green] to"
     _msg = f"{_msg} {utils.summarize_list(devices, color=None)}"
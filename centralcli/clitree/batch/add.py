@@ -13,6 +13,7 @@ from rich.markup import escape
 from centralcli import api_clients, cleaner, common, log, render, utils
 from centralcli.constants import APIAction
 from centralcli.models.imports import ImportMACs, ImportMPSKs
+from centralcli.onboard import DONE, FAILED, Onboarding
 
 from . import examples
 
@@ -146,6 +147,8 @@ def devices(
         help=f"Ignore group if found in import file.  Do not pre-provision devices to group. {render.help_block('Devices will be pre-provisioned to group if defined in import')}",
         envvar="CENCLI_NO_PRE_PROVISION",
     ),
+    resume: Path = typer.Option(None, "--resume", help="Resume an interrupted onboarding from its state file", exists=True, dir_okay=False, show_default=False, hidden=not common.cache.config.glp.ok,),
+    retry_failed: bool = typer.Option(False, "--retry-failed", help="Retry devices that failed onboarding [dim italic](applies to --resume)[/]", hidden=not common.cache.config.glp.ok,),
     yes: int = common.options.yes_int,
     debug: bool = common.options.debug,
     default: bool = common.options.default,
@@ -154,11 +157,24 @@ def devices(
     """Batch add devices based on data from required import file.
 
     Use [cyan]cencli batch add devices --example[/] to see example import file formats.
+
+    Large imports are onboarded in chunks, with progress saved to a state file.  Use [cyan]--resume <file>[/] to resume an interrupted onboarding.
     """
     if show_example:
         render.console.print(examples.add_devices)
         return
 
+    if resume:
+        onboarding = Onboarding.load(resume)
+        if retry_failed:
+            onboarding.retry_failed()
+        counts = onboarding.counts()
+        render.econsole.print(f"Resum{'e' if not yes else 'ing'} onboarding of [cyan]{len(onboarding.devices) - counts[DONE] - counts[FAILED]}[/] devices from [cyan]{resume.name}[/].")
+        render.confirm(yes)
+        resp = common.run_onboarding(onboarding)
+        render.display_results(resp, tablefmt="action", title="Batch Add devices",)
+        return
+
     if not import_file:
         common.exit(render._batch_invalid_msg("cencli batch add devices [OPTIONS] [IMPORT_FILE]"))
 
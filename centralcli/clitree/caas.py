@@ -37,6 +37,7 @@ from rich.console import Console
 from centralcli import api_clients, caas, cache, cleaner, common, config, constants, render, utils
 from centralcli.client import BatchRequest
 from centralcli.objects.cache import CacheDevice, CacheGroup, CacheSite
+from centralcli.response import Response
 
 api = api_clients.classic
 iden_meta = constants.iden_meta
@@ -55,20 +56,33 @@ def bulk_edit(
     debug: bool = common.options.debug,
     workspace: str = common.options.workspace,
 ) -> None:  # pragma: no cover
-    """Import and Apply settings from bulk-edit.csv"""
+    """Import and Apply settings from bulk-edit.csv
+
+    Commands are pushed to all devices concurrently, results are displayed as each device completes.
+    Devices that fail are written to a retry file [dim italic](bulk-edit file with only the failed devices)[/].
+    """
     caasapi = caas.CaasAPI()
-    cmds = caasapi.build_cmds(file=input_file)
+    caasapi.build_cmds(file=input_file)
     # TODO log cli
-    if cmds:
+    cmds_by_dev = {f"{caasapi.data[dev]['_common'].get('group')}/{dev}": cmds for dev, cmds in caasapi.dev_cmds.items() if cmds}
+    if cmds_by_dev:
         render.console.print(f"[bright_green]Send{'ing' if yes else ''} Commands[/]:")
-        render.console.print("\n".join(cmds))
+        for group_dev, cmds in cmds_by_dev.items():
+            render.console.print(f"[cyan]{group_dev}[/]:")
+            render.console.print("\n".join(cmds))
 
         render.confirm(yes)
-        for dev in caasapi.data:
-            group_dev = f"{caasapi.data[dev]['_common'].get('group')}/{dev}"
-            resp = api.session.request(caasapi.send_commands, group_dev, cmds)
-            # caas.eval_caas_response(resp)  # TODO test below
-            render.display_results(resp, cleaner=cleaner.parse_caas_response)
+
+        def _display(group_dev: str, resp: Response) -> None:
+            render.console.print(f"[{'bright_green' if caas.push_ok(resp) else 'red'}]{group_dev}[/]:")
+            render.display_results(resp, cleaner=cleaner.parse_caas_response, exit_on_fail=False)
+
+        resps = api.session.request(caasapi.push_commands, cmds_by_dev, on_result=_display)
+        failed = [group_dev.split("/")[-1] for group_dev, resp in resps.items() if not caas.push_ok(resp)]
+        if failed:
+            retry_file = caasapi.write_retry_file(input_file, failed)
+            common.exit(f"Push failed for [red]{len(failed)}[/] of {len(cmds_by_dev)} devices.  Use [cyan]cencli caas bulk-edit {retry_file}[/] to retry the failed devices.")
+        render.console.print(f"[bright_green]Success[/]: Commands pushed to {len(cmds_by_dev)} devices.")
 
 
 # FIXME
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import asyncio
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, List
+from importlib.util import find_spec
+from string import hexdigits
+from typing import Any, Callable, Iterable, Iterator, List, Sequence
 
 import typer
 from rich import print
@@ -15,11 +16,19 @@ from centralcli import api_clients, caas, common, config, log, render, utils
 from centralcli.classic.api import ClassicAPI
 from centralcli.client import BatchRequest
 from centralcli.constants import ExportDevType
+from centralcli.models.sql import Site
 from centralcli.objects.cache import CacheDevice, CacheGroup, CacheSite
 from centralcli.render import Spinner
 from centralcli.response import BatchResponse, RateLimit, Response
 from centralcli.strings import Warnings
 
+if find_spec("numpy"):
+    import numpy as np
+    NUMPY = True
+    _HEX_OCTETS = np.array([f"{octet:02x}" for octet in range(256)])
+else:  # pragma: no cover  numpy is a dependency of uniplot so this should not occur
+    NUMPY = False
+
 app = typer.Typer()
 api = api_clients.classic
 console = Console(emoji=False)
@@ -347,77 +356,95 @@ class EvalLocationResponse:
 eval_location_response = EvalLocationResponse()
 
 
-def _get_ap_location_via_api() -> tuple[dict[str, str], RateLimit]:
-    campus_resp: Response = api.session.request(api.visualrf.get_all_campuses)
-    eval_location_response(campus_resp)
-    campuses = [c["campus_id"] for c in campus_resp.raw["campus"]]
-
-    bldg_reqs = [BatchRequest(api.visualrf.get_buildings_for_campus, campus) for campus in campuses]
-    bldg_resp = api.session.batch_request(bldg_reqs)
-    eval_location_response(bldg_resp)
-    _ = asyncio.run((common.cache.update_floor_plan_cache(bldg_resp)))
-    buildings = {
-        bldg["building_id"]: {"name": bldg["building_name"], "lat": bldg["latitude"], "lon": bldg["longitude"]} for resp in bldg_resp for bldg in resp.raw["buildings"]
-    }
-
-    floor_reqs = [BatchRequest(api.visualrf.get_floors_for_building, bldg) for bldg in buildings]
-    floor_resp = api.session.batch_request(floor_reqs)
-    eval_location_response(floor_resp)
-    floors = {
-        floor["floor_id"]: {"name": floor["floor_name"], "level": floor["floor_level"] if not floor["floor_level"].is_integer() else int(floor["floor_level"]), "building_id": floor["building_id"]} for resp in floor_resp for floor in resp.raw.get("floors", [])
-    }
-
-    ap_loc_reqs = [BatchRequest(api.visualrf.get_aps_for_floor, floor) for floor in floors]
-    ap_loc_resp = api.session.batch_request(ap_loc_reqs)
-    eval_location_response(ap_loc_resp)
-    _ = asyncio.run(common.cache.update_floor_plan_cache(ap_loc_resp, cache="floors"))
-    ap_loc_data = {
-        ap["serial_number"]: {
-            "id": ap["ap_id"],
-            "serial": ap["serial_number"],
-            "building": buildings[floors[ap["floor_id"]]["building_id"]]["name"],
-            "floor": floors[ap["floor_id"]]["level"]
-        } for resp in ap_loc_resp for ap in resp.raw["access_points"]
-    }
-    last_call = sorted(ap_loc_resp, key=lambda res: res.rl)[0]
+def _get_ap_location_via_api(serials: Iterable[str]) -> tuple[dict[str, str], RateLimit]:
+    resp: list[Response] = api.session.request(common.cache.refresh_floor_plan_db)
+    eval_location_response(resp)
+    last_call = sorted(resp, key=lambda res: res.rl)[0]
 
-    return ap_loc_data, last_call.rl
+    return common.cache.get_floor_plan_locations(serials), last_call.rl
 
 
 def get_location_for_all_aps(ap_data: dict[str, dict[str, str | list[str]]], update_cache: bool = None) -> tuple[dict[str, dict[str, str | dict[str, str]]], RateLimit | None]:
     not_found_cnt = 0
     if update_cache is not True:
-        cache_aps = {serial: common.cache.floor_plan_aps_by_serial.get(serial) for serial in ap_data}
-        not_found_cnt = list(cache_aps.values()).count(None)
+        cache_locations = common.cache.get_floor_plan_locations(ap_data)
+        not_found_cnt = len(ap_data) - len(cache_locations)
 
     if update_cache is True or (not_found_cnt and update_cache is not False):
         msg_sfx = "based on command line flag" if update_cache else f"as location data for {not_found_cnt} APs is missing from cache"
         log.info(f"Triggering location lookup via API {msg_sfx}", show=True)
-        return _get_ap_location_via_api()
+        return _get_ap_location_via_api(ap_data)
     else:
-        out = {ap.serial: ap.location for ap in cache_aps.values() if ap is not None}
-        if len(out) < len(ap_data):
-            log.warning(f"{len(ap_data) - len(out)} APs were not found in the AP location cache, --no-update option used so cache was not updated.")
-        return {ap.serial: ap.location for ap in cache_aps.values() if ap is not None}, None
+        if not_found_cnt:
+            log.warning(f"{not_found_cnt} APs were not found in the AP location cache, --no-update option used so cache was not updated.")
+        return cache_locations, None
+
+
+def mac_ranges(macs: Sequence[str], count: int) -> list[list[str]]:
+    """Generate count sequential MACs starting at each of macs (manual masking).
+
+    MAC arithmetic and formatting is done over integer arrays for all macs at once.
+
+    Args:
+        macs (Sequence[str]): The base MACs (radio MACs).
+        count (int): Number of MACs to generate for each base MAC (including the base MAC).
+
+    Returns:
+        list[list[str]]: A list of count MACs (colon delimited lower case) for each of macs, in the same order as macs.
+    """
+    base = [int("".join(c for c in mac if c in hexdigits), 16) for mac in macs]
+    if not NUMPY:  # pragma: no cover  numpy is a dependency of uniplot
+        return [[":".join(f"{mac + idx:012x}"[i:i + 2] for i in range(0, 12, 2)) for idx in range(count)] for mac in base]
+
+    ints = np.asarray(base, dtype=np.uint64)[:, None] + np.arange(count, dtype=np.uint64)
+    octets = _HEX_OCTETS[ints.astype(">u8").view(np.uint8).reshape(-1, 8)[:, 2:]]
+    formatted = [":".join(mac) for mac in octets.tolist()]
+    return [formatted[idx:idx + count] for idx in range(0, len(formatted), count)]
+
 
+def get_redsky_bssids(aps: list[dict[str, Any]], *, mask: bool = True, mask_entries: int = None) -> dict[str, dict[str, str | list[str]]]:
+    """Determine the BSSIDs to export for each AP from the get_bssids payload.
 
-def generate_redsky_csv(ap_data: list[dict[str, str]], *, mask: bool = True, pnc: bool = False) -> list[dict[str, str]]:
-    redsky_out = []
+    Args:
+        aps (list[dict[str, Any]]): The "aps" from the get_bssids response.
+        mask (bool, optional): Export only the radio MAC + any BSSIDs that don't fall within the radio MACs masked range. Defaults to True.
+        mask_entries (int, optional): Export this many sequential MACs starting from each radio MAC (manual masking). Defaults to None.
+
+    Returns:
+        dict[str, dict[str, str | list[str]]]: {serial: {"name": ..., "bssids": [...]}}
+    """
+    radio_macs = [[radio["macaddr"] for radio in ap["radio_bssids"]] for ap in aps]
+    if mask_entries:
+        ranges = iter(mac_ranges([mac for macs in radio_macs for mac in macs], mask_entries))
+
+    bssids_by_serial = {}
+    for ap, _radio_macs in zip(aps, radio_macs):
+        if mask_entries:
+            bssids = [mac for _ in _radio_macs for mac in next(ranges)]
+        else:
+            _bssids = [bssid_dict["macaddr"] for radio in ap["radio_bssids"] for bssid_dict in radio["bssids"] or [{"macaddr": radio["macaddr"]}]]
+            if mask:
+                _masked_radio_macs = {mac[0:-1] for mac in _radio_macs}
+                bssids = [*_radio_macs, *[bssid for bssid in _bssids if bssid[0:-1] not in _masked_radio_macs]]
+            else:
+                bssids = list(dict.fromkeys([*_radio_macs, *_bssids]))
+        bssids_by_serial[ap["serial"]] = {"name": ap["name"], "bssids": bssids}
+
+    return bssids_by_serial
+
+
+def generate_redsky_csv(ap_data: list[dict[str, str]], *, mask: bool = True, pnc: bool = False) -> Iterator[dict[str, str]]:
     for ap in ap_data:
+        building = ap["building"] if not pnc else ap["building"].replace(" - ", " ")
+        floor = ap["floor"] if not pnc else f"{building} {ap['floor']}"
         for bssid in ap["bssids"]:
-            building = ap["building"] if not pnc else ap["building"].replace(" - ", " ")
-            floor = ap["floor"] if not pnc else f"{building} {ap['floor']}"
-
-            redsky_out += [
-                {
-                    "BSSID": bssid,
-                    "Building Name": building,
-                    "Location Name": floor,
-                    "Description": None,
-                    "Masking": mask
-                }
-            ]
-    return redsky_out
+            yield {
+                "BSSID": bssid,
+                "Building Name": building,
+                "Location Name": floor,
+                "Description": None,
+                "Masking": mask
+            }
 
 
 @app.command()
@@ -477,7 +504,7 @@ def redsky_bssids(
         "[deep_sky_blue3]:information:[/]  As with all commands that return data, the command can be repeated without doing any API calls using [cyan]cencli show last[/]"
     ] if update is not False else ["[deep_sky_blue1]:information:[/]  [cyan]--no-update[/] :triangular_flag: used.  Only APs that exist in location cache will be included in output."]
 
-    if len(list(common.cache.sites)) > 5:  # pragma: no cover
+    if common.cache.count(Site) > 5:  # pragma: no cover
         render.econsole.print("\n".join(confirm_msg))
         render.confirm(yes)
 
@@ -490,20 +517,7 @@ def redsky_bssids(
     if not bssid_resp.ok:
         render.display_results(bssid_resp, tablefmt="action", exit_on_fail=True)
 
-    def masked(bssids: list[str]) -> list[str]:
-        return map(lambda bssid: bssid[0:-1], bssids)
-
-    bssids_by_serial = {}
-    for ap in bssid_resp.raw["aps"]:
-        _bssids = [bssid_dict["macaddr"] for bssid in ap["radio_bssids"] for bssid_dict in bssid["bssids"] or [{"macaddr": bssid["macaddr"]}]]
-        _radio_macs = [bssid["macaddr"] for bssid in ap["radio_bssids"]]
-        if not no_mask:
-            bssids = [*_radio_macs, *[bssid for bssid, _masked in zip(_bssids, masked(_bssids)) if _masked not in masked(_radio_macs)]]
-        elif mask_entries:
-            bssids = [m for mac in _radio_macs for m in utils.Mac(mac).get_range(mask_entries)]
-        else:
-            bssids = list(set([*_radio_macs, *_bssids]))
-        bssids_by_serial[ap["serial"]] = {"name": ap["name"], "bssids": bssids}
+    bssids_by_serial = get_redsky_bssids(bssid_resp.raw["aps"], mask=not no_mask, mask_entries=mask_entries)
 
     with Spinner("Fetching AP locations from VisualRF"):
         location_data, last_rl = get_location_for_all_aps(bssids_by_serial, update_cache=update)
@@ -512,13 +526,17 @@ def redsky_bssids(
     no_loc_aps = []
     ap_data = [{"serial": k, **v, "building": location_data.get(k, {"building": "UNDEFINED"})["building"], "floor": location_data.get(k, {"floor": None})["floor"]} for k, v in bssids_by_serial.items() if location_data.get(k)]
     no_loc_aps = [{"serial": k, **v} for k, v in bssids_by_serial.items() if not location_data.get(k)]
-    bssid_resp.output = ap_data if tablefmt != "csv" else generate_redsky_csv(ap_data, mask=not no_mask, pnc=pnc)
-    _count_caption = '' if api.session.req_cnt > 5 else f"[cyan]{api.session.req_cnt}[/] API Requests performed.\n"
-    caption = f"{_count_caption}{'' if tablefmt == 'csv' else 'Use default format (csv) for redsky formatted output.'}"
-    if not outfile and tablefmt == "csv":
-        caption = f"{caption}\n{Warnings.no_outfile}"
+    if tablefmt == "csv" and outfile and not raw:  # csv is streamed directly to the file, rather than rendered in full first.
+        count = render.stream_csv(outfile, generate_redsky_csv(ap_data, mask=not no_mask, pnc=pnc))
+        render.econsole.print(f"[cyan]{count}[/] BSSID location entries for [cyan]{len(ap_data)}[/] APs written to [cyan]{outfile}[/]")
+    else:
+        bssid_resp.output = ap_data if tablefmt != "csv" else list(generate_redsky_csv(ap_data, mask=not no_mask, pnc=pnc))
+        _count_caption = '' if api.session.req_cnt > 5 else f"[cyan]{api.session.req_cnt}[/] API Requests performed.\n"
+        caption = f"{_count_caption}{'' if tablefmt == 'csv' else 'Use default format (csv) for redsky formatted output.'}"
+        if not outfile and tablefmt == "csv":
+            caption = f"{caption}\n{Warnings.no_outfile}"
 
-    render.display_results(bssid_resp, tablefmt=tablefmt, title="AP / BSSID Location info", caption=caption, outfile=outfile, pager=pager, exit_on_fail=False)
+        render.display_results(bssid_resp, tablefmt=tablefmt, title="AP / BSSID Location info", caption=caption, outfile=outfile, pager=pager, exit_on_fail=False)
 
     if no_loc_aps:
         render.econsole.print(f"\n[dark_orange3]:warning:[/]  The following [cyan]{len(no_loc_aps)}[/] APs do not appear to be placed on a floor plan.  They are not included in the BSSID location mapping output:")
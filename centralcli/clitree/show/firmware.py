@@ -47,7 +47,7 @@ def device(
     workspace: str = common.options.workspace,
 ) -> None:
     if device:
-        devs = [common.cache.get_dev_identifier(dev, dev_type=["gw", "switch", "ap"], swack=True) for dev in device]
+        devs = common.cache.get_dev_identifiers(device, dev_type=["gw", "switch", "ap"], swack=True)
         batch_reqs = [BatchRequest(api.firmware.get_device_firmware_details if dev.type != "ap" else api.firmware.get_swarm_firmware_details, dev.serial if dev.type != "ap" else dev.swack_id) for dev in devs]
         if dev_type:
             log.warning(
@@ -116,7 +116,7 @@ def swarm(
     """
     title = "Firmware Details"
     if device:
-        devs: list[CacheDevice] = [common.cache.get_dev_identifier(dev, dev_type="ap", swack=True) for dev in device]
+        devs: list[CacheDevice] = common.cache.get_dev_identifiers(device, dev_type="ap", swack=True)
         batch_reqs = [BatchRequest(api.firmware.get_swarm_firmware_details, dev.swack_id) for dev in devs]
         if len(devs) == 1:
             title = f"{title} for swarm with id {devs[0].swack_id}"
@@ -8,6 +8,7 @@ import typer
 
 from centralcli import api_clients, cleaner, common, log, render
 from centralcli.constants import SortNamedMpskOptions
+from centralcli.models.sql import MPSKNetwork
 from centralcli.strings import Warnings
 
 if TYPE_CHECKING:
@@ -68,7 +69,7 @@ def named(
         status = "disabled"
 
     if csv_import and not ssid:
-        if len(list(common.cache.mpsk_networks)) == 1:
+        if common.cache.count(MPSKNetwork) == 1:
             ssid = list(common.cache.mpsk_networks)[0]["name"]
             log.warning(f"[cyan]ssid[/] argument is required when [cyan]--import[/] is used.  However cache only contains 1 MPSK SSID [bright_green]{ssid}[/].", caption=True)
         else:
@@ -24,7 +24,7 @@ try:
 except (ImportError, ModuleNotFoundError):  # pragma: no cover
     hook_enabled = False
 
-from centralcli import api_clients, caas, cache, cleaner, common, config, log, render, utils
+from centralcli import api_clients, caas, cache, cleaner, codec, common, config, log, render, utils
 from centralcli.caas import CaasAPI
 from centralcli.client import BatchRequest
 from centralcli.cache.sqlite import DBAction
@@ -81,6 +81,7 @@ from centralcli.objects import DateTime, ShowInterfaceFilters
 from centralcli.objects.cache import CacheDevice, CacheInvDevice, CacheObject, CentralObject
 from centralcli.response import BatchResponse, Response
 from centralcli.strings import cron_weekly, emoji
+from centralcli.ws_store import StreamStore
 
 from . import audit, bandwidth, branch, cloudauth, firmware, mpsk, ospf, overlay, ts, wids
 
@@ -308,7 +309,7 @@ def _get_details_for_specific_devices(
         serial_type = {d: dev_type for d in devices}
         dev_types = [dev_type]
     else:
-        devs: list[CacheDevice | CacheInvDevice] = [common.cache.get_dev_identifier(d, dev_type=dev_type, include_inventory=include_inventory) for d in devices]
+        devs: list[CacheDevice | CacheInvDevice] = common.cache.get_dev_identifiers(devices, dev_type=dev_type, include_inventory=include_inventory)
         dev_types = [dev.type for dev in devs]
         batch_reqs = [BatchRequest(api.monitoring.get_dev_details, dev.type, dev.serial) for dev in devs]
         serial_type = {d.serial: d.type for d in devs}
@@ -324,7 +325,7 @@ def _get_details_for_specific_devices(
                 log.error(f"Unable to show details for {dev.summary_text}.  {r.status} {r.error}", caption=True)
 
     if not devs:
-        devs: list[CacheDevice | CacheInvDevice] = [common.cache.get_dev_identifier(d, dev_type=dev_type, include_inventory=include_inventory, retry=False) for d in devices]
+        devs: list[CacheDevice | CacheInvDevice] = common.cache.get_dev_identifiers(devices, dev_type=dev_type, include_inventory=include_inventory, retry=False)
     _update_cache_for_specific_devices(batch_resp.responses, devs)
 
     if tabular_output and len(dev_types) > 1 and len(batch_resp.passed) > 1:
@@ -771,7 +772,7 @@ def stacks(
     kwargs = {}
     func = api.monitoring.get_switch_stacks
     if switches:
-        devs: list[CacheDevice] = [common.cache.get_dev_identifier(d, dev_type="switch", swack_only=True,) for d in switches]
+        devs: list[CacheDevice] = common.cache.get_dev_identifiers(switches, dev_type="switch", swack_only=True)
         if len(devs) == 1:  # if they specify a single switch we use the details call
             func = api.monitoring.get_switch_stack_details
             args = (devs[0].swack_id,)
@@ -1501,7 +1502,7 @@ def upgrade(
     if not devices:
         common.exit("Missing required parameter [cyan]<device>[/]")
 
-    devs: List[CentralObject] = [common.cache.get_dev_identifier(dev, swack=True,) for dev in devices]
+    devs: List[CentralObject] = common.cache.get_dev_identifiers(devices, swack=True)
     kwargs_list = [{"swarm_id" if dev.type == "ap" else "serial": dev.swack_id if dev.type == "ap" else dev.serial} for dev in devs]
     batch_reqs = [BatchRequest(api.firmware.get_upgrade_status, **kwargs) for kwargs in kwargs_list]
     batch_resp = BatchResponse(api.session.batch_request(batch_reqs, continue_on_fail=True, retry_failed=True))
@@ -1554,10 +1555,9 @@ def cache_(
 
     Use [cyan]tables[/] as argument to see summary and headers for all tables.
     """
-    def get_fields(data: List[Dict[str, Any]], name: str = None) -> List[str]:
-        data = [] if not data else data[0].keys()
+    def get_fields(fields: List[str], name: str = None) -> List[str]:
         pfx = ">>" if not name else f">> {name}"
-        return f"[bright_green]{pfx} fields[/]:\n{utils.color(list(data), 'cyan')}".splitlines()
+        return f"[bright_green]{pfx} fields[/]:\n{utils.color(fields, 'cyan')}".splitlines()
 
     def sort_devices(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         # make device order from cache match device order from other show device commands
@@ -1579,8 +1579,9 @@ def cache_(
                 render.pause()  # pragma: no cover
 
     elif "tables" in args:
-        tables = common.cache.all_tables
-        data = [f"[dark_olive_green2]{t.name}[/]: records: [cyan]{len(t)}[/]\n    {' '.join(get_fields(t.all()))}" for t in tables]
+        tables = list(common.cache.all_tables)
+        updated = {t.name: "" if not t.updated else f" updated: [cyan]{DateTime(t.updated).log}[/]" for t in tables}
+        data = [f"[dark_olive_green2]{t.name}[/]: records: [cyan]{len(t)}[/]{updated[t.name]}\n    {' '.join(get_fields(t.fields))}" for t in tables]
         render.display_results(data=data, tablefmt=tablefmt, pager=pager, outfile=outfile, sort_by=sort_by, output_by_key=None)
 
     else:
@@ -1898,7 +1899,7 @@ def lldp(
 
     NOTE: AOS-SW will return LLDP neighbors, but only reports neighbors for connected Aruba devices managed in Central
     """
-    _devs: list[CacheDevice] = [common.cache.get_dev_identifier(_dev, dev_type=("ap", "switch"), swack=True,) for _dev in device if not _dev.lower().startswith("neighbor")]
+    _devs: list[CacheDevice] = common.cache.get_dev_identifiers([_dev for _dev in device if not _dev.lower().startswith("neighbor")], dev_type=("ap", "switch"), swack=True)
 
     # in case they included 2 members of same stack on command line (by serial or mac).  swack only helps if called by name
     stack_ids = []
@@ -2628,7 +2629,7 @@ def denylisted(
     workspace: str = common.options.workspace,
 ) -> None:
     """Show denylisted clients."""
-    devs = [cache.get_dev_identifier(d, dev_type="ap") for d in device if d not in ["client", "clients"]]  # allow unnecessary keyword client(s)
+    devs = cache.get_dev_identifiers([d for d in device if d not in ["client", "clients"]], dev_type="ap")  # allow unnecessary keyword client(s)
     dev = None if not devs else devs[0]
 
     if not dev:
@@ -2778,6 +2779,12 @@ def logs(
     pytest: bool = typer.Option(False, "--pytest", hidden=True),
     unused_mocks: bool = typer.Option(False, "-u", "--unused-mocks", hidden=True),
     tail: bool = typer.Option(False, "-f", help="follow tail on log file [dim italic](wss_key must be configured unless used to show cencli logs locally)[/]", is_eager=True),
+    local: bool = typer.Option(
+        False,
+        "--local",
+        help="Query events persisted locally from the streaming API [dim italic](wss store: true and events collected with -f)[/] rather than via the API.  Honors [cyan]--dev[/], [cyan]--event-type[/] [dim italic](i.e. wirelessClients)[/], [cyan]-n[/], and time range options.  Other filters are not supported.",
+        show_default=False,
+    ),
     group: str = common.options.group,
     site: str = common.options.site,
     label: str = common.options.label,
@@ -2845,6 +2852,12 @@ def logs(
     if (_all or count) and [start, end, past].count(None) != 3:
         common.exit("Invalid combination of arguments. [cyan]--start[/], [cyan]--end[/], and [cyan]--past[/] are invalid when [cyan]-a[/]|[cyan]--all[/] or [cyan]-n[/] flags are used.")
 
+    if local:  # streamed events are stored as received, they carry none of the fields the API filters on.
+        _api_filters = {"--group": group, "--site": site, "--label": label, "--swarm": swarm, "--level": level, "--client": client, "--bssid": bssid, "--hostname": hostname, "--dev-type": dev_type, "--description": description}
+        _unsupported = [opt for opt, value in _api_filters.items() if value]
+        if _unsupported:
+            common.exit(f"Invalid combination of options.  {utils.color(_unsupported, 'cyan')} {'is' if len(_unsupported) == 1 else 'are'} not supported with [cyan]--local[/].")
+
     start, end = common.verify_time_range(start, end=end, past=past)
     level = level if level is None else level.name
     dev_id = None
@@ -2879,6 +2892,23 @@ def logs(
         start = pendulum.now(tz="UTC").subtract(minutes=30)
         title = f"{title} for last 30 minutes"
 
+    if local:
+        if not config.stream_store_file.exists():
+            common.exit(f"No locally persisted events found.  Set [cyan]store: true[/] under [cyan]wss[/] in {config.file} then use [cyan]cencli show logs -f[/] to collect events.")
+        with StreamStore(config.stream_store_file, retention=config.wss.retention) as store:
+            data = store.query(serial=dev_id, msg_type=event_type, topic="monitoring", start=start, end=end, count=count)
+        render.display_results(
+            data=[{**d, "ts": DateTime(d["ts"])} for d in data],
+            tablefmt=common.get_format(do_json, do_yaml, do_csv, do_table, default="yaml"),
+            title=f"{title} (local streaming API store)",
+            caption=f"{len(data)} events",
+            pager=pager,
+            outfile=outfile,
+            sort_by=sort_by,
+            reverse=reverse,
+        )
+        common.exit(code=0)
+
     kwargs = {
         "group": group,
         "swarm_id": swarm_id,
@@ -3068,9 +3098,7 @@ def last(
     if not config.last_command_file.exists():  # pragma: no cover
         common.exit("Unable to find cache for last command.")
 
-    kwargs = config.last_command_file.read_text()
-    import json
-    kwargs: dict[str, Any] = json.loads(kwargs)
+    kwargs: dict[str, Any] = codec.loads(config.last_command_file.read_text())
 
     last_format = kwargs.get("tablefmt", "rich")
     kwargs["tablefmt"] = common.get_format(do_json, do_yaml, do_csv, do_table, default=last_format)
@@ -3419,7 +3447,7 @@ def radios(
     failed = None
 
     if aps:
-        aps: List[CacheDevice] = [common.cache.get_dev_identifier(ap, dev_type="ap") for ap in aps]
+        aps: List[CacheDevice] = common.cache.get_dev_identifiers(aps, dev_type="ap")
         resp = api.session.batch_request([BatchRequest(api.monitoring.get_devices, "ap", serial=ap.serial, **default_params) for ap in aps])
         passed = [r for r in resp if r.ok]
         failed = [r for r in resp if not r.ok]
@@ -111,7 +111,7 @@ def label(
 ) -> None:
     """Unassign label from device(s)."""
     label: CacheLabel = common.cache.get_label_identifier(label)
-    devices: list[CacheDevice] = [common.cache.get_dev_identifier(dev) for dev in devices]
+    devices: list[CacheDevice] = common.cache.get_dev_identifiers(devices)
 
     _msg = f"Unassign [bright_green]{label.name}[/bright_green] from"
     if len(devices) > 1:
@@ -579,7 +579,7 @@ def ap(
     if not kwargs:
         common.exit("[bright_red]No Changes provided[/]... Nothing to do.  Use [cyan]cencli update ap --help[/] to see available options.")
 
-    aps: list[CacheDevice] = [common.cache.get_dev_identifier(ap, dev_type="ap") for ap in aps]
+    aps: list[CacheDevice] = common.cache.get_dev_identifiers(aps, dev_type="ap")
     data = [{"serial": ap.serial, **kwargs} for ap in aps]
     common.batch_update_aps(data, yes=yes, reboot=reboot)
 
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import typer
 from rich.markup import escape
 
-from centralcli import api_clients, common, render, utils
+from centralcli import api_clients, common, config, render, utils
 from centralcli.client import BatchRequest
-from centralcli.constants import AllDevTypes, iden_meta, lib_to_gen_plural  # noqa
+from centralcli.constants import AllDevTypes, DevTypes, RolloutWaveBy, iden_meta, lib_to_gen_plural  # noqa
 from centralcli.objects import DateTime
+from centralcli.rollout import FAILED, SUCCESS, UPGRADING, Rollout
 
 if TYPE_CHECKING:
     from centralcli.objects.cache import CacheGroup
@@ -44,7 +46,7 @@ def device(
             "Try [cyan]cencli upgrade device ?[/] for help."
         )
 
-    devs = [common.cache.get_dev_identifier(dev, swack=True) for dev in devices]
+    devs = common.cache.get_dev_identifiers(devices, swack=True)
     dev_types = list(set([dev.type for dev in devs]))
     if len(set([t if t not in ["ap", "gw"] else "apgw" for t in dev_types])) > 1:  # ap and gw can be upgraded together
         common.exit(f"Specifying multiple devices of different types ({utils.summarize_list(dev_types, pad=0, sep=', ')}) does not make sense (other than APs and GWs).  All devices should be compatible with the same software/version.")
@@ -209,6 +211,100 @@ def swarm(
     render.display_results(resp, tablefmt="action")
 
 
+def _rollout_progress(rollout: Rollout) -> None:
+    devs = rollout.wave_devices()
+    states = [d.state for d in devs]
+    render.econsole.print(
+        f"Wave [cyan]{rollout.wave + 1}[/] of [cyan]{len(rollout.waves)}[/]: [bright_green]{states.count(SUCCESS)}[/] upgraded, "
+        f"[red]{states.count(FAILED)}[/] failed, [cyan]{states.count(UPGRADING)}[/] upgrading of {len(devs)} devices."
+    )
+
+
+@app.command()
+def rollout(
+    devices: list[str] = common.arguments.get("devices", default=None, help="Devices to upgrade [dim italic](alternative to filtering by --group/--site)[/]"),
+    version: str = typer.Option(None, "--version", help=f"Firmware Version [dim]{escape('[default: recommended version]')}", show_default=False,),
+    dev_type: DevTypes = typer.Option(None, help="Upgrade devices of this type [dim italic](required if devices are not specified)[/]", show_default=False,),
+    group: str = common.options.group,
+    site: str = common.options.site,
+    by: RolloutWaveBy = typer.Option("site", "--by", help="Split devices into waves by site, group, or percentage of devices [dim italic](see --percent)[/]",),
+    percent: int = typer.Option(10, "--percent", min=1, max=100, help="Size of each wave as a percentage of all devices [dim italic](applies to --by percent)[/]",),
+    max_wave: int = typer.Option(None, "--max-wave", min=1, help="Split waves with more than this many devices", show_default=False,),
+    threshold: float = typer.Option(95.0, "--threshold", min=0, max=100, help="The % of devices in a wave that must upgrade successfully before the next wave starts",),
+    timeout: int = typer.Option(3600, "--timeout", min=60, help="Devices that have not completed the upgrade within this many seconds of the start of the wave are considered failed",),
+    resume: Path = typer.Option(None, "--resume", help="Resume an interrupted or halted rollout from its state file", exists=True, dir_okay=False, show_default=False,),
+    retry_failed: bool = typer.Option(False, "--retry-failed", help="Initiate the upgrade again for devices that failed in the current wave [dim italic](applies to --resume)[/]",),
+    reboot: bool = common.options.reboot,
+    yes: bool = common.options.yes,
+    debug: bool = common.options.debug,
+    default: bool = common.options.default,
+    workspace: str = common.options.workspace,
+) -> None:
+    """Upgrade [dim italic](or Downgrade)[/] firmware on devices in waves
+
+    Devices are split into waves by site, group, or percentage of devices.  The upgrade for the next wave only starts once
+    the upgrade status of the devices in the current wave shows the % of successful upgrades meets [cyan]--threshold[/].
+
+    Rollout state is saved to a file as the rollout progresses, use [cyan]--resume <file>[/] to resume an interrupted or halted rollout.
+    """
+    if resume:
+        rollout = Rollout.load(resume)
+        if retry_failed:
+            rollout.retry_failed()
+        conf_msg = f"Resum{'e' if not yes else 'ing'} rollout from [cyan]{resume.name}[/] at wave [cyan]{rollout.wave + 1}[/] of [cyan]{len(rollout.waves)}[/]."
+    else:
+        if devices:
+            devs = common.cache.get_dev_identifiers(devices, swack=True)
+        elif not dev_type:
+            common.exit("[cyan]--dev-type[/] is required when devices are not specified.")
+        else:
+            devs = [d for d in common.cache.devices if d.type == dev_type.value and (not group or d.group == group) and (not site or d.site == site)]
+        if not devs:
+            common.exit("No devices matched the provided filters.")
+
+        no_swarm = [dev for dev in devs if dev.type == "ap" and not dev.swack_id]
+        if no_swarm:  # pragma: no cover
+            render.econsole.print(f"\n{utils.color([dev.name for dev in no_swarm], 'cyan')} lack{'s' if len(no_swarm) == 1 else ''} a swarm_id, may not be populated yet if recently added.")
+            if render.confirm(yes, prompt="\nRefresh cache now to check if it's populated?", abort=False):
+                api.session.request(common.cache.refresh_dev_db, dev_type="ap")
+                devs = [dev if dev.swack_id or dev.type != "ap" else common.cache.get_dev_identifier(dev.serial, dev_type="ap") for dev in devs]
+            no_swarm = [dev for dev in devs if dev.type == "ap" and not dev.swack_id]
+            if no_swarm:
+                common.exit(f"Unable to perform Upgrade on {utils.color([dev.name for dev in no_swarm], 'cyan')}.  [cyan]swarm_id[/] is required for APs and the API is not returning a value for it yet.")
+
+        dev_types = set([dev.type for dev in devs])
+        if len(set([t if t not in ["ap", "gw"] else "apgw" for t in dev_types])) > 1:  # ap and gw can be upgraded together
+            common.exit(f"Specifying multiple devices of different types ({utils.summarize_list(dev_types, pad=0, sep=', ')}) does not make sense (other than APs and GWs).  All devices should be compatible with the same software/version.")
+
+        if version and "ap" in dev_types and "beta" in version:  # beta for APs always looks like this "10.7.1.0-10.7.1.0-beta_91138"
+            needless_prefix = version.split("-")[0]
+            if not version.count(needless_prefix) == 2:
+                version = f"{needless_prefix}-{version}"
+
+        state_file = config.outdir / f"rollout_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        rollout = Rollout.plan(devs, version, by=by.value, percent=percent, max_wave_size=max_wave, reboot=reboot, threshold=threshold, file=state_file)
+        conf_msg = (
+            f"Upgrad{'e' if not yes else 'ing'} [cyan]{len(rollout.devices)}[/] devices to [bright_green]{version or 'Recommended version'}[/] "
+            f"in [cyan]{len(rollout.waves)}[/] waves [dim italic](by {by.value})[/].  Waves proceed if [cyan]{threshold}%[/] of devices upgrade successfully."
+        )
+
+    render.econsole.print(conf_msg)
+    render.econsole.print(f"Rollout state is saved to [cyan]{rollout.file}[/]")
+    render.confirm(yes)
+    rollout.save()
+    try:
+        complete = api.session.request(rollout.run, api, timeout=timeout, on_update=_rollout_progress)
+    except KeyboardInterrupt:  # pragma: no cover
+        common.exit(f"Rollout interrupted.  Use [cyan]cencli upgrade rollout --resume {rollout.file}[/] to resume.")
+
+    data = [{"wave": idx, **{k: v for k, v in vars(d).items() if k not in ["swarm_id", "idle_polls"]}} for idx, wave in enumerate(rollout.waves, start=1) for d in rollout.wave_devices(idx - 1)]
+    data = [d for d in data if d["state"] != "pending"]
+    caption = "Rollout complete." if complete else f"[red]Rollout halted[/], {rollout.detail}  Use [cyan]--resume {rollout.file}[/] to resume."
+    render.display_results(data=data, tablefmt="rich", title="Firmware Rollout", caption=caption, exit_on_fail=False)
+    if not complete:
+        common.exit(code=1)
+
+
 @app.callback()
 def callback():
     """
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from ... import config as cfg
 from ...client import Session
 from ...config import Config
+from ...runner import PooledContext
 from .central.monitoring import MonitoringAPI
 from .glp.devices import GreenLakeDevicesAPI
 from .glp.service_managers import GreenLakeServiceManagerAPI
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
     from ...typedefs import StrOrURL
 
 
-class GreenLakeAPI:
+class GreenLakeAPI(PooledContext):
     _by_workspace: dict[str, GreenLakeAPI] = {}
 
     def __init__(self, config: Config = None, *, base_url: StrOrURL = None, silent: bool = True):
@@ -50,7 +51,7 @@ class GreenLakeAPI:
         return GreenLakeServiceManagerAPI(self.session)
 
 
-class CentralAPI:
+class CentralAPI(PooledContext):
     _by_workspace: dict[str, CentralAPI] = {}
 
     def __init__(self, config: Config = None, *, base_url: StrOrURL = None, silent: bool = True):
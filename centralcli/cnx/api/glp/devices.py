@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional, TypedDict
 
@@ -10,11 +11,16 @@ from centralcli.cnx.models.cache import Inventory
 from centralcli.response import BatchResponse
 from centralcli.typedefs import UNSET
 
+from .operations import OP_TIMEOUT, AsyncOperationTracker, AsyncOpResult, backoff_delays
+
 if TYPE_CHECKING:
     from centralcli.cache import Cache
     from centralcli.response import Response
 
 LEGIT_FAILURES = ["HPE_GL_ERROR_NOT_FOUND"]  # ["result"]["failedDevices"]["errorCode"]
+ADD_PER_CALL = 5  # devices per add (POST) call
+UPDATE_PER_CALL = 25  # MAX devices per update (PATCH) call
+FETCH_ATTEMPTS = 4  # attempts to fetch newly added devices from inventory (GLP may not return them immediately)
 
 
 class GLPDevice(TypedDict):
@@ -37,18 +43,31 @@ class GreenLakeDevicesAPI:
     def __init__(self, session: Session):
         self.session = session
 
-    async def fetch_glp_ids(self, serials: list[str], add_results_resp: list[Response] = None, cache: Cache = None):
-        for _ in range(3):
+    async def fetch_glp_ids(
+        self,
+        serials: list[str],
+        add_results_resp: list[Response] = None,
+        cache: Cache = None,
+        *,
+        before_retry: Callable[[], Awaitable[Any]] = None,
+        silent: bool = False,
+    ):
+        for attempt, delay in enumerate(backoff_delays(interval=2), start=1):
+            if attempt > 1 and before_retry:  # i.e. wait for rate limit budget for the retry
+                await before_retry()
             inv_resp = await self.get_devices(serial_numbers=serials)
             # chunks = utils.chunker(serials, 100)  # TODO this is now chunked in get_devices.   Remove once tested at scale.
             # inv_batch_reqs = [BatchRequest(self.get_devices, serial_numbers=chunk) for chunk in chunks]
             # inv_batch_resp = BatchResponse(await self.session._batch_request(inv_batch_reqs))
             # inv_resp = inv_batch_resp.display
-            if inv_resp.ok and len(inv_resp) == len(serials):
+            if (inv_resp.ok and len(inv_resp) == len(serials)) or attempt >= FETCH_ATTEMPTS:
                 break
 
+            if silent:
+                await asyncio.sleep(delay)
+                continue
             with render.Spinner(f"Allowing more time for [green]GreenLake[/] to be prepared to send inventory response for {len(serials)} added devices."):
-                await asyncio.sleep(3)
+                await asyncio.sleep(delay)
 
         if not inv_resp.ok or not inv_resp.output:
             sfx = inv_resp.error if not inv_resp.ok else "Device add failed."
@@ -72,50 +91,42 @@ class GreenLakeDevicesAPI:
 
         return GLPIDInvResponse(inv_resp=inv_resp, add_resp=add_results_resp, new_devs_by_serial=new_devs_by_serial, device_ids=device_ids, exit_code=0)
 
-    async def get_progresss_of_async_ops(self, responses: list[Response]) -> list[Response]:
+    async def track_async_ops(self, responses: list[Response], timeout: float = OP_TIMEOUT) -> list[AsyncOpResult]:
+        """Given a list of GLP API responses, poll the async operations they started until they complete.
+
+        Args:
+            responses (list[Response]): list of Response objects for the original calls requiring result of async operation.
+            timeout (float, optional): Operations still running after timeout seconds are returned with status TIMEOUT. Defaults to OP_TIMEOUT.
+
+        Returns:
+            list[AsyncOpResult]: A result for each response (same order).
+        """
+        return await AsyncOperationTracker(self.session, timeout=timeout).track(responses)
+
+    async def get_progresss_of_async_ops(self, responses: list[Response], timeout: float = OP_TIMEOUT) -> list[Response]:
         """Given a list of GLP API responses, fetch status of async operation.
 
         For all responses that pass with 202 the "Location" header is used to fetch the status of async operation in GLP.
+        The status is added to the output of the original response under "async operation response".
         All non 202 responses are returned as is.
 
         Args:
             responses (list[Response]): list of Response objects for the original calls requiring result of async operation.
+            timeout (float, optional): Operations still running after timeout seconds are returned with status TIMEOUT. Defaults to OP_TIMEOUT.
 
         Returns:
-            list[Response]: list of response objects.
+            list[Response]: list of response objects (same order).
         """
-        async_status_urls = {idx: r.async_status_url for idx, r in enumerate(responses)}
-        async_status_reqs = {idx: responses[idx] if not url else BatchRequest(self.session.get, url) for idx, url in async_status_urls.items()}
-        resp_idx_list = [idx for idx, req in async_status_reqs.items() if isinstance(req, BatchRequest)]
-        return_responses = {idx: r for idx, r in enumerate(responses) if not r.async_status_url}
-        original_responses = {idx: res for idx, res in enumerate(responses)}
-
-        batch_reqs = [async_status_reqs[idx] for idx in resp_idx_list]
-        if not batch_reqs:
-            return list(return_responses.values())
-        async_status_resp = {idx: res for idx, res in zip(resp_idx_list, await self.session._batch_request(batch_reqs))}
-        retry_reqs = {}
-        for _ in range(6):
-            if _ > 0:
-                resp_idx_list = list(retry_reqs.keys())
-                async_status_resp = {idx: res for idx, res in zip(resp_idx_list, await self.session._batch_request(list(retry_reqs.values())))}
-
-            retry_reqs = {}
-            for idx, r in async_status_resp.items():
-                if r.ok and r.get("status") == "RUNNING" and _ < 2:
-                    retry_reqs[idx] = async_status_reqs[idx]
-                else:
-                    responses[idx].output["async operation response"] = r.summary
-                    return_responses[idx] = responses[idx]
-                    # r.output["original response"] = responses[idx].summary
-                    # return_responses[idx] = r
-
-            if not retry_reqs:
-                return list({**original_responses, **return_responses}.values())
-            else:
-                with render.Spinner(f"Allowing more time for {len(retry_reqs)} Async operations to complete..."):
-                    await asyncio.sleep(2)
-        # TODO this needs a return or error if there are still retrys marked running
+        for res in await self.track_async_ops(responses, timeout=timeout):
+            if res.status == "NOT_ASYNC":
+                continue
+            if not isinstance(res.response.output, dict):
+                res.response.output = {"output": res.response.output}
+            res.response.output["async operation response"] = res.summary
+            if res.status in ["TIMEOUT", "ERROR"]:  # outcome of the operation is unknown
+                res.response.exit_code = 1
+
+        return responses
 
     async def get_devices(
             self,
@@ -293,17 +304,26 @@ class GreenLakeDevicesAPI:
         ]
         return ret
 
-    async def add_devices(
+    async def add_to_inventory(
             self,
             devices: GLPDevice | list[GLPDevice],
-            application_id: str | None = UNSET,
-            region: str | None = None,
             tags: dict[str, str] | None = None,
-            subscription_ids: list[str] | str | None = UNSET,
-            cache: Cache = None,
-        ) -> list[Response]:  # pragma: no cover  still use classic for now
+            *,
+            track: bool = True,
+            continue_on_fail: bool = False,
+        ) -> list[Response]:
+        """Add devices to GreenLake inventory (without service or subscription assignment).
+
+        Args:
+            devices (GLPDevice | list[GLPDevice]): The devices to add.
+            tags (dict[str, str] | None, optional): Tags to assign to all devices (merged with any tags defined for the device). Defaults to None.
+            track (bool, optional): Wait for the async operations to complete. Defaults to True.
+            continue_on_fail (bool, optional): Continue sending the remaining calls if one fails. Defaults to False.
+
+        Returns:
+            list[Response]: One Response per call, each call adds up to ADD_PER_CALL devices (in order).
+        """
         url = "/devices/v1/devices"
-        # We need to add the device before we can assign it to Aruba Central
         devices = devices if isinstance(devices, list) else [devices]
         payloads = [
             {
@@ -318,11 +338,28 @@ class GreenLakeDevicesAPI:
                 "storage": [],
                 "compute": []
             }
-            for chunk in utils.chunker(devices, 5)
+            for chunk in utils.chunker(devices, ADD_PER_CALL)
         ]
 
         batch_reqs = [BatchRequest(self.session.post, url, json_data=payload) for payload in payloads]
-        add_resp = await self.session._batch_request(batch_reqs)
+        add_resp = await self.session._batch_request(batch_reqs, continue_on_fail=continue_on_fail)
+        if not track or not [r for r in add_resp if r.ok]:
+            return add_resp
+
+        return await self.get_progresss_of_async_ops(add_resp)
+
+    async def add_devices(
+            self,
+            devices: GLPDevice | list[GLPDevice],
+            application_id: str | None = UNSET,
+            region: str | None = None,
+            tags: dict[str, str] | None = None,
+            subscription_ids: list[str] | str | None = UNSET,
+            cache: Cache = None,
+        ) -> list[Response]:  # pragma: no cover  still use classic for now
+        # We need to add the device before we can assign it to Aruba Central
+        devices = devices if isinstance(devices, list) else [devices]
+        add_resp = await self.add_to_inventory(devices, tags=tags, track=False)
         passed = [r for r in add_resp if r.ok]
         if not passed:
             return add_resp
@@ -404,7 +441,7 @@ class GreenLakeDevicesAPI:
         # We need to assign the devices to Aruba Central first or any sub calls can fail (race condition)
         if app_payload:
             app_reqs = []
-            for chunk in utils.chunker(device_ids, 25):  # MAX 25 per call
+            for chunk in utils.chunker(device_ids, UPDATE_PER_CALL):
                 query_str = "&".join([f"id={dev}" for dev in chunk])
                 _url = f"{url}?{query_str}"
                 app_reqs += [BatchRequest(self.session.patch, _url, json_data=app_payload, headers=header)]
@@ -412,7 +449,7 @@ class GreenLakeDevicesAPI:
             async_app_resp = await self.get_progresss_of_async_ops(app_resp)
 
         batch_reqs = []
-        for chunk in utils.chunker(device_ids, 25):  # MAX 25 per call
+        for chunk in utils.chunker(device_ids, UPDATE_PER_CALL):
             query_str = "&".join([f"id={dev}" for dev in chunk])
             _url = f"{url}?{query_str}"
             for payload in payloads:
@@ -437,7 +474,7 @@ class GreenLakeDevicesAPI:
             payload = {"subscription": []}
 
         batch_reqs = []
-        for chunk in utils.chunker(device_ids, 25):  # MAX 25 per call
+        for chunk in utils.chunker(device_ids, UPDATE_PER_CALL):
             query_str = "&".join([f"id={dev}" for dev in chunk])
             _url = f"{url}?{query_str}"
             batch_reqs += [BatchRequest(self.session.patch, _url, json_data=payload, headers=header)]
@@ -0,0 +1,172 @@
+"""Tracking of GreenLake async operations.
+
+Device add/update/remove calls to GLP return 202 with a ``Location`` header, the URL of an async operation resource that
+reports the status of the operation.  The tracker polls the status of all pending operations together (via the rate limited
+batch path), backing off exponentially (with jitter) while operations are still running, and stays under the GLP per minute
+rate limit, deferring polls when the remaining budget can't cover them.  Every response gets a result, including those that
+did not start an async operation and those still running when the timeout expires.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from centralcli import log, render
+from centralcli.client import BatchRequest
+
+if TYPE_CHECKING:
+    from centralcli.client import Session
+    from centralcli.response import Response
+
+OpStatus = Literal["SUCCEEDED", "FAILED", "TIMEOUT", "ERROR", "NOT_ASYNC"]
+
+RUNNING_STATES = ("INITIALIZED", "PENDING", "RUNNING")
+OP_TIMEOUT = 120  # seconds
+OP_INTERVAL = 1
+OP_MAX_INTERVAL = 15
+OP_BACKOFF = 2.0
+OP_JITTER = 0.25  # +/- 25% of each delay, so concurrent commands don't poll in lock step
+
+
+def backoff_delays(interval: float = OP_INTERVAL, max_interval: float = OP_MAX_INTERVAL, backoff: float = OP_BACKOFF, jitter: float = OP_JITTER) -> Iterator[float]:
+    """Yield delays that grow exponentially (capped at max_interval) with +/- jitter applied to each."""
+    delay = interval
+    while True:
+        yield max(0.0, delay * (1 + random.uniform(-jitter, jitter)))
+        delay = min(delay * backoff, max_interval)
+
+
+@dataclass
+class AsyncOpResult:
+    response: Response
+    status: OpStatus
+    status_response: Response | None = None
+    polls: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def url(self) -> str | None:
+        return self.response.async_status_url
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ["SUCCEEDED", "NOT_ASYNC"] and self.response.ok
+
+    @property
+    def result(self) -> dict[str, Any]:
+        output = None if self.status_response is None else self.status_response.output
+        return {} if not isinstance(output, dict) else output.get("result") or {}
+
+    @property
+    def succeeded_devices(self) -> list[str]:
+        return [v for dev in self.result.get("succeededDevices") or [] for v in dev.values()]
+
+    @property
+    def failed_devices(self) -> list[str]:
+        return [v for dev in self.result.get("failedDevices") or [] for v in dev.values()]
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        """Summary of the operation status (as stored in the original Response output under "async operation response")."""
+        summary = {} if self.status_response is None else self.status_response.summary
+        if self.status in ["TIMEOUT", "ERROR"]:
+            summary = {**summary, "status": self.status, "polls": self.polls, "elapsed": round(self.elapsed, 2)}
+        return summary
+
+
+class AsyncOperationTracker:
+    def __init__(
+        self,
+        session: Session,
+        *,
+        timeout: float = OP_TIMEOUT,
+        interval: float = OP_INTERVAL,
+        max_interval: float = OP_MAX_INTERVAL,
+        backoff: float = OP_BACKOFF,
+        jitter: float = OP_JITTER,
+    ) -> None:
+        """Poll GLP async operations until they complete.
+
+        Args:
+            session (Session): The GLP API session.
+            timeout (float, optional): Operations still running timeout seconds after tracking starts are returned as TIMEOUT. Defaults to OP_TIMEOUT.
+            interval (float, optional): Initial delay between polls. Defaults to OP_INTERVAL.
+            max_interval (float, optional): Max delay between polls. Defaults to OP_MAX_INTERVAL.
+            backoff (float, optional): Multiplier applied to the delay after each poll. Defaults to OP_BACKOFF.
+            jitter (float, optional): Random +/- fraction applied to each delay. Defaults to OP_JITTER.
+        """
+        self.session = session
+        self.timeout = timeout
+        self.interval, self.max_interval, self.backoff, self.jitter = interval, max_interval, backoff, jitter
+
+    @staticmethod
+    def _budget(resps: list[Response]) -> tuple[int | None, float]:
+        """Remaining GLP per minute budget and seconds until it resets, based on the most recent response with rate limit headers."""
+        rl = next((r.rl for r in reversed(resps) if r.rl.is_glp and r.rl.total_min), None)
+        return (None, 0) if rl is None else (rl.remain_min, rl.glp_rl_reset)
+
+    @staticmethod
+    def _state(resp: Response) -> OpStatus | None:
+        """Terminal status of an operation, None if it's still running (or the status poll should be retried)."""
+        if not resp.ok:
+            return "ERROR" if resp.status < 500 and resp.status not in [418, 429] else None
+        status = str((resp.output or {}).get("status") if isinstance(resp.output, dict) else "").upper()
+        if status in RUNNING_STATES:
+            return None
+        return "SUCCEEDED" if status == "SUCCEEDED" else "FAILED"
+
+    async def track(self, responses: list[Response]) -> list[AsyncOpResult]:
+        """Poll the async operations started by responses until all complete, or the timeout expires.
+
+        Args:
+            responses (list[Response]): Responses from calls that may have started an async operation (i.e. 202 w/ Location header).
+
+        Returns:
+            list[AsyncOpResult]: A result for each response (same order).  Responses that did not start an async operation are NOT_ASYNC.
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        results = [AsyncOpResult(r, status="NOT_ASYNC") for r in responses]
+        pending = [idx for idx, r in enumerate(responses) if r.ok and r.async_status_url]
+        delays = backoff_delays(self.interval, self.max_interval, self.backoff, self.jitter)
+        budget, reset = self._budget(responses)
+
+        while pending:
+            if budget is not None and budget < 1:  # per minute budget exhausted, wait for it to reset before polling
+                wait = max(reset, 1)
+                if time.monotonic() + wait > deadline:
+                    break
+                log.info(f"GLP per minute rate limit budget exhausted, delaying async operation polls {wait}s.")
+                await asyncio.sleep(wait)
+                budget = None
+
+            polling = pending[:] if budget is None else pending[:budget]
+            reqs = [BatchRequest(self.session.get, responses[idx].async_status_url) for idx in polling]
+            resps: list[Response] = await self.session._batch_request(reqs, continue_on_fail=True)
+            budget, reset = self._budget(resps) if resps else (budget, reset)
+            for idx, resp in zip(polling, resps):
+                results[idx].status_response, results[idx].polls = resp, results[idx].polls + 1
+                state = self._state(resp)
+                if state:
+                    results[idx].status = state
+                    pending.remove(idx)
+
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            with render.Spinner(f"Allowing more time for {len(pending)} async operations to complete..."):
+                await asyncio.sleep(min(next(delays), remaining))  # the last poll happens at the deadline
+
+        for idx in pending:
+            results[idx].status = "TIMEOUT"
+        elapsed = time.monotonic() - start
+        for res in results:
+            res.elapsed = elapsed if res.status != "NOT_ASYNC" else 0.0
+        if pending:
+            log.warning(f"{len(pending)} GreenLake async operations did not complete within {self.timeout}s.", caption=True, log=True)
+
+        return results
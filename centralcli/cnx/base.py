@@ -77,6 +77,7 @@ class NewCentralBase:
         self.token_info = _load_token_info(token_info)
         self.token_resp = None
         self._access_token = None
+        self.expires: int | None = None  # epoch timestamp the access token expires, if known
         # self.central_info = None
 
         # auth is always through glp so access token is the same
@@ -139,6 +140,7 @@ class NewCentralBase:
                 if pendulum.now().int_timestamp - 1_800 > token_data["expires"]:
                     return  # if cached token is within 30 mins of expiration we want to force a refresh
 
+            self.expires = token_data.get("expires")
             return token_data.get("access_token")
 
     def get_access_token(self, app_name: Literal["new_central", "glp"] = "glp") -> str:
@@ -173,6 +175,7 @@ class NewCentralBase:
                 )
                 # self.central_info = {"token": {"access_token": token_dict["access_token"]}}
                 self._access_token = token_dict["access_token"]
+                self.expires = int(token_dict["expires_at"])
                 if config.cnx_tok_file:
                     token_data = {
                         "access_token": token_dict["access_token"],
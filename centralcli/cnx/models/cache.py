@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import Any, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
 import pendulum
 from pydantic import AliasChoices, BaseModel, Field, field_validator, model_validator
@@ -10,6 +10,9 @@ from rich.text import Text
 from centralcli import log, utils
 from centralcli.render import unstyle
 
+if TYPE_CHECKING:
+    from centralcli.models.cache import InventoryRow
+
 
 class Subscription(BaseModel):
     id: str
@@ -298,6 +301,32 @@ class Inventory(BaseModel):
     def by_serial(self) -> dict[str, dict[str, Any]]:
         return {s.serial: s.model_dump() for s in self.items}
 
+    def cache_rows(self, sub_data: Subscriptions | None = None) -> list[InventoryRow]:
+        """Inventory cache rows built directly from the validated inventory, with subscription details from sub_data.
+
+        Subscription fields are None if sub_data is not provided.
+        """
+        no_sub = {"subscription_expires": None, "subscription_key": None, "services": None}
+        rows = []
+        for dev in self.items:
+            sub = no_sub if sub_data is None else sub_data.get_inv_cache_fields(dev.subscription)
+            rows += [
+                {
+                    "id": dev.id,
+                    "serial": dev.serial,
+                    "mac": dev.mac,
+                    "type": dev.type,
+                    "model": dev.model,
+                    "sku": dev.sku,
+                    "subscription": sub["services"],
+                    "subscription_key": sub["subscription_key"],
+                    "subscription_expires": sub["subscription_expires"],
+                    "assigned": dev.assigned,
+                    "archived": dev.archived,
+                }
+            ]
+        return rows
+
 
 async def get_inventory_with_sub_data(inv_data: Inventory, sub_data: Subscriptions) -> list[dict[str, Any]]:
     return [{"id": devid, **dev_data, **sub_data.get_inv_cache_fields(dev_data["subscription"])} for devid, dev_data in inv_data.by_id.items()]
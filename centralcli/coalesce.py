@@ -0,0 +1,78 @@
+"""In-flight request coalescing (singleflight).
+
+Composite operations often issue identical GETs concurrently (i.e. a cache refresh triggered while another refresh of the same
+data is running, or a burst of webhooks that each verify the same gateway's tunnels).  Identical idempotent requests in flight at
+the same time share a single API call.  The first caller (the leader) performs the call, callers that arrive while it is in
+flight wait for, and share, its result.
+
+Coalescing is scoped to the running event loop, and only applies while the leader's call is in flight, nothing is retained once
+it completes (see :mod:`centralcli.httpcache` for caching of responses).
+"""
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from . import log
+
+T = TypeVar("T")
+
+
+class Coalescer(Generic[T]):
+    def __init__(self) -> None:
+        self._inflight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future[T]]] = weakref.WeakKeyDictionary()
+        self.coalesced = 0  # calls that joined an in-flight call rather than performing their own
+
+    def _calls(self) -> dict[Hashable, asyncio.Future[T]]:
+        loop = asyncio.get_running_loop()
+        calls = self._inflight.get(loop)
+        if calls is None:
+            calls = self._inflight[loop] = {}
+        return calls
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]], share: Callable[[T], T] = None) -> T:
+        """Await func(), or the result of the identical call already in flight.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            func (Callable[[], Awaitable[T]]): Performs the call, only awaited by the leader.
+            share (Callable[[T], T], optional): Applied to the leader's result for each caller that joined the in-flight call.
+                Defaults to None (callers get the same object).
+
+        Returns:
+            T: The result of the call.  If the call raised, the exception is raised to every caller that joined it.
+        """
+        calls = self._calls()
+        future = calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            log.debug(f"Joined in-flight request {key}")
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():  # this caller was cancelled
+                    raise
+                return await self.do(key, func, share=share)  # leader was cancelled, this caller performs the call
+            return result if share is None else share(result)
+
+        future = calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved, it's raised to the leader regardless of whether any callers joined
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if calls.get(key) is future:
+                del calls[key]
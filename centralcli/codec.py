@@ -0,0 +1,73 @@
+"""JSON codec used across the I/O boundary (API response payloads, rendered json/yaml output, output files, and the last command stash).
+
+orjson is used when installed (``pip install centralcli[speedups]``), otherwise falls back to the stdlib json module.
+Custom types (DateTime, Path, pydantic models, CacheFile) are serialized via the default hook, which works with either.
+"""
+from __future__ import annotations
+
+import json
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+from .objects import CacheFile, DateTime
+
+if find_spec("orjson"):
+    import orjson
+    ORJSON = True
+    JSONEncodeError = (orjson.JSONEncodeError,)
+    _OPTS = orjson.OPT_NON_STR_KEYS
+else:  # pragma: no cover
+    ORJSON = False
+    JSONEncodeError = ()
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+
+
+def default(obj: Any) -> Any:
+    """Serializer hook for types not natively supported by the JSON encoder.
+
+    Raises:
+        TypeError: If obj is not a supported type.
+    """
+    if isinstance(obj, (DateTime, Path)):
+        return str(obj)
+    elif hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    elif isinstance(obj, CacheFile):
+        return {"file": str(obj.file), "ok": obj.ok}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON (str or bytes).
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON.
+    """
+    if ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: int = None, sort_keys: bool = False) -> str:
+    """Encode obj as JSON.
+
+    orjson only supports an indent of 2.  Any other indent, or a payload orjson rejects (i.e. int > 64 bit), is encoded with the stdlib json module.
+
+    Args:
+        obj (Any): The object to encode.
+        indent (int, optional): Indent level for pretty output. Defaults to None (compact).
+        sort_keys (bool, optional): Sort dict keys. Defaults to False.
+
+    Returns:
+        str: The JSON encoded str.
+    """
+    if ORJSON and indent in [None, 2]:
+        opts = _OPTS | (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=opts).decode()
+        except JSONEncodeError:
+            ...  # fallback to stdlib
+
+    return json.dumps(obj, default=default, indent=indent, sort_keys=sort_keys)
@@ -58,6 +58,9 @@ NOT_ACCOUNT_KEYS = [
     "webclient_info",  # Also depricated should be under webhook within the workspace config
     "capture_raw",
     "cache_client_days",
+    "columnar_cache",
+    "cleaner_workers",
+    "response_cache",
 ]
 
 
@@ -313,6 +316,8 @@ class Config:
         self.cache_dir = self.dir / ".cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.default_cache_file = self.cache_dir / "default.db"
+        self.response_cache_file = self.cache_dir / "responses.db"
+        self.no_cache = False  # --no-cache bypasses the response cache
         self.sticky_workspace_file = self.cache_dir / "last_workspace"
         self.sanitize_file = self.dir / "redact.yaml"
 
@@ -334,6 +339,9 @@ class Config:
         self.base_url = c.current_workspace.classic.base_url
         self.username = c.current_workspace.classic.username
         self.cache_client_days = c.current_workspace.cache_client_days
+        self.columnar_cache = c.columnar_cache
+        self.cleaner_workers = c.cleaner_workers
+        self.response_cache = c.response_cache or {}
         self.webhook = c.current_workspace.classic.webhook
         self.wss = c.current_workspace.classic.wss
         self.defined_workspaces: list[str] = list(c.workspaces.keys())
@@ -460,6 +468,11 @@ class Config:
                 return self.default_cache_file if self.workspace in ["central_info", "default"] else self.cache_dir / f"{self._normalized_workspace}.db"
         return self.cache_dir / "db.mocked.json" if tinydb else self.cache_dir / "mock.db"
 
+    @property
+    def stream_store_file(self) -> Path:
+        """SQLite db used to persist events from the streaming API (wss.store)"""
+        return self.cache_dir / f"{self._normalized_workspace}_stream.db"
+
     def get_cnx_url(self, classic_base_url: str | None):
         if not classic_base_url:  # This can occur if they use --ws flag with an workspace that is not configured
             return
@@ -155,6 +155,12 @@ class DevTypes(str, Enum):
     # sdwan = "sdwan"
 
 
+class RolloutWaveBy(str, Enum):
+    site = "site"
+    group = "group"
+    percent = "percent"
+
+
 class ExportDevType(str, Enum):
     ap = "ap"
     sw = "sw"
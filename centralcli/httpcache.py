@@ -0,0 +1,148 @@
+"""Opt-in on disk cache of responses from slow changing GET endpoints.
+
+Configured via ``response_cache`` in the config, a mapping of URL path globs to a TTL in seconds, i.e.::
+
+    response_cache:
+      /troubleshooting/v1/commands: 86400
+
+Only successful GET responses from endpoints matching a configured glob are cached.  Entries are keyed by
+method + URL + params (+ any caller provided headers) + workspace.  The global ``--no-cache`` flag bypasses cached
+entries (the fresh response still updates the cache).
+
+Responses from token / auth endpoints (``NEVER_CACHE``), or to requests with a caller provided Authorization header, are
+never cached regardless of the config.  A POST/PUT/PATCH/DELETE to a path invalidates the cached entries for the path,
+paths below it, and paths above it (i.e. deleting a group invalidates the cached list of groups).
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from yarl import URL
+
+from . import codec, log
+from .response import Response
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .typedefs import StrOrURL
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, url TEXT, status INTEGER, output TEXT, raw TEXT)"
+NEVER_CACHE = ("*/token", "*/token/*", "/oauth/*", "/oauth2/*")  # i.e. /streaming/token/validate (wss key)
+MUTATING_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+def _related(cached_path: str, path: str) -> bool:
+    """cached_path is path, or is below or above path."""
+    return f"{cached_path}/".startswith(f"{path}/") or f"{path}/".startswith(f"{cached_path}/")
+
+
+class ResponseCache:
+    def __init__(self, config: Config, file: Path = None) -> None:
+        self.config = config
+        self.file = file or config.response_cache_file
+        self._ready = False
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config.response_cache)
+
+    def ttl(self, method: str, url: StrOrURL, headers: dict[str, str] = None) -> int:
+        """TTL (seconds) configured for the endpoint, 0 if responses from the endpoint are not cached."""
+        if method.upper() != "GET" or not self.enabled or any(h.lower() == "authorization" for h in (headers or {})):
+            return 0
+        path = URL(str(url)).path
+        if any(fnmatch(path, pattern) for pattern in NEVER_CACHE):
+            return 0
+        return next((int(ttl) for pattern, ttl in self.config.response_cache.items() if fnmatch(path, pattern)), 0)
+
+    def key(self, method: str, url: StrOrURL, params: dict[str, Any] = None, headers: dict[str, str] = None, *, workspace: str = None, **kwargs: Any) -> str:
+        """Cache key for a request.  Hashed, as headers may include credentials (i.e. the wss key)."""
+        parts = [workspace or self.config.workspace, method.upper(), str(url), sorted((params or {}).items()), sorted((headers or {}).items()), sorted(kwargs.items())]
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        con = sqlite3.connect(self.file)
+        if not self._ready:
+            con.execute(_SCHEMA)
+            con.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+            con.commit()
+            self._ready = True
+        return con
+
+    def get(self, key: str) -> Response | None:
+        """Get a cached Response, None if not cached or expired, or if the cache is bypassed (--no-cache)."""
+        if self.config.no_cache:
+            return None
+        try:
+            con = self._connect()
+            try:
+                row = con.execute("SELECT url, status, output, raw FROM responses WHERE key = ? AND expires >= ?", (key, time.time())).fetchone()
+            finally:
+                con.close()
+        except sqlite3.Error as e:
+            log.warning(f"{repr(e)} reading response cache {self.file}")
+            return None
+
+        if row is None:
+            return None
+
+        url, status, output, raw = row
+        resp = Response(url=url, output=codec.loads(output), raw=codec.loads(raw), status_code=status, ok=True)
+        resp.method = "GET"
+        log.info(f"[{status} OK] GET:{URL(url).path} from response cache")
+        return resp
+
+    def set(self, key: str, resp: Response, ttl: int) -> bool:
+        try:
+            values = (key, time.time() + ttl, str(resp.url), resp.status, codec.dumps(resp.output), codec.dumps(resp.raw))
+        except TypeError as e:  # pragma: no cover
+            log.warning(f"{repr(e)} response from {resp.url.path} not added to response cache")
+            return False
+        try:
+            con = self._connect()
+            try:
+                con.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)", values)
+                con.commit()
+            finally:
+                con.close()
+        except sqlite3.Error as e:
+            log.warning(f"{repr(e)} writing to response cache {self.file}")
+            return False
+        return True
+
+    def invalidate(self, method: str, url: StrOrURL) -> int:
+        """Remove cached entries for the path (and any paths below or above it) after a POST/PUT/PATCH/DELETE to it.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        if method.upper() not in MUTATING_METHODS or not self.enabled or not self.file.exists():
+            return 0
+        path = URL(str(url)).path.rstrip("/")
+        try:
+            con = self._connect()
+            try:
+                keys = [(key,) for key, cached_url in con.execute("SELECT key, url FROM responses") if _related(URL(cached_url).path.rstrip("/"), path)]
+                con.executemany("DELETE FROM responses WHERE key = ?", keys)
+                con.commit()
+            finally:
+                con.close()
+        except sqlite3.Error as e:
+            log.warning(f"{repr(e)} invalidating response cache {self.file} after {method.upper()}:{path}")
+            return 0
+        if keys:
+            log.info(f"{len(keys)} response cache entries invalidated by {method.upper()}:{path}")
+        return len(keys)
+
+    def clear(self) -> None:
+        con = self._connect()
+        try:
+            con.execute("DELETE FROM responses")
+            con.commit()
+        finally:
+            con.close()
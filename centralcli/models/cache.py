@@ -6,10 +6,11 @@ from enum import Enum
 from functools import cached_property
 from pathlib import Path
 from random import randint
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Dict, Iterable, List, Literal, Optional
 
 import pendulum
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field, RootModel, field_serializer, field_validator
+from pydantic import AfterValidator, AliasChoices, BaseModel, BeforeValidator, ConfigDict, Field, RootModel, TypeAdapter, field_serializer, field_validator
+from typing_extensions import TypedDict
 
 from .. import log, utils
 from ..constants import CertTypes, DevTypes, GroupDevTypes
@@ -453,6 +454,85 @@ class Clients(RootModel):
         return [json.loads(c.model_dump_json()) for c in self.root]
 
 
+# -- // Cache Rows \\ --
+# TypedDicts validated via TypeAdapter.  Used by the cache refresh pipelines to validate each record once,
+# producing the cache rows (plain dicts) directly, rather than building models only to dump them.
+def _device_type(dev_type: str) -> DevType:
+    return Device.transform_dev_type(dev_type)
+
+
+def _client_type(client_type: str | None) -> str | None:
+    return client_type if not isinstance(client_type, str) else client_type.lower()
+
+
+def _client_ts(dt: datetime | None) -> int | None:
+    return None if dt is None else round(dt.timestamp())
+
+
+class DeviceRow(TypedDict):
+    __pydantic_config__ = ConfigDict(use_enum_values=True)  # type: ignore[misc]
+    name: str
+    status: DeviceStatus
+    type: Annotated[DevType, BeforeValidator(_device_type), Field(validation_alias=AliasChoices("type", "switch_type", "device_type"))]
+    model: str
+    ip: Annotated[Optional[str], Field(None, validation_alias="ip_address")]
+    mac: Annotated[str, Field(validation_alias="macaddr")]
+    serial: str
+    group: Annotated[str, Field(validation_alias="group_name")]
+    site: Annotated[Optional[str], Field(None, validation_alias=AliasChoices("site", "site_name"))]
+    version: Annotated[str, Field(validation_alias="firmware_version")]
+    swack_id: Annotated[Optional[str], Field(None, validation_alias=AliasChoices("swack_id", "stack_id", "swarm_id"))]
+    switch_role: Annotated[Optional[int], Field(None)]
+
+
+class InventoryRow(TypedDict):  # built from the validated GLP inventory see cnx.models.cache.Inventory.cache_rows
+    id: Annotated[Optional[str], Field(None)]
+    serial: str
+    mac: str
+    type: Annotated[Optional[str], Field(None)]
+    model: Annotated[Optional[str], Field(None)]
+    sku: Annotated[Optional[str], Field(None)]
+    subscription: Annotated[Optional[str], Field(None)]
+    subscription_key: Annotated[Optional[str], Field(None)]
+    subscription_expires: Annotated[Optional[int], Field(None)]
+    assigned: Annotated[Optional[bool], Field(None)]
+    archived: Annotated[Optional[bool], Field(None)]
+
+
+class ClientRow(TypedDict):
+    __pydantic_config__ = ConfigDict(use_enum_values=True)  # type: ignore[misc]
+    mac: Annotated[str, Field(default_factory=str, validation_alias=AliasChoices("macaddr", "mac"))]
+    name: Annotated[str, Field(default_factory=str, validation_alias=AliasChoices("name", "username"))]
+    ip: Annotated[str, Field(default_factory=str, validation_alias=AliasChoices("ip_address", "ip"))]
+    type: Annotated[Optional[ClientType], BeforeValidator(_client_type), Field(None, validation_alias=AliasChoices("client_type", "type"))]
+    network_port: Annotated[Optional[str], Field(None, validation_alias=AliasChoices("network", "interface_port", "network_port"))]
+    connected_serial: Annotated[Optional[str], Field(None, validation_alias=AliasChoices("associated_device", "connected_serial"))]
+    connected_name: Annotated[Optional[str], Field(None, validation_alias=AliasChoices("associated_device_name", "connected_name"))]
+    site: Annotated[Optional[str], Field(None)]
+    group: Annotated[Optional[str], Field(None, validation_alias=AliasChoices("group_name", "group"))]
+    last_connected: Annotated[Optional[datetime], AfterValidator(_client_ts), Field(None, validation_alias=AliasChoices("last_connection_time", "last_connection"))]
+
+
+_device_rows = TypeAdapter(list[DeviceRow])
+_inventory_rows = TypeAdapter(list[InventoryRow])
+_client_rows = TypeAdapter(list[ClientRow])
+
+
+def device_cache_rows(data: Dict[str, List[Dict[str, Any]]]) -> list[DeviceRow]:
+    """Validate raw device data keyed by device type endpoint (aps, switches, gateways) into device cache rows."""
+    return _device_rows.validate_python([dev for key in ["aps", "switches", "gateways"] for dev in data.get(key) or []])
+
+
+def inventory_cache_rows(data: List[Dict[str, Any]]) -> list[InventoryRow]:
+    """Validate inventory cache rows (see cnx.models.cache.Inventory.cache_rows) prior to the cache update."""
+    return _inventory_rows.validate_python(data)
+
+
+def client_cache_rows(data: List[Dict[str, Any]]) -> list[ClientRow]:
+    """Validate raw client data (from monitoring API) into client cache rows."""
+    return _client_rows.validate_python(data)
+
+
 class MpskNetwork(BaseModel):
     id: str
     name: str = Field(alias=AliasChoices("ssid", "name"))
@@ -683,6 +763,25 @@ class Floor(BaseModel):
     # units: VisualRFUnits
 
 
+class BuildingFloors(RootModel):
+    root: list[Floor]
+
+    def __init__(self, responses: list[Response]) -> None:
+        super().__init__([Floor(**floor) for r in responses for floor in r.raw.get("floors") or []])
+
+    def __iter__(self):
+        return iter(self.root)
+
+    def __getitem__(self, item):
+        return self.root[item]
+
+    def __len__(self) -> int:
+        return len(self.root)
+
+    def cache_dump(self) -> list[dict[str, str | float | None]]:
+        return [{"id": f.floor_id, "name": f.floor_name, "building_id": f.building_id, "level": f.floor_level} for f in self.root]
+
+
 class AccessPoint(BaseModel):
     id: str = Field(alias=AliasChoices("id", "ap_id"))
     name: str = Field(alias=AliasChoices("name", "ap_name"))
@@ -104,6 +104,8 @@ class Tokens(BaseModel):
 class WSSConfig(BaseModel):
     base_url: Optional[str] = None
     key: Optional[str] = None
+    store: Optional[bool] = False
+    retention: Optional[int] = 24
 
     def __bool__(self):
         return self.ok
@@ -256,6 +258,9 @@ class ConfigData(BaseModel):
     debugv: Optional[bool] = False
     cache_client_days: Optional[int] = default.cache_client_days
     forget_ws_after: Optional[int] = Field(None, alias=AliasChoices("forget_ws_after", "forget_account_after"))
+    columnar_cache: Optional[bool] = False
+    cleaner_workers: Optional[int] = 0
+    response_cache: Optional[Dict[str, int]] = {}
     dev_options: Optional[DevOptions] = DevOptions()
 
     @model_validator(mode="before")
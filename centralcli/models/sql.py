@@ -265,6 +265,17 @@ class Building(Base):
         return f"Building({self.name!r}|{self.id!r}|{self.campus_id!r}|{self.lat!r}|{self.lon!r}) object at {hex(id(self))}"
 
 
+class FloorPlanFloor(Base):
+    __tablename__ = "floor_plan_floors"
+    id: Mapped[str] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    building_id: Mapped[str] = mapped_column(ForeignKey("floor_plan_buildings.id"))
+    level: Mapped[Optional[float]] = None
+
+    def __repr__(self) -> str:
+        return f"FloorPlanFloor({self.name!r}|{self.id!r}|{self.building_id!r}|{self.level!r}) object at {hex(id(self))}"
+
+
 class FloorPlanAP(Base):
     __tablename__ = "floor_plan_aps"
     id: Mapped[str] = mapped_column(primary_key=True)
@@ -365,4 +376,15 @@ class WebHookData(Base):
         return f"WebHookData({self.id!r}|{self.device_id!r}|ok: {self.ok!r}|{self.alert_type!r}|{self.state!r}) object at {hex(id(self))}"
 
 
-CacheTable: TypeAlias = Device | InventoryDevice | Site | Group | Template | Label | Client | MPSKNetwork | MPSK | Subscription | SubscriptionName | Building | FloorPlanAP | GLPService | Cert | Guest | Portal | CentralAuditLog | Event | WebHookData
\ No newline at end of file
+class TableMeta(Base):
+    """Row count and last update time for each cache table, maintained by Cache._update_db (avoids reflection + COUNT(*) per table)."""
+    __tablename__ = "table_meta"
+    name: Mapped[str] = mapped_column(primary_key=True)
+    records: Mapped[int] = mapped_column(default=0)
+    updated: Mapped[Optional[float]] = mapped_column(default=None, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"TableMeta({self.name!r}|records: {self.records!r}|updated: {self.updated!r}) object at {hex(id(self))}"
+
+
+CacheTable: TypeAlias = Device | InventoryDevice | Site | Group | Template | Label | Client | MPSKNetwork | MPSK | Subscription | SubscriptionName | Building | FloorPlanFloor | FloorPlanAP | GLPService | Cert | Guest | Portal | CentralAuditLog | Event | WebHookData
\ No newline at end of file
@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-from json import JSONEncoder
 from pathlib import Path
 from typing import Literal
 
 import pendulum
-from pydantic import BaseModel
 
 TimeFormat = Literal["day-datetime", "durwords", "durwords-short", "timediff", "timediff-past", "mdyt", "log", "date-string", "mdyt-timediff"]
 
@@ -236,20 +234,6 @@ class DateTime():
         return "" if self.ts is None else pendulum.from_timestamp(self.ts, tz=self.tz).to_formatted_date_string()
 
 
-class Encoder(JSONEncoder):
-    """A Custom JSON Encoder to handle custom DateTime object (and Path) during JSON serialization.
-    """
-    def default(self, obj: DateTime | Path | BaseModel | CacheFile):
-        if isinstance(obj, DateTime) or isinstance(obj, Path):
-            return str(obj)
-        elif hasattr(obj, "model_dump"):
-            return obj.model_dump()
-        elif isinstance(obj, CacheFile):
-            return {"file": str(obj.file), "ok": obj.ok}
-        else:
-            return obj    # pragma: no cover
-
-
 class ShowInterfaceFilters:
     def __init__(self, up: bool = False, down: bool = False, slow: bool = False, fast: bool = False):
         self.up = up
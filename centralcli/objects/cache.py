@@ -1,4 +1,4 @@
-from collections.abc import KeysView, MutableMapping
+from collections.abc import KeysView, Mapping, MutableMapping, Sequence
 from enum import Enum
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal, Optional, TypeAlias
@@ -10,8 +10,8 @@ from sqlalchemy.orm import Session
 from yarl import URL
 
 from centralcli import api_clients, config, log, render, utils
-from centralcli.constants import BranchGwRoleTypes, ClientType, DeviceTypes, LibAllDevTypes
-from centralcli.models.sql import Building, Device, InventoryDevice
+from centralcli.constants import BranchGwRoleTypes, DeviceTypes, LibAllDevTypes
+from centralcli.models.sql import Building, Client, Device, InventoryDevice
 from centralcli.response import CombinedResponse, Response
 from centralcli.typedefs import CacheSiteDict
 
@@ -19,7 +19,7 @@ from . import DateTime
 
 if TYPE_CHECKING:
     from ..cache import Cache
-    from ..typedefs import CacheSiteDict, CertType, ClientType, PortalAuthTypes
+    from ..typedefs import CacheSiteDict, CertType, PortalAuthTypes
 
 
 api = api_clients.classic
@@ -27,6 +27,8 @@ CacheTable = Literal["dev", "inv", "sub", "site", "group", "template", "label",
 
 
 class CentralObject(MutableMapping):
+    __slots__ = ()  # subclasses that do not define __slots__ get a __dict__ as usual
+
     def __init__(
         self,
         data: dict[str, Any] | list[dict[str, Any]] = None,
@@ -71,6 +73,9 @@ class CentralObject(MutableMapping):
 
     @cached_property
     def text(self) -> Text:
+        return self._build_text()
+
+    def _build_text(self) -> Text:
         parts = [p for p in self._help_text_parts if p]
 
         def _get_color(idx: int, item: str):
@@ -111,6 +116,97 @@ class CentralObject(MutableMapping):
         return self.text.markup
 
 
+class RecordData(dict):
+    """dict of a CacheRecord's values (built from its slots), item assignment writes through to the record."""
+    __slots__ = ("_record",)
+
+    def __init__(self, record: "CacheRecord") -> None:
+        super().__init__((field, getattr(record, field)) for field in record.fields)
+        self._record = record
+
+    def __setitem__(self, key, value):
+        self._record[key] = value
+        super().__setitem__(key, value)
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+
+class CacheRecord(CentralObject):
+    """Compact, slot based cache object.
+
+    Values are stored in slots (one per column of the backing table) rather than in a dict, and can be built directly from a SQL result row.
+    Mapping access (``obj["name"]``, ``obj.data``) is preserved for the existing call sites, ``text`` is only built when first accessed.
+    The slots are the only copy of the values, ``data`` is built from them on access and writes through to them.
+    Subclasses define ``__slots__``/``fields`` (in column order), ``aliases`` (legacy key -> field), and ``_help_text_parts``.
+    """
+    __slots__ = ("_text",)
+    fields: tuple[str, ...] = ()
+    aliases: dict[str, str] = {}
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        for field in self.fields:
+            setattr(self, field, data.get(field))
+        self._text = None
+        self._post_init(data)
+
+    def _post_init(self, data: Mapping[str, Any]) -> None:
+        ...
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]):
+        """Build object from a row tuple, values must be in the same order as cls.fields (the table columns)."""
+        obj = cls.__new__(cls)
+        for field, value in zip(cls.fields, row):
+            setattr(obj, field, value)
+        obj._text = None
+        obj._post_init(None)
+        return obj
+
+    @property
+    def data(self) -> RecordData:
+        return RecordData(self)
+
+    def __bool__(self):
+        return any(getattr(self, field) is not None for field in self.fields)
+
+    def _field(self, key) -> str:
+        field = self.aliases.get(key, key)
+        if field not in self.fields:
+            raise KeyError(key)
+        return field
+
+    def __getitem__(self, key):
+        return getattr(self, self._field(key))
+
+    def __setitem__(self, key, value):
+        setattr(self, self._field(key), value)
+        self._text = None
+
+    def __delitem__(self, key):
+        raise TypeError(f"{type(self).__name__} does not support item deletion")  # pragma: no cover
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def keys(self) -> KeysView:
+        return self.data.keys()
+
+    @property
+    def _help_text_parts(self) -> list[Any]:
+        return [getattr(self, field) for field in self.fields]
+
+    @property
+    def text(self) -> Text:
+        if self._text is None:
+            self._text = self._build_text()
+        return self._text
+
+
 class MigrateDevice(CentralObject):
     def __init__(self, data: dict[str, Any]):
         super().__init__(data, is_dev=True, is_inv=True)
@@ -175,22 +271,25 @@ class _MigrateDevice(CentralObject):
         return "switch" if self.data["type"] in ["cx", "sw"] else self.data["type"]
 
 
-class CacheInvDevice(CentralObject):
-    def __init__(self, data: dict[str, Any]) -> None:
-        super().__init__(data, is_inv=True)
-        self.id: str = data.get("id")  # glp only
-        self.serial: str = data["serial"]
-        self.mac: str = data["mac"]
-        self.type: str = data["type"]
-        self.model: str = data["model"]
-        self.sku: str = data["sku"]
-        self.services: str | None = data.get("services", data.get("subscription"))  # backward compat new field name is subscription
-        self.subscription_key: str = data.get("subscription_key")
-        self.subscription_expires: int | float = data.get("subscription_expires")
-        self.assigned: bool = data.get("assigned")  # glp only
-        self.archived: bool = data.get("archived")  # glp only
-        id_str = None if not self.id else f"[dim]glp id: {self.id}[/dim]"
-        self._help_text_parts = [self.serial, self.mac, self.type, self.sku, id_str]
+class CacheInvDevice(CacheRecord):
+    __slots__ = _INV_FIELDS = tuple(InventoryDevice.__table__.columns.keys())
+    fields = _INV_FIELDS
+    aliases = {"services": "subscription"}  # backward compat new field name is subscription
+    is_dev = is_group = is_template = is_site = False
+    is_inv = True
+
+    def _post_init(self, data: Mapping[str, Any] | None) -> None:
+        if data is not None and self.subscription is None:
+            self.subscription = data.get("services")  # backward compat new field name is subscription
+
+    @property
+    def services(self) -> str | None:
+        return self.subscription
+
+    @property
+    def _help_text_parts(self) -> list[Any]:
+        id_str = None if not self.id else f"[dim]glp id: {self.id}[/dim]"  # id is glp only
+        return [self.serial, self.mac, self.type, self.sku, id_str]
 
     @property
     def generic_type(self):
@@ -210,24 +309,20 @@ class CacheInvDevice(CentralObject):
         return f'[bright_green]Inventory Device[/]:[bright_green]{self.serial}[/]|[cyan]{self.mac}[/]'
 
 
-class CacheDevice(CentralObject):
+class CacheDevice(CacheRecord):
+    __slots__ = _DEV_FIELDS = tuple(Device.__table__.columns.keys())
+    fields = _DEV_FIELDS
+    is_inv = is_group = is_template = is_site = False
+    is_dev = True
     cache: Cache = None
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        super().__init__(data, is_dev=True)
-        self.name: str = data["name"]
-        self.status: Literal["Up", "Down"] | None = data["status"]
-        self.type: DeviceTypes = data["type"].lower()
-        self.model: str = data["model"]
-        self.ip: str | None = data["ip"]
-        self.mac: str = data["mac"]
-        self.serial: str = data["serial"]
-        self.group: str = data["group"]
-        self.site: str = data["site"]
-        self.version: str = data["version"]
-        self.swack_id: str | None = data["swack_id"]
-        self.switch_role: str | None = data["switch_role"]
-        self._help_text_parts = [self.name, self.type, self.status, self.serial, self.mac, self.ip, self.model]
+    def _post_init(self, data: Mapping[str, Any] | None) -> None:
+        if self.type:
+            self.type = self.type.lower()
+
+    @property
+    def _help_text_parts(self) -> list[Any]:
+        return [self.name, self.type, self.status, self.serial, self.mac, self.ip, self.model]
 
     def __eq__(self, value: str | "CacheDevice"):
         if hasattr(value, "serial"):
@@ -245,7 +340,7 @@ class CacheDevice(CentralObject):
 
     @property
     def generic_type(self):
-        return "switch" if self.data["type"] in ["cx", "sw"] else self.data["type"]
+        return "switch" if self.type in ["cx", "sw"] else self.type
 
     def get_ts_session_id(self, exit_on_fail: bool = True) -> int | Response:
         resp = api.session.request(api.tshooting.get_ts_session_id, self.serial)
@@ -466,20 +561,13 @@ class CacheTemplate(CentralObject):
         self._help_text_parts = [self.name, self.group, self.device_type, self.model, f"[magenta]version[/]: {self.version}"]
 
 
-class CacheClient(CentralObject):
-    def __init__(self, data: dict[str, Any]) -> None:
-        super().__init__(data)
-        self.name: str = data["name"]
-        self.ip: str = data["ip"]
-        self.mac: str = data["mac"]
-        self.type: ClientType = data["type"]
-        self.network_port: str = data["network_port"]
-        self.connected_serial: str = data["connected_serial"]
-        self.connected_name: str = data["connected_name"]
-        self.site: str = data["site"]
-        self.group: str = data["group"]
-        self.last_connected: int | float = data.get("last_connected")
-        self._help_text_parts = [self.name, self.ip, self.mac, f'[magenta]s[/]:{self.site}' if self.site else f'[magenta]g[/]:{self.group}', self.type, self.connected_name]
+class CacheClient(CacheRecord):
+    __slots__ = _CLIENT_FIELDS = tuple(Client.__table__.columns.keys())
+    fields = _CLIENT_FIELDS
+
+    @property
+    def _help_text_parts(self) -> list[Any]:
+        return [self.name, self.ip, self.mac, f'[magenta]s[/]:{self.site}' if self.site else f'[magenta]g[/]:{self.group}', self.type, self.connected_name]
 
     # def get_group(self) -> CacheGroup:
     #     return None if self.cache is None else self.cache.get_group_identifier(self.group)
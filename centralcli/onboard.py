@@ -0,0 +1,356 @@
+"""Pipelined bulk onboarding of devices to GreenLake.
+
+Adding devices to GreenLake is a sequence of stages, the devices are added to inventory, the GreenLake ids of the added
+devices are fetched, the devices are assigned to the Aruba Central service, then subscriptions (and tags) are assigned.
+Rather than running each stage over the whole set of devices before the next stage starts, devices are split into chunks
+that stream through the stages, so chunk N can be assigned a subscription while chunk N+1 is being added.  Each stage has
+its own workers and per minute call budget, as GreenLake rate limits are per endpoint.
+
+Onboarding state is checkpointed to a json file after each stage completes for a chunk.  An interrupted onboarding can be
+resumed from the file (``cencli batch add devices --resume <file>``), devices continue from the stage they reached.
+Devices with a group are pre-provisioned to it once they complete onboarding (see ``pre_provision``), which is also tracked
+in the file, so devices completed before an interruption are pre-provisioned when onboarding is resumed.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from . import codec, log, utils
+from .cnx.api.glp.devices import ADD_PER_CALL, UPDATE_PER_CALL
+
+if TYPE_CHECKING:
+    from .cache import Cache
+    from .cnx.api import GreenLakeAPI
+    from .response import Response
+
+Stage = Literal["add", "ids", "service", "subscription"]
+OnboardStatus = Literal["pending", "running", "incomplete", "complete"]
+
+STAGES: tuple[Stage, ...] = ("add", "ids", "service", "subscription")
+PENDING, DONE, FAILED = "pending", "done", "failed"
+CHUNK_SIZE = 100
+IDS_PER_CALL = 100  # serials per inventory (GET) call
+
+
+@dataclass(frozen=True)
+class StageLimit:
+    calls_per_min: int
+    workers: int = 1
+
+
+# Default per minute call budget and number of concurrent workers for each stage
+STAGE_LIMITS: dict[Stage, StageLimit] = {
+    "add": StageLimit(25, workers=2),
+    "ids": StageLimit(160, workers=2),
+    "service": StageLimit(20),
+    "subscription": StageLimit(20),
+}
+
+
+class CallLimiter:
+    def __init__(self, calls_per_min: int) -> None:
+        """Sliding window limiter, callers wait until the calls they are about to make fit in the per minute budget."""
+        self.calls_per_min = calls_per_min
+        self._calls: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, calls: int = 1) -> None:
+        calls = min(max(calls, 1), self.calls_per_min)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= 60:
+                    self._calls.popleft()
+                if len(self._calls) + calls <= self.calls_per_min:
+                    self._calls.extend([now] * calls)
+                    return
+                await asyncio.sleep(60 - (now - self._calls[len(self._calls) + calls - self.calls_per_min - 1]))
+
+
+@dataclass
+class OnboardDevice:
+    serial: str
+    mac: str | None = None
+    subscription: str | None = None  # subscription id
+    tags: dict[str, str] | None = None
+    group: str | None = None  # classic Central group the device is pre-provisioned to once onboarding completes
+    id: str | None = None  # GreenLake id, populated by the ids stage
+    stage: Stage = "add"  # the next stage for the device
+    state: str = PENDING
+    detail: str | None = None
+    pre_provisioned: bool = False
+
+    def advance(self) -> None:
+        idx = STAGES.index(self.stage) + 1
+        if idx < len(STAGES):
+            self.stage = STAGES[idx]
+        else:
+            self.state = DONE
+
+    def fail(self, detail: str) -> None:
+        self.state, self.detail = FAILED, detail
+
+
+def _calls(devs: list[OnboardDevice], per_call: int) -> int:
+    return math.ceil(len(devs) / per_call)
+
+
+def _failed(resp: Response) -> str | None:
+    """Error for a failed call or async operation, None if it was successful."""
+    if not resp.ok:
+        return f"{resp.status}: {resp.error}"
+    if resp.exit_code:
+        async_resp = {} if not isinstance(resp.output, dict) else resp.output.get("async operation response") or {}
+        return f"async operation {async_resp.get('status', 'did not complete')}"
+    return None
+
+
+@dataclass
+class Onboarding:
+    devices: dict[str, OnboardDevice]
+    chunks: list[list[str]]
+    application_id: str | None = None
+    region: str | None = None
+    status: OnboardStatus = "pending"
+    file: Path | None = field(default=None, compare=False)
+
+    @classmethod
+    def plan(
+        cls,
+        devices: Iterable[dict[str, Any]],
+        *,
+        application_id: str = None,
+        region: str = None,
+        tags: dict[str, str] = None,
+        chunk_size: int = CHUNK_SIZE,
+        file: Path = None,
+    ) -> Onboarding:
+        """Plan onboarding, splitting devices into chunks.
+
+        Args:
+            devices (Iterable[dict[str, Any]]): The devices to onboard, dicts with serial, mac, and optionally subscription (id), tags, and group.
+            application_id (str, optional): The id of the service (Aruba Central) to assign the devices to. Defaults to None (no service assignment).
+            region (str, optional): The region of the service. Required if application_id is provided. Defaults to None.
+            tags (dict[str, str], optional): Tags to assign to all devices (merged with any tags defined for the device). Defaults to None.
+            chunk_size (int, optional): Number of devices that go through the stages together. Defaults to CHUNK_SIZE.
+            file (Path, optional): The file onboarding state is checkpointed to. Defaults to None (state is not saved).
+
+        Returns:
+            Onboarding: The planned Onboarding
+        """
+        if application_id and not region:
+            raise ValueError("region is required when assigning application")
+        devs = {
+            d["serial"]: OnboardDevice(d["serial"], mac=d.get("mac"), subscription=d.get("subscription"), tags={**(tags or {}), **(d.get("tags") or {})} or None, group=d.get("group"))
+            for d in devices
+        }
+        chunks = [list(chunk) for chunk in utils.chunker(list(devs), chunk_size)]
+        return cls(devs, chunks, application_id=application_id, region=region, file=file)
+
+    @classmethod
+    def load(cls, file: Path) -> Onboarding:
+        data = codec.loads(file.read_text())
+        data["devices"] = {serial: OnboardDevice(**dev) for serial, dev in data["devices"].items()}
+        return cls(**data, file=file)
+
+    def save(self) -> None:
+        """Checkpoint onboarding state to file.  The file is replaced atomically, an interruption can't leave a partial checkpoint."""
+        if self.file is None:
+            return
+        data = {k: v for k, v in asdict(self).items() if k != "file"}
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.file.with_name(f".{self.file.name}.tmp")
+        tmp.write_text(codec.dumps(data, indent=2))
+        os.replace(tmp, self.file)
+
+    def retry_failed(self) -> None:
+        """Reset failed devices so they are retried (from the stage that failed) when onboarding is resumed."""
+        for dev in self.devices.values():
+            if dev.state == FAILED:
+                dev.state, dev.detail = PENDING, None
+
+    def pre_provision(self) -> dict[str, list[str]]:
+        """Serials of the devices that completed onboarding but have not been pre-provisioned to their group yet, by group."""
+        to_group: dict[str, list[str]] = {}
+        for dev in self.devices.values():
+            if dev.group and dev.state == DONE and not dev.pre_provisioned:
+                to_group.setdefault(dev.group, []).append(dev.serial)
+        return to_group
+
+    def counts(self) -> dict[str, int]:
+        """Number of devices done, failed, and pending at each stage."""
+        counts = {stage: 0 for stage in STAGES}
+        counts.update({DONE: 0, FAILED: 0})
+        for dev in self.devices.values():
+            counts[dev.stage if dev.state == PENDING else dev.state] += 1
+        return counts
+
+    async def _add(self, api: GreenLakeAPI, devs: list[OnboardDevice], cache: Cache | None, limiter: CallLimiter) -> list[Response]:
+        resps = await api.devices.add_to_inventory([{"serial": d.serial, "mac": d.mac, "tags": d.tags} for d in devs], continue_on_fail=True)
+        for idx, chunk in enumerate(utils.chunker(devs, ADD_PER_CALL)):
+            # async op failures (i.e. already claimed) don't stop the device from moving on, the ids stage determines if it's in inventory
+            resp = None if idx >= len(resps) else resps[idx]
+            for dev in chunk:
+                if resp is not None and resp.ok:
+                    dev.advance()
+                else:
+                    dev.fail(f"add failed: {'not attempted' if resp is None else f'{resp.status}: {resp.error}'}")
+        return resps
+
+    async def _ids(self, api: GreenLakeAPI, devs: list[OnboardDevice], cache: Cache | None, limiter: CallLimiter) -> list[Response]:
+        # budget for the first attempt is acquired by the worker, fetch_glp_ids retries if GreenLake doesn't return all of the devices yet.
+        # The ids workers run concurrently with the progress display, so the retries are silent (no Spinner).
+        calls = self._estimate("ids", devs)
+        glp_id_resp = await api.devices.fetch_glp_ids([d.serial for d in devs], cache=cache, before_retry=lambda: limiter.acquire(calls), silent=True)
+        for dev in devs:
+            if glp_id_resp.exit_code:
+                dev.fail(f"failed to fetch GreenLake ids: {glp_id_resp.inv_resp.error}")
+            elif dev.serial not in glp_id_resp.new_devs_by_serial:
+                dev.fail("not found in GreenLake inventory after add")
+            else:
+                dev.id = glp_id_resp.new_devs_by_serial[dev.serial]["id"]
+                dev.advance()
+        return [glp_id_resp.inv_resp]
+
+    def _apply(self, resps: list[Response], devs: list[OnboardDevice], action: str) -> bool:
+        """Fail the devices covered by each failed call or async operation.  Returns True if any device failed."""
+        failures = False
+        for idx, chunk in enumerate(utils.chunker(devs, UPDATE_PER_CALL)):
+            resp = None if idx >= len(resps) else resps[idx]
+            error = "not attempted" if resp is None else _failed(resp)
+            failed_ids = [] if error else resp.async_failed_devices
+            for dev in chunk:
+                if error or dev.id in failed_ids:
+                    dev.fail(f"{action} failed: {error or 'async operation failed for device'}")
+                    failures = True
+        return failures
+
+    async def _service(self, api: GreenLakeAPI, devs: list[OnboardDevice], cache: Cache | None, limiter: CallLimiter) -> list[Response]:
+        resps = []
+        if self.application_id:
+            resps = await api.devices.update_devices([d.id for d in devs], application_id=self.application_id, region=self.region)
+            self._apply(resps, devs, "service assignment")
+        for dev in devs:
+            if dev.state == PENDING:
+                dev.advance()
+        return resps
+
+    async def _subscription(self, api: GreenLakeAPI, devs: list[OnboardDevice], cache: Cache | None, limiter: CallLimiter) -> list[Response]:
+        resps = []
+        for sub in dict.fromkeys([d.subscription for d in devs if d.subscription]):
+            sub_devs = [d for d in devs if d.subscription == sub]
+            sub_resps = await api.devices.update_devices([d.id for d in sub_devs], subscription_ids=sub)
+            self._apply(sub_resps, sub_devs, "subscription assignment")
+            resps += sub_resps
+        for tags in {str(d.tags): d.tags for d in devs if d.tags}.values():  # tags are ignored by the add if the device already exists
+            tag_devs = [d for d in devs if d.tags == tags and d.state == PENDING]
+            if tag_devs:
+                tag_resps = await api.devices.update_devices([d.id for d in tag_devs], tags=tags)
+                self._apply(tag_resps, tag_devs, "tag assignment")
+                resps += tag_resps
+        for dev in devs:
+            if dev.state == PENDING:
+                dev.advance()
+        return resps
+
+    def _estimate(self, stage: Stage, devs: list[OnboardDevice]) -> int:
+        """Number of calls a stage will make for devs (excluding async operation status polls, and per attempt for the ids stage)."""
+        if stage == "add":
+            return _calls(devs, ADD_PER_CALL)
+        if stage == "ids":
+            return _calls(devs, IDS_PER_CALL)
+        if stage == "service":
+            return 0 if not self.application_id else _calls(devs, UPDATE_PER_CALL)
+        subs = {d.subscription for d in devs if d.subscription}
+        tags = {str(d.tags) for d in devs if d.tags}
+        return sum(_calls([d for d in devs if d.subscription == sub], UPDATE_PER_CALL) for sub in subs) + sum(_calls([d for d in devs if str(d.tags) == t], UPDATE_PER_CALL) for t in tags)
+
+    async def _worker(
+        self,
+        stage: Stage,
+        api: GreenLakeAPI,
+        queues: dict[Stage, asyncio.Queue[list[str]]],
+        limiter: CallLimiter,
+        responses: list[Response],
+        cache: Cache | None,
+        on_update: Callable[[Onboarding], None] | None,
+    ) -> None:
+        stage_func = getattr(self, f"_{stage}")
+        while True:
+            serials = await queues[stage].get()
+            devs = [self.devices[serial] for serial in serials]
+            try:
+                calls = self._estimate(stage, devs)
+                if calls:
+                    await limiter.acquire(calls)
+                responses += await stage_func(api, devs, cache, limiter)
+            except Exception as e:
+                log.exception(f"Exception ({repr(e)}) during onboarding stage {stage} for {len(devs)} devices.")
+                for dev in devs:
+                    if dev.state == PENDING and dev.stage == stage:
+                        dev.fail(f"{stage} failed: {repr(e)}")
+            finally:
+                self.save()
+                if on_update:
+                    on_update(self)
+                passed = [dev.serial for dev in devs if dev.state == PENDING]
+                if passed:  # devices that completed a stage together move on to the next stage together
+                    queues[self.devices[passed[0]].stage].put_nowait(passed)
+                queues[stage].task_done()
+
+    async def run(
+        self,
+        api: GreenLakeAPI,
+        *,
+        cache: Cache = None,
+        limits: dict[Stage, StageLimit] = None,
+        on_update: Callable[[Onboarding], None] = None,
+    ) -> list[Response]:
+        """Run (or resume) onboarding.
+
+        Args:
+            api (GreenLakeAPI): The GreenLake API client.
+            cache (Cache, optional): The inventory cache is updated with the added devices if provided. Defaults to None.
+            limits (dict[Stage, StageLimit], optional): Per minute call budget and workers for each stage. Defaults to STAGE_LIMITS.
+            on_update (Callable[[Onboarding], None], optional): Called each time a stage completes for a chunk (i.e. to display progress). Defaults to None.
+
+        Returns:
+            list[Response]: The responses from all stages.
+        """
+        limits = {**STAGE_LIMITS, **(limits or {})}
+        self.status = "running"
+        responses: list[Response] = []
+        queues: dict[Stage, asyncio.Queue[list[str]]] = {stage: asyncio.Queue() for stage in STAGES}
+        for chunk in self.chunks:
+            by_stage: dict[Stage, list[str]] = {}
+            for serial in chunk:
+                if self.devices[serial].state == PENDING:
+                    by_stage.setdefault(self.devices[serial].stage, []).append(serial)
+            for stage, serials in by_stage.items():
+                queues[stage].put_nowait(serials)
+
+        limiters = {stage: CallLimiter(limits[stage].calls_per_min) for stage in STAGES}  # shared by the workers for the stage
+        workers = [
+            asyncio.create_task(self._worker(stage, api, queues, limiters[stage], responses, cache, on_update))
+            for stage in STAGES
+            for _ in range(limits[stage].workers)
+        ]
+        try:
+            for stage in STAGES:  # a chunk is queued for the next stage before it's marked done in the current stage
+                await queues[stage].join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        self.status = "complete" if all(dev.state == DONE for dev in self.devices.values()) else "incomplete"
+        self.save()
+        return responses
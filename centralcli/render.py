@@ -9,14 +9,13 @@ from __future__ import annotations
 import csv
 import io
 import ipaddress
-import json
 import shutil
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Optional, Type, Union
 
 import typer
 import yaml
@@ -32,9 +31,9 @@ from rich.table import Table
 from rich.text import Text
 from tabulate import tabulate
 
-from centralcli import config, constants, log, raw_out, utils
+from centralcli import codec, config, constants, log, raw_out, utils
 from centralcli.config import Config
-from centralcli.objects import DateTime, Encoder
+from centralcli.objects import DateTime
 from centralcli.vendored.csvlexer.csv import CsvLexer
 
 if TYPE_CHECKING:
@@ -287,6 +286,69 @@ def _batch_invalid_msg(usage: str, provide: str = None) -> str:  # referenced in
     return "\n".join(_msg)
 
 
+def normalize_for_csv(value: Any, key: str = None) -> str:
+    if value is None:
+        return ""
+    elif isinstance(value, DateTime):
+        return str(value.iso) if not key or key != "uptime" else str(value.durwords_short)
+    elif value in ["❌", "✅"]:
+        return "false" if value == "❌" else "true"
+    elif value == "--":
+        return ""
+    else:
+        return str(value) if "," not in str(value) else f'"{value}"'
+
+
+def normalize_key_for_csv(key: str) -> str:
+    if not isinstance(key, str):
+        return key
+    return key.replace(" ", "_").replace("\n", "_")
+
+
+def _get_outfile(outfile: Path) -> Path:
+    if config.cwd != config.outdir:
+        if (
+            outfile.parent.resolve().name == "central-api-cli" and
+            Path.joinpath(outfile.parent.resolve() / ".git").is_dir()
+        ):
+            econsole.print(
+                "\n[bright_green]You appear to be in the development git dir.\n"
+                f"Exporting to[/] [cyan]{config.outdir.relative_to(config.cwd)}[/] directory."
+            )
+            config.outdir.mkdir(exist_ok=True)
+            outfile = config.outdir / outfile
+    return outfile
+
+
+def stream_csv(outfile: Path, rows: Iterable[dict[str, Any]]) -> int:
+    """Write rows to outfile as csv as they are produced, rather than rendering the full output in memory first.
+
+    Values/headers are normalized the same as csv output from :func:`output`.
+
+    Args:
+        outfile (Path): The file to write to.
+        rows (Iterable[dict[str, Any]]): The rows, all rows are expected to have the same keys as the first.
+
+    Returns:
+        int: The number of rows written.
+    """
+    outfile = _get_outfile(outfile)
+    if not outfile.parent.is_dir():
+        econsole.print(f"[red]Directory Not Found[/]\n[dark_orange3]:warning:[/] Unable to write output to [cyan]{outfile.name}[/].\nDirectory [cyan]{str(outfile.parent.absolute())}[/] [red]does not exist[/].")
+        return 0
+
+    econsole.print(f"[cyan]Writing output to {outfile}... ", end="")
+    count = 0
+    with outfile.open("w") as f:
+        for row in rows:
+            if not count:
+                f.write(f"{','.join([normalize_key_for_csv(k) for k in row if k not in CUST_KEYS])}\n")
+            f.write(f"{','.join([normalize_for_csv(v, key=k) for k, v in row.items() if k not in CUST_KEYS])}\n")
+            count += 1
+    econsole.print("[italic green]Done[/]")
+    return count
+
+
 def write_file(outfile: Path, outdata: str, *, is_retry_file: bool = False) -> None:  # pragma: no cover this function is mocked
     """Output data to file
 
@@ -295,17 +357,7 @@ def write_file(outfile: Path, outdata: str, *, is_retry_file: bool = False) -> N
         outdata (str): The text to write.
     """
     if outfile and outdata:  # In case outdata is empty / empty response
-        if config.cwd != config.outdir:
-            if (
-                outfile.parent.resolve().name == "central-api-cli" and
-                Path.joinpath(outfile.parent.resolve() / ".git").is_dir()
-            ):
-                econsole.print(
-                    "\n[bright_green]You appear to be in the development git dir.\n"
-                    f"Exporting to[/] [cyan]{config.outdir.relative_to(config.cwd)}[/] directory."
-                )
-                config.outdir.mkdir(exist_ok=True)
-                outfile = config.outdir / outfile
+        outfile = _get_outfile(outfile)
 
         _msg = f"[cyan]Writing output to {outfile}... " if not is_retry_file else f"[cyan]Creating retry file {outfile}... "
         econsole.print(_msg, end="")
@@ -316,7 +368,7 @@ def write_file(outfile: Path, outdata: str, *, is_retry_file: bool = False) -> N
             out_msg = None
             try:
                 if isinstance(outdata, (dict, list)):
-                    outdata = json.dumps(outdata, indent=4)
+                    outdata = codec.dumps(outdata, indent=4)
                 # ensure LF at EoF
                 outdata = f"{outdata.rstrip()}\n"
                 outfile.write_text(outdata)  # typer.unstyle(outdata) also works
@@ -636,7 +688,7 @@ def output(
         outdata = utils.unlistify(outdata)
         console = Console(record=True, emoji=False)
         console.begin_capture()
-        console.print_json(json.dumps(outdata, cls=Encoder))
+        console.print_json(codec.dumps(outdata))
         table_data = console.end_capture()
         console.begin_capture()
         console.print('[bright_red]"Down"[/],')
@@ -647,30 +699,13 @@ def output(
     elif tablefmt in ["yml", "yaml"]:
         outdata = utils.unlistify(outdata)
         # TODO custom yaml Representer
-        raw_data = yaml.safe_dump(json.loads(json.dumps(outdata, cls=Encoder)), sort_keys=False)
+        raw_data = yaml.safe_dump(codec.loads(codec.dumps(outdata)), sort_keys=False)
         # table_data = rich_capture(raw_data.replace("'", ""))
         table_data = rich_capture(Syntax(rich_capture(raw_data.replace("'", "")), "yaml", background_color=None, theme='native'))
         table_data = Text.from_ansi(table_data, overflow="fold")
         ...
 
     elif tablefmt == "csv":
-        def normalize_for_csv(value: Any, key: str = None) -> str:
-            if value is None:
-                return ""
-            elif isinstance(value, DateTime):
-                return str(value.iso) if not key or key != "uptime" else str(value.durwords_short)
-            elif value in ["❌", "✅"]:
-                return "false" if value == "❌" else "true"
-            elif value == "--":
-                return ""
-            else:
-                return str(value) if "," not in str(value) else f'"{value}"'
-
-        def normalize_key_for_csv(key: str) -> str:
-            if not isinstance(key, str):
-                return key
-            return key.replace(" ", "_").replace("\n", "_")
-
         csv_data = "\n".join(
             [
                 ",".join(
@@ -1009,7 +1044,7 @@ def _display_results(
 
     if stash:
         config.last_command_file.write_text(
-            json.dumps({k: v if not isinstance(v, DateTime) else v.ts for k, v in kwargs.items() if k != "config"}, cls=Encoder)
+            codec.dumps({k: v if not isinstance(v, DateTime) else v.ts for k, v in kwargs.items() if k != "config"})
         )
 
     # display output to screen.
@@ -1144,7 +1179,7 @@ def display_results(
                         econsole.print("[bold cyan]Unformatted response from Aruba Central API GW[/bold cyan]")
                         plain_console = Console(color_system=None, emoji=False)
                         if config.dev.sanitize:  # pragma: no cover
-                            r.raw = json.loads(Output().sanitize_strings(json.dumps(r.raw), config=config))
+                            r.raw = codec.loads(Output().sanitize_strings(codec.dumps(r.raw), config=config))
                         if pager:  # pragma: no cover
                             with plain_console.pager():
                                 plain_console.print(r.raw)
@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import json
 from collections.abc import Callable
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Mapping, Union
@@ -12,7 +11,7 @@ from aiohttp import ClientResponse
 from rich.console import Console
 from yarl import URL
 
-from centralcli import config, log, utils
+from centralcli import codec, config, log, utils
 from centralcli.environment import env
 from centralcli.exceptions import CentralCliException
 from centralcli.objects import DateTime
@@ -268,7 +267,7 @@ class Response:
             return res.content.decode("utf-8")
 
         def combine_response(url: str, out: dict) -> dict | None:  # TODO add handler to create METHOD key in ok_responses/failed_responses if it doesn't exist.  i.e. failed_responses["DELETE"] currently KeyError if DELETE doesn't exist
-            now = {} if not config.closed_capture_file.exists() else (config.closed_capture_file.read_text() and json.loads(config.closed_capture_file.read_text())) or {}
+            now = {} if not config.closed_capture_file.exists() else (config.closed_capture_file.read_text() and codec.loads(config.closed_capture_file.read_text())) or {}
             if env.current_test:  # Use of --test <test name> when using --capture-raw will capture and place under a specific test key
                 key = f"{self.method}_{url}{self.mock_key_append or ''}"
                 log.info(f"Prepped new MOCK for {env.current_test}[{key}]")
@@ -307,17 +306,17 @@ class Response:
 
         try:
             if self.raw:
-                _ = json.dumps(self.raw)  # This is just to catch any issues with payload so we can fallback to body
+                _ = codec.dumps(self.raw)  # This is just to catch any issues with payload so we can fallback to body
                 out["payload"] = self.raw
             # elif self._response:
             #     out["body"] = _get_body(self._response)
-        except json.JSONDecodeError as e:
-            log.exception(f"response.dump() encountered JSONDecodeError\n{e}", show=True)
+        except (TypeError, ValueError) as e:
+            log.exception(f"response.dump() encountered {type(e).__name__}\n{e}", show=True)
             # out["body"] = _get_body(self._response)
             out["payload"] = _get_body(self._response)
 
         combined_out = combine_response(_url.path_qs, out)
-        return None if not combined_out else config.closed_capture_file.write_text(json.dumps(combined_out, indent=2, sort_keys=False))
+        return None if not combined_out else config.closed_capture_file.write_text(codec.dumps(combined_out, indent=2))
 
     def __bool__(self):
         if self._ok is not None:
@@ -413,8 +412,8 @@ class Response:
         if isinstance(self.output, str) and "{\n" in self.output:
             try:
                 log.warning(f"Response was sent JSON formatted output from [{self.method}]{self.url}")
-                self.output = json.loads(self.output)
-            except json.JSONDecodeError:
+                self.output = codec.loads(self.output)
+            except codec.JSONDecodeError:
                 log.error(f"Failed to decode output from [{self.method}]{self.url}")
 
         # indent single line output
@@ -533,7 +532,7 @@ class Response:
     def __bytes__(self):
         if not self.output:
             return
-        r = json.dumps(self.output)
+        r = codec.dumps(self.output)
         return r.encode("UTF-8")
 
     def __getattr__(self, name: str) -> Any:
@@ -576,33 +575,24 @@ class Response:
         else:
             raise TypeError("output attribute is not a valid type for keys method.")
 
-    def __add__(self, other):
-        if not isinstance(self.raw, dict) or not isinstance(other.raw, dict):
-            raise TypeError("raw attribute is expected to be a dict")
-        if not isinstance(self.output, list) or not isinstance(other.output, list):
-            raise TypeError("output attribute is expected to be a list")
-
-        if not self.data_key:
-            found_keys = [k for k in self.raw if self.raw[k] == self.output]
-            if len(found_keys) != 1:
-                raise ValueError(f"Unable to add Response, unable to determine primary key with data.  Found {len(found_keys)} potential data keys.")
-
-        key = self.data_key or found_keys[0]
+    def _get_data_key(self) -> str:
+        """Determine (and cache) the key in raw that holds the data in output.
 
-        self.raw[key] = self.raw[key] + other.raw[key]
-        if "count" in self.raw and "count" in other.raw:
-            self.raw["count"] += other.raw["count"]
-        if self.url.path == "/monitoring/v2/events":  # events url will change the total on subsequent pagination events could go up or down.
-            self.raw["total"] = other.raw["total"]
+        The key is normally the same list object as output (the outer key is stripped from raw), so an identity check is tried
+        before falling back to comparing the values.
+        """
+        if self.data_key:
+            return self.data_key
 
-        if isinstance(self.output, list) and isinstance(other.output, list):
-            self.output += other.output
-        else:
-            raise TypeError("Output attribute is expected to be a list")
+        found_keys = [k for k, v in self.raw.items() if v is self.output] or [k for k, v in self.raw.items() if isinstance(v, list) and v == self.output]
+        if len(found_keys) != 1:
+            raise ValueError(f"Unable to add Response, unable to determine primary key with data.  Found {len(found_keys)} potential data keys.")
 
-        self.rl = min([r.rl for r in [self, other]])
+        self.data_key = found_keys[0]
+        return self.data_key
 
-        return self
+    def __add__(self, other: Response) -> Response:
+        return PageAccumulator(self).add(other).merge()
 
     @property
     def table(self) -> List[Dict[str, Any]]:
@@ -623,6 +613,60 @@ class Response:
         return self.status
 
 
+class PageAccumulator:
+    """Collects the pages of a paginated API response, and merges them into the first Response.
+
+    Pages are concatenated once (on merge) into a single list shared by ``output`` and ``raw[data_key]`` of the first Response,
+    rather than building a new list for raw and output with each page.
+
+    Args:
+        response (Response): The Response for the first page.
+    """
+    def __init__(self, response: Response) -> None:
+        self.response = self._validate(response)
+        self.pages: list[Response] = []
+
+    def __len__(self) -> int:
+        return len(self.response.output) + sum(len(page.output) for page in self.pages)
+
+    @staticmethod
+    def _validate(response: Response) -> Response:
+        if not isinstance(response.raw, dict):
+            raise TypeError("raw attribute is expected to be a dict")
+        if not isinstance(response.output, list):
+            raise TypeError("output attribute is expected to be a list")
+        return response
+
+    def add(self, response: Response) -> PageAccumulator:
+        self.pages += [self._validate(response)]
+        return self
+
+    def extend(self, responses: list[Response]) -> PageAccumulator:
+        for response in responses:
+            self.add(response)
+        return self
+
+    def merge(self) -> Response:
+        resp = self.response
+        if not self.pages:
+            return resp
+
+        key = resp._get_data_key()
+        data = resp.output
+        for page in self.pages:
+            data.extend(page.output)
+        resp.raw[key] = data  # raw and output share the same list
+
+        if "count" in resp.raw and all("count" in page.raw for page in self.pages):
+            resp.raw["count"] += sum(page.raw["count"] for page in self.pages)
+        if resp.url.path == "/monitoring/v2/events":  # events url will change the total on subsequent pagination events could go up or down.
+            resp.raw["total"] = self.pages[-1].raw["total"]
+
+        resp.rl = min([resp.rl, *[page.rl for page in self.pages]])
+        self.pages = []
+        return resp
+
+
 class BatchResponse:
     _rl: RateLimit
     _exit_code: int = 0
@@ -756,35 +800,33 @@ class CombinedResponse(Response):
 
         elapsed = 0
         raw = {}
-        output = []
+        outputs = []
         output_type = None
-        res_idx = 0
         for r in _passed or _failed:  # if no requests passed we loop through _failed to retain output {"message": "error message..."}
-            this_raw = r.raw.copy()
-            raw[r.url.path] = this_raw
+            raw[r.url.path] = r.raw
 
             if not r.output:
                 continue  # skip responses that returned no output as output will always be an empty dict.  Where output with values is likely a list[dict]
 
-            this_output = r.output.copy()
-            if res_idx == 0:
-                output_type = type(r.output)
-                output = this_output
-            else:
-                if output_type is list:
-                    output += this_output
-                elif output_type is dict:
-                    output = {**output, **this_output}
-                else:
-                    raise CentralCliException(f"flatten_resp received unexpected output attribute type {type(r.output)}.  Expected dict or list.")  # pragma: no cover
+            output_type = output_type or type(r.output)
+            if output_type not in [list, dict] or not isinstance(r.output, output_type):
+                raise CentralCliException(f"flatten_resp received unexpected output attribute type {type(r.output)}.  Expected dict or list.")  # pragma: no cover
+            outputs += [r.output]
             if r.elapsed:
                 elapsed += r.elapsed
-            res_idx += 1  # we don't use enumerate so we can skip combining output for devs that returned an empty payload
+
+        # outputs are combined once, into a new list/dict so the output of the individual responses is not modified.
+        if output_type is dict:
+            output = {k: v for out in outputs for k, v in out.items()}
+        elif output_type is list:
+            output = [item for out in outputs for item in out]
+        else:
+            output = []
 
         # failed responses are added to end of raw output
         if _passed:
             for r in _failed:
-                raw[r.url.path] = r.raw.copy()
+                raw[r.url.path] = r.raw
 
         # for combining device calls, adds consistent "type" to all devices
         def _get_type(data: dict) -> Literal["ap", "gw", "sw", "cx"] | None:
@@ -0,0 +1,308 @@
+"""Wave based firmware rollout.
+
+``upgrade device|group|swarm`` initiate an upgrade and return, progress is then checked via ``show upgrade``.  A rollout splits
+the target devices into waves (by site, group, or percentage of the devices), initiates the upgrade for one wave at a time, and
+polls ``get_upgrade_status`` for the devices in the wave concurrently.  The poll interval backs off while nothing is changing and
+resets when it does.  The next wave only starts if the success rate of the wave meets the threshold, otherwise the rollout halts.
+
+Rollout state is checkpointed to a json file after every upgrade and status poll, an interrupted (or halted) rollout can be
+resumed from the file (``cencli upgrade rollout --resume <file>``).
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from . import codec, log
+from .client import BatchRequest
+
+if TYPE_CHECKING:
+    from .classic.api import ClassicAPI
+    from .response import Response
+
+WaveBy = Literal["site", "group", "percent"]
+RolloutStatus = Literal["pending", "running", "halted", "complete"]
+
+PENDING, UPGRADING, SUCCESS, FAILED, IDLE = "pending", "upgrading", "success", "failed", "idle"
+POLL_MIN = 30  # seconds
+POLL_MAX = 300
+POLL_BACKOFF = 1.5
+WAVE_TIMEOUT = 3600  # devices that have not completed the upgrade within WAVE_TIMEOUT seconds are considered failed
+IDLE_POLLS = 3  # devices reporting no upgrade in progress for this many consecutive status polls are considered failed
+CALLS_PER_WAVE_RESERVE = 10  # estimated status polls per device, a wave is not started if the daily rate limit can't cover it
+VERSION_KEYS = ("firmware_version", "current_version", "version")
+
+
+def upgrade_state(status: dict[str, Any], version: str = None) -> str:
+    """Normalize the output of get_upgrade_status to one of upgrading | success | failed | idle.
+
+    A device reporting the target version is upgraded, whatever the state says.  States that show no upgrade in progress
+    (i.e. none, idle) or are not recognized are idle.
+    """
+    reported = next((str(status[key]) for key in VERSION_KEYS if status.get(key)), None)
+    if version and reported and reported.strip().lower() == version.strip().lower():
+        return SUCCESS
+    text = " ".join(str(status.get(key) or "") for key in ("state", "status", "firmware_upgrade_state")).lower()
+    if any(word in text for word in ("fail", "error", "abort", "cancel")):
+        return FAILED
+    if any(word in text for word in ("success", "complete", "upgraded")):
+        return SUCCESS
+    if any(word in text for word in ("progress", "upgrading", "download", "install", "reboot", "schedul", "pending", "initiat", "queue")):
+        return UPGRADING
+    return IDLE
+
+
+@dataclass
+class RolloutDevice:
+    serial: str
+    name: str
+    type: str
+    site: str | None = None
+    group: str | None = None
+    swarm_id: str | None = None
+    state: str = PENDING
+    detail: str | None = None
+    idle_polls: int = 0
+
+    @property
+    def upgrade_kwargs(self) -> dict[str, str]:
+        """APs are upgraded (and report status) by swarm, everything else by serial."""
+        if self.type != "ap":
+            return {"serial": self.serial}
+        if not self.swarm_id:
+            raise ValueError(f"AP {self.name} ({self.serial}) has no swarm_id, APs can only be upgraded by swarm_id.")
+        return {"swarm_id": self.swarm_id}
+
+    @property
+    def upgrade_key(self) -> str:
+        return self.upgrade_kwargs.get("swarm_id") or self.serial
+
+
+def _units(devices: Iterable[RolloutDevice]) -> list[list[RolloutDevice]]:
+    """Devices grouped by the upgrade call that covers them (all APs in a swarm are upgraded together, so are in the same wave)."""
+    units: dict[str, list[RolloutDevice]] = {}
+    for dev in devices:
+        units.setdefault(dev.upgrade_key, []).append(dev)
+    return list(units.values())
+
+
+def _split(units: list[list[RolloutDevice]], size: int | None) -> list[list[str]]:
+    waves, wave = [], []
+    for unit in units:
+        if wave and size and len(wave) + len(unit) > size:
+            waves += [wave]
+            wave = []
+        wave += [dev.serial for dev in unit]
+    return [*waves, wave] if wave else waves
+
+
+@dataclass
+class Rollout:
+    devices: dict[str, RolloutDevice]
+    waves: list[list[str]]
+    version: str | None = None
+    reboot: bool = False
+    threshold: float = 95.0
+    wave: int = 0
+    status: RolloutStatus = "pending"
+    detail: str | None = None
+    file: Path | None = field(default=None, compare=False)
+
+    @classmethod
+    def plan(
+        cls,
+        devices: Iterable[Any],
+        version: str = None,
+        *,
+        by: WaveBy = "site",
+        percent: int = 10,
+        max_wave_size: int = None,
+        reboot: bool = False,
+        threshold: float = 95.0,
+        file: Path = None,
+    ) -> Rollout:
+        """Plan a rollout, splitting devices into waves.
+
+        Args:
+            devices (Iterable[Any]): The devices to upgrade, objects with serial, name, type, site, group and swack_id attributes (i.e. CacheDevice).
+            version (str, optional): Version to upgrade to. Defaults to None (recommended version).
+            by (WaveBy, optional): One wave per site, per group, or waves of percent % of the devices. Defaults to "site".
+            percent (int, optional): Size of each wave as a percentage of all devices (by="percent"). Defaults to 10.
+            max_wave_size (int, optional): Split waves with more than max_wave_size devices. Defaults to None (no limit).
+            reboot (bool, optional): Reboot devices after the upgrade (APs always reboot). Defaults to False.
+            threshold (float, optional): % of devices in a wave that must upgrade successfully for the rollout to continue. Defaults to 95.0.
+            file (Path, optional): The file rollout state is checkpointed to. Defaults to None (state is not saved).
+
+        Raises:
+            ValueError: If any of the APs lack a swarm_id (APs can only be upgraded by swarm_id).
+
+        Returns:
+            Rollout: The planned Rollout
+        """
+        devs = {
+            d.serial: RolloutDevice(d.serial, d.name, d.type, site=d.site, group=d.group, swarm_id=d.swack_id)
+            for d in sorted(devices, key=lambda d: (str(getattr(d, by, None) or ""), d.name))
+        }
+        no_swarm = [dev.name for dev in devs.values() if dev.type == "ap" and not dev.swarm_id]
+        if no_swarm:
+            raise ValueError(f"APs can only be upgraded by swarm_id, no swarm_id for {len(no_swarm)} APs: {', '.join(no_swarm)}")
+        units = _units(devs.values())
+        if by == "percent":
+            size = max(1, math.ceil(len(devs) * percent / 100))
+            waves = _split(units, size if not max_wave_size else min(size, max_wave_size))
+        else:
+            by_attr: dict[str, list[list[RolloutDevice]]] = {}
+            for unit in units:
+                by_attr.setdefault(getattr(unit[0], by) or "", []).append(unit)
+            waves = [wave for attr_units in by_attr.values() for wave in _split(attr_units, max_wave_size)]
+
+        return cls(devs, waves, version=version, reboot=reboot, threshold=threshold, file=file)
+
+    @classmethod
+    def load(cls, file: Path) -> Rollout:
+        data = codec.loads(file.read_text())
+        data["devices"] = {serial: RolloutDevice(**dev) for serial, dev in data["devices"].items()}
+        return cls(**data, file=file)
+
+    def save(self) -> None:
+        """Checkpoint rollout state to file.  The file is replaced atomically, an interruption can't leave a partial checkpoint."""
+        if self.file is None:
+            return
+        data = {k: v for k, v in asdict(self).items() if k != "file"}
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.file.with_name(f".{self.file.name}.tmp")
+        tmp.write_text(codec.dumps(data, indent=2))
+        os.replace(tmp, self.file)
+
+    def wave_devices(self, wave: int = None) -> list[RolloutDevice]:
+        return [self.devices[serial] for serial in self.waves[self.wave if wave is None else wave]]
+
+    def success_rate(self, wave: int = None) -> float:
+        devs = self.wave_devices(wave)
+        return 100.0 if not devs else len([d for d in devs if d.state == SUCCESS]) / len(devs) * 100
+
+    def retry_failed(self) -> None:
+        """Reset failed devices in the current wave so their upgrade is initiated again when the rollout is resumed."""
+        for dev in self.wave_devices():
+            if dev.state == FAILED:
+                dev.state, dev.detail, dev.idle_polls = PENDING, None, 0
+
+    async def _upgrade(self, api: ClassicAPI, devs: list[RolloutDevice]) -> list[Response]:
+        units = _units([d for d in devs if d.state == PENDING])
+        if not units:
+            return []
+        reqs = [
+            BatchRequest(
+                api.firmware.upgrade_firmware,
+                firmware_version=self.version,
+                reboot=self.reboot or unit[0].type == "ap",
+                forced=None if not unit[0].type == "gw" else True,
+                **unit[0].upgrade_kwargs,
+            )
+            for unit in units
+        ]
+        resps: list[Response] = await api.session._batch_request(reqs, continue_on_fail=True)
+        for idx, unit in enumerate(units):
+            resp = None if idx >= len(resps) else resps[idx]
+            for dev in unit:
+                dev.state = UPGRADING if resp else FAILED
+                dev.detail = None if resp else f"upgrade request failed: {'no response' if resp is None else resp.error}"
+        self.save()
+        return resps
+
+    async def _poll(self, api: ClassicAPI, devs: list[RolloutDevice], poll_min: float, poll_max: float, timeout: float, on_update: Callable[[Rollout], None] | None) -> list[Response]:
+        interval, deadline = poll_min, time.monotonic() + timeout
+        last: list[Response] = []
+        while units := _units([d for d in devs if d.state == UPGRADING]):
+            if time.monotonic() >= deadline:
+                for dev in [dev for unit in units for dev in unit]:
+                    dev.state, dev.detail = FAILED, f"upgrade did not complete within {timeout}s"
+                break
+
+            await asyncio.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+            reqs = [BatchRequest(api.firmware.get_upgrade_status, **unit[0].upgrade_kwargs) for unit in units]
+            resps: list[Response] = await api.session._batch_request(reqs, continue_on_fail=True)
+            changed = False
+            for unit, resp in zip(units, resps):
+                if not resp or not isinstance(resp.output, dict):  # failed status poll, will be polled again
+                    continue
+                state = upgrade_state(resp.output, self.version)
+                detail = resp.output.get("reason") or resp.output.get("state") or resp.output.get("status")
+                if state == IDLE:  # no upgrade in progress (yet), allow a few polls for the upgrade to start
+                    for dev in unit:
+                        dev.idle_polls += 1
+                    if unit[0].idle_polls < IDLE_POLLS:
+                        continue
+                    state, detail = FAILED, f"no upgrade in progress after {IDLE_POLLS} status polls (state: {detail or 'none'})"
+                if state == UPGRADING:
+                    for dev in unit:
+                        dev.idle_polls = 0
+                else:
+                    changed = True
+                    for dev in unit:
+                        dev.state, dev.detail = state, detail
+            self.save()
+            if on_update:
+                on_update(self)
+            interval = poll_min if changed else min(interval * POLL_BACKOFF, poll_max)
+            last = resps
+
+        return last
+
+    def _quota_ok(self, resps: list[Response], needed: int) -> bool:
+        rl = next((r.rl for r in reversed(resps) if r.rl.call_performed), None)
+        return rl is None or not rl.total_day or rl.remain_day >= needed
+
+    async def run(
+        self,
+        api: ClassicAPI,
+        *,
+        poll_min: float = POLL_MIN,
+        poll_max: float = POLL_MAX,
+        timeout: float = WAVE_TIMEOUT,
+        on_update: Callable[[Rollout], None] = None,
+    ) -> bool:
+        """Run (or resume) the rollout.
+
+        Args:
+            api (ClassicAPI): The API client.
+            poll_min (float, optional): Initial (and minimum) interval between upgrade status polls. Defaults to POLL_MIN.
+            poll_max (float, optional): Maximum interval between upgrade status polls. Defaults to POLL_MAX.
+            timeout (float, optional): Devices that have not completed the upgrade within timeout seconds of the start of the wave
+                are considered failed. Defaults to WAVE_TIMEOUT.
+            on_update (Callable[[Rollout], None], optional): Called after each status poll (i.e. to display progress). Defaults to None.
+
+        Returns:
+            bool: True if the rollout completed, False if it halted.
+        """
+        self.status, self.detail = "running", None
+        resps: list[Response] = []
+        while self.wave < len(self.waves):
+            devs = self.wave_devices()
+            if resps and not self._quota_ok(resps, len(devs) * CALLS_PER_WAVE_RESERVE):
+                self.status, self.detail = "halted", f"wave {self.wave + 1} not started, remaining daily API rate limit is too low to complete it."
+                break
+
+            log.info(f"Rollout wave {self.wave + 1} of {len(self.waves)}: {len(devs)} devices.")
+            resps = await self._upgrade(api, devs)
+            resps = await self._poll(api, devs, poll_min=poll_min, poll_max=poll_max, timeout=timeout, on_update=on_update) or resps
+
+            rate = self.success_rate()
+            if rate < self.threshold:
+                self.status, self.detail = "halted", f"wave {self.wave + 1} success rate {rate:.1f}% is below the {self.threshold}% threshold."
+                break
+            self.wave += 1
+            self.save()
+        else:
+            self.status = "complete"
+
+        if self.detail:
+            log.warning(f"Rollout halted, {self.detail}")
+        self.save()
+        return self.status == "complete"
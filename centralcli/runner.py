@@ -0,0 +1,175 @@
+"""Long lived event loop used to run async API calls from sync code, and pooling of aiohttp client sessions.
+
+``Session.request`` / ``Session.batch_request`` previously called ``asyncio.run`` for every call, creating and tearing down an
+event loop (and the aiohttp session / connections) each time.  They now submit to a single event loop running in a
+background (daemon) thread, which is started on first use and stopped at exit.  aiohttp client sessions opened on that loop
+are pooled and reused by subsequent calls, so connections are kept alive across calls.
+
+Scripts using centralcli as a library from async code can get the same connection reuse via the async context manager on
+the API clients / Session (i.e. ``async with ClassicAPI() as api: ...``), which uses a :class:`ClientPool` for the duration
+of the block.
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from collections.abc import Callable, Coroutine, Hashable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Optional, Type, TypeVar
+
+from aiohttp.client import ClientSession
+
+from . import log
+
+T = TypeVar("T")
+
+_clients: ContextVar[dict[Hashable, ClientSession] | None] = ContextVar("centralcli_clients", default=None)
+
+
+def get_client(key: Hashable, factory: Callable[[], ClientSession]) -> ClientSession | None:
+    """Get the pooled aiohttp ClientSession for key, if calls in the current context are pooled.
+
+    Args:
+        key (Hashable): Identifies sessions that can be shared (i.e. base_url and session options).
+        factory (Callable[[], ClientSession]): Called to create the session if there is not an open one in the pool.
+
+    Returns:
+        ClientSession | None: The pooled session, None if the current context is not pooled (caller should use a session
+            scoped to the call).
+    """
+    clients = _clients.get()
+    if clients is None:
+        return None
+
+    client = clients.get(key)
+    if client is None or client.closed:
+        client = clients[key] = factory()
+    return client
+
+
+async def _close_clients(clients: dict[Hashable, ClientSession]) -> None:
+    for client in [c for c in clients.values() if not c.closed]:
+        await client.close()
+    clients.clear()
+
+
+class ClientPool:
+    """Async context manager, aiohttp sessions used by API calls made within the block are reused and closed on exit."""
+    def __init__(self) -> None:
+        self._token: Token | None = None
+        self._clients: dict[Hashable, ClientSession] = {}
+
+    async def __aenter__(self) -> ClientPool:
+        if _clients.get() is None:  # nested pools share the outer pool
+            self._token = _clients.set(self._clients)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if self._token is not None:
+            _clients.reset(self._token)
+            self._token = None
+            await _close_clients(self._clients)
+
+
+class PooledContext:
+    """Mixin for API clients.  ``async with client:`` pools connections for all API calls made within the block."""
+    async def __aenter__(self):
+        pool = ClientPool()
+        await pool.__aenter__()
+        self.__dict__.setdefault("_pools", []).append(pool)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.__dict__["_pools"].pop().__aexit__(exc_type, exc_val, exc_tb)
+
+
+@dataclass
+class _Raised:
+    exc: BaseException
+
+
+class LoopRunner:
+    """An event loop running in a dedicated thread, with a sync facade (run) to execute coroutines on it."""
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._clients: dict[Hashable, ClientSession] = {}
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="centralcli-loop", daemon=True)
+                self._thread.start()
+        return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def in_loop(self) -> bool:
+        """True if called from the runner's thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    async def _run(self, coro: Coroutine[Any, Any, T]) -> T | _Raised:
+        _clients.set(self._clients)
+        before = asyncio.all_tasks()
+        try:
+            return await coro
+        except (SystemExit, KeyboardInterrupt) as e:  # would propagate out of run_forever and kill the loop thread, re-raised in the calling thread
+            return _Raised(e)
+        finally:  # wait for any tasks the coroutine spawned but didn't await (i.e. cache updates), as asyncio.run would not return until they were done.
+            pending = asyncio.all_tasks() - before - {asyncio.current_task()}
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run coro on the background loop, blocking until it completes.
+
+        Raises:
+            RuntimeError: If called from a coroutine running on the runner loop (await the coroutine instead).
+        """
+        if self.in_loop():
+            coro.close()
+            raise RuntimeError("LoopRunner.run called from the runner event loop, await the coroutine instead.")
+
+        future = asyncio.run_coroutine_threadsafe(self._run(coro), self.loop)
+        try:
+            result = future.result()
+        except KeyboardInterrupt:
+            future.cancel()
+            raise
+        if isinstance(result, _Raised):
+            raise result.exc
+        return result
+
+    def close(self, timeout: float = 5) -> None:
+        """Close pooled client sessions and stop the loop (registered to run at exit)."""
+        if not self.running:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(_close_clients(self._clients), self._loop).result(timeout=timeout)
+        except Exception as e:  # pragma: no cover
+            log.debug(f"{repr(e)} closing pooled client sessions (LoopRunner.close)")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=timeout)
+        self._loop.close()
+
+
+runner = LoopRunner()
+atexit.register(runner.close)
@@ -20,7 +20,7 @@ from starlette.requests import Request  # NoQA
 from starlette.responses import FileResponse
 
 from centralcli import MyLogger, cache, config, api_clients, common
-from centralcli.client import BatchRequest
+from centralcli.client import BatchRequest, Session as APISession
 from centralcli.models.sql import WebHookData
 from centralcli.models.webhook import BranchResponse, HookResponse, wh_resp_schema
 from centralcli.response import Response as Response
@@ -338,6 +338,13 @@ async def alerts_by_serial(request: Request, serial: str = None):
         log.exception(e)
 
 
+@app.get("/api/v1.0/stats")
+async def request_stats(request: Request):
+    """API request stats by endpoint (count, failed, retries, 429s, p50/p95 latency in seconds) since the proxy started."""
+    log_request(request, "fetching API request stats")
+    return APISession.request_stats()
+
+
 @app.post("/webhook", status_code=200, response_model=HookResponse, responses=wh_resp_schema)
 async def webhook(
     data: dict,
@@ -34,7 +34,7 @@ from centralcli.models.alerts import Alerts
 from centralcli.response import BatchResponse, Response, RateLimit
 from centralcli.strings import emoji
 from centralcli.cache import Cache
-from centralcli.client import BatchRequest
+from centralcli.client import BatchRequest, Session
 from centralcli.cache import DBAction
 from centralcli.objects import DateTime
 from centralcli.objects.cache import CacheDevice, CacheSite
@@ -978,6 +978,12 @@ async def redoc_html():
     )
 
 
+@app.get("/api/stats")
+async def request_stats() -> list[dict[str, str | int | float | None]]:
+    """API request stats by endpoint (count, failed, retries, 429s, p50/p95 latency in seconds) since the watcher started."""
+    return Session.request_stats()
+
+
 @app.post("/webhook", status_code=200, response_model=HookResponse, responses=wh_resp_schema)
 async def webhook(
     data: dict,
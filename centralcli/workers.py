@@ -0,0 +1,75 @@
+"""Opt-in process pool used to shard CPU heavy, stateless per-record cleaner work across cores.
+
+Enabled by setting ``cleaner_workers`` (number of worker processes) in the config.  Disabled by default (0), and always
+skipped for small payloads where the cost of starting the pool outweighs the gain.
+
+Workers are forked so the per-record function and any shared dependencies (i.e. a device name map) are handed to each
+worker once via the pool initializer, rather than pickled with every record.  Platforms without fork run serially.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from centralcli import config, log
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+MIN_RECORDS = 5_000  # payloads smaller than this are always cleaned in process
+CHUNKS_PER_WORKER = 4
+
+_func: Callable[..., Any] | None = None
+_deps: dict[str, Any] = {}
+
+
+def _init_worker(func: Callable[..., Any], deps: dict[str, Any]) -> None:
+    global _func, _deps
+    _func, _deps = func, deps
+
+
+def _run_chunk(chunk: Sequence[Any]) -> list[Any]:
+    return [_func(record, **_deps) for record in chunk]
+
+
+def get_workers(workers: int | None = None) -> int:
+    """Number of worker processes to use, 0 if the parallel path is disabled or not supported on this platform."""
+    workers = workers if workers is not None else (getattr(config, "cleaner_workers", 0) or 0)
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 0
+    workers = min(workers, os.cpu_count() or 1)
+    return workers if workers > 1 else 0
+
+
+def map_records(func: Callable[..., R], records: Sequence[T], *, workers: int | None = None, min_records: int = MIN_RECORDS, **deps: Any) -> list[R]:
+    """Apply func to each record, sharded across a pool of worker processes when enabled.
+
+    Output order matches the order of records.  Falls back to a serial map if the pool is disabled, the payload is
+    below min_records, or the pool fails.
+
+    Args:
+        func (Callable[..., R]): Stateless function called as func(record, **deps) for each record.
+        records (Sequence[T]): The records to process.
+        workers (int, optional): Number of worker processes. Defaults to None (config.cleaner_workers).
+        min_records (int, optional): Only use the pool if there are at least this many records. Defaults to MIN_RECORDS.
+        **deps: Keyword arguments passed to func for every record, sent to each worker once.
+
+    Returns:
+        list[R]: The results of func for each record.
+    """
+    workers = get_workers(workers)
+    if not workers or len(records) < max(min_records, workers):
+        return [func(record, **deps) for record in records]
+
+    size = -(-len(records) // (workers * CHUNKS_PER_WORKER))
+    chunks = [records[idx:idx + size] for idx in range(0, len(records), size)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"), initializer=_init_worker, initargs=(func, deps)) as pool:
+            return [result for chunk in pool.map(_run_chunk, chunks) for result in chunk]
+    except (BrokenProcessPool, OSError) as e:
+        log.warning(f"Parallel {getattr(func, '__name__', func)} failed ({repr(e)}), falling back to serial processing of {len(records)} records.")
+        return [func(record, **deps) for record in records]
@@ -1,14 +1,16 @@
 # pragma: exclude file  Still a WIP
+import asyncio
 import base64
 import ipaddress
 from functools import lru_cache
 from itertools import groupby
-from typing import Literal
+from typing import Any, Literal
 
 import aiohttp
-from google.protobuf.json_format import MessageToDict
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import Message
 from rich import inspect
-from rich.console import Console
+from rich.console import Console, Group
 
 from centralcli import api_clients, render
 from centralcli.models.config import WSSConfig
@@ -18,18 +20,24 @@ from centralcli.typedefs import LogType
 from . import cache, config, log, utils
 from .objects import DateTime
 from .protobuf import audit_pb2, monitoring_pb2, streaming_pb2
+from .ws_store import StreamStore
 
 api = api_clients.classic
 console = Console(emoji=False)
 econsole = Console(stderr=True)
 
-FieldType = Literal["mac", "ip", "essid"]
+FieldType = Literal["mac", "ip", "essid", "network", "bytes"]
 mac_fields = ["macaddr", "peer_mac", "local_mac", "radio_mac", "interface_mac"]
 ip_fields = ["ip_address", "src_ip", "dst_ip"]
 strip_fields = ["customer_id"]
 iden_fields = ["device_id"]
 
 IGNORED_MSG_TYPES = ["STAT_UPLINK", "STAT_CLIENT"]
+IGNORED_DATA_ELEMENTS = frozenset(monitoring_pb2.DataElement.Value(t) for t in IGNORED_MSG_TYPES)
+STREAM_QUEUE_SIZE = 1000  # max messages buffered between the websocket receiver and the renderer, oldest are dropped when full
+RENDER_BATCH_SIZE = 25  # max messages decoded/rendered per batch
+ADDR_MESSAGES = {"MacAddress": "mac", "IpAddress": "ip"}  # message types decoded from their addr (bytes) field
+INT_IP_FIELDS = ["probe_ip_addr", "vpnc_ip_addr"]  # uint fields that carry an IPv4 address
 
 pretty_value = {
     "ADD": "[bright_green]ADD[/]",
@@ -42,15 +50,21 @@ pretty_value = {
 
 # TODO need to convert mac / ip / essid fields as described in readme of https://github.com/aruba/central-python-workflows/tree/main/streaming-api-client
 
+def _hex(data: Any) -> Any:
+    """Colon-separated hex for raw bytes, anything else is returned as is."""
+    return data.hex(":") if isinstance(data, (bytes, bytearray)) else data
+
+
 def _decode(data, field_type: FieldType = "ip"):
     """
     Decode fields from protobuf payloads.
 
     - If `data` is a base64-encoded string (MessageToDict output), decode to bytes.
     - If already bytes/bytearray, use as-is.
-    - For 'essid' return UTF-8 string (fallback to bytes on decode error).
+    - For 'essid' return UTF-8 string.
     - For 'ip' return human-readable address (IPv4 or IPv6) via ipaddress.
     - For 'mac' return colon-separated lower-case MAC using utils.Mac.
+    - Anything else, or anything that fails to decode, is returned as colon-separated hex (bytes are never returned, so the result is json serializable).
     """
     try:
         raw = None
@@ -74,7 +88,7 @@ def _decode(data, field_type: FieldType = "ip"):
                 if field_type in ["essid", "network"]:
                     return data
                 if field_type == "ip":
-                    if data.is_digit():  # Some ip address fields represented as str(int) i.e. probeIp
+                    if data.isdigit():  # Some ip address fields represented as str(int) i.e. probeIp
                         raw = int(data)
                     else:
                         return data
@@ -95,7 +109,7 @@ def _decode(data, field_type: FieldType = "ip"):
             try:
                 return raw.decode("utf-8", errors="replace")
             except Exception:
-                return raw
+                return _hex(raw)
         if field_type == "ip":
             # raw might be bytes (base64-decoded), or an integer already (MessageToDict can return ints for some proto variants)
             try:
@@ -108,14 +122,50 @@ def _decode(data, field_type: FieldType = "ip"):
                 # fallback: dotted decimal for 4-byte IPv4
                 if isinstance(raw, (bytes, bytearray)) and len(raw) == 4:
                     return '.'.join(str(b) for b in raw)
-                return raw
+                return _hex(raw)
         if field_type == "mac":
             return utils.Mac(raw).cols
 
-        return ':'.join(f'{b:02x}' for b in raw)
+        return _hex(raw)
     except Exception as e:
         log.exception(f"Exception while attempting to decode {field_type} in wss payload.  \n{e}")
-        return data
+        return _hex(data)
+
+
+def _pb_value(field: FieldDescriptor, value: Any) -> Any:
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        addr_type = ADDR_MESSAGES.get(field.message_type.name)
+        if addr_type:  # MacAddress / IpAddress, decode straight from the bytes field
+            return _decode(value.addr, field_type=addr_type)
+        return _pb_to_dict(value)
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        enum_value = field.enum_type.values_by_number.get(value)
+        return value if enum_value is None else enum_value.name
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return _decode(value, field_type="essid" if field.name in ["essid", "network"] else "bytes")
+    if field.name in INT_IP_FIELDS:
+        return _decode(value, field_type="ip")
+    return value
+
+
+def _pb_to_dict(pb_data: Message) -> dict[str, Any]:
+    """Convert a protobuf message to a dict, decoding mac/ip/essid fields as they are walked.
+
+    Keys use the camelCase json name (same as MessageToDict), but bytes are decoded directly from the message
+    rather than round-tripping through base64, enums are converted to their names, and int64 values remain int.
+    Only populated fields are included.
+    """
+    return {
+        field.json_name: [_pb_value(field, v) for v in value] if field.is_repeated else _pb_value(field, value)
+        for field, value in pb_data.ListFields()
+    }
+
+
+def _is_wanted(pb_data: monitoring_pb2.MonitoringInformation | audit_pb2.audit_message) -> bool:
+    """Filter on message type prior to decoding.  Audit messages have no data elements and are always wanted."""
+    if not isinstance(pb_data, monitoring_pb2.MonitoringInformation):
+        return True
+    return any(e not in IGNORED_DATA_ELEMENTS for e in pb_data.data_elements)
 
 
 async def _clean_mon_data(data: monitoring_pb2.MonitoringInformation):
@@ -244,22 +294,13 @@ def get_macs(as_dict, key) -> dict:
     }
     for mkey in mac_keys.keys():
         if mkey == "timestamp":
-            macs = [DateTime(iface[mkey]) for iface in as_dict[key] if mkey in iface]
+            as_dict[key] = [{k: v if k != mkey else DateTime(v) for k, v in inner.items()} for inner in as_dict[key]]
         elif mkey in ["deviceId", "associatedDevice"]:
             as_dict = get_devices(as_dict, key=key)
-            continue
         elif mkey == "uptime":
             as_dict = {**as_dict, key: [{k: v if k != "uptime" else DateTime(v, "durwords-short", round_to_minute=True) for k, v in inner.items()} for inner in as_dict[key]]}
-            continue
-        elif mkey in ["essid", "network"]:
-            macs = [_decode(iface[mkey], field_type=mkey) for iface in as_dict[key] if mkey in iface]
-        elif mkey in ["probeIpAddr"]:
-            macs = [_decode(iface[mkey], field_type=mac_keys[mkey].split("_")[-1]) for iface in as_dict[key] if mkey in iface]
-        else:
-            macs = [_decode(iface[mkey]["addr"], field_type=mac_keys[mkey].split("_")[-1]) for iface in as_dict[key] if mkey in iface]
-
-        if macs:
-            as_dict[key] = [{k if k != mkey else mac_keys[mkey]: v if k != mkey else mac for k, v in iface.items()} for iface, mac in zip(as_dict[key], macs)]
+        else:  # values are decoded as the protobuf message is walked (_pb_to_dict), just rename the key
+            as_dict[key] = [{k if k != mkey else mac_keys[mkey]: v for k, v in iface.items()} for iface in as_dict[key]]
 
     return as_dict
 
@@ -269,15 +310,18 @@ def get_ips(as_dict, key) -> dict:
         "ipAddress": "ip",
     }
     for ip_key in ip_keys.keys():
-        ips = [_decode(iface[ip_key]["addr"]) for iface in as_dict[key] if ip_key in iface]
+        ips = [iface[ip_key] for iface in as_dict[key] if ip_key in iface]
         if ips:
             as_dict[key] = [{k if k != ip_key else ip_keys[ip_key]: v if k != ip_key else ip for k, v in iface.items()} for iface, ip in zip(as_dict[key], ips)]
 
     return as_dict
 
 
-def format_pb_data(pb_data: monitoring_pb2.MonitoringInformation) -> dict:
-    as_dict = MessageToDict(pb_data)
+def format_pb_data(pb_data: monitoring_pb2.MonitoringInformation | audit_pb2.audit_message, as_dict: dict | None = None) -> dict:
+    as_dict = _pb_to_dict(pb_data) if as_dict is None else {**as_dict}
+    if isinstance(pb_data, audit_pb2.audit_message):
+        return {"timestamp": DateTime(pb_data.timestamp), **{k: v for k, v in as_dict.items() if k not in ["timestamp", "customerId"]}}
+
     if pb_data.interfaces:
         allowed_vlans = [extract_ranges(iface["allowedVlan"]) for iface in as_dict["interfaces"] if "allowedVlan" in iface]
         if allowed_vlans:
@@ -332,9 +376,88 @@ def format_pb_data(pb_data: monitoring_pb2.MonitoringInformation) -> dict:
     if pb_data.tunnels:
         as_dict = get_macs(as_dict, "tunnels")
 
-    as_dict = {"timestamp": DateTime(pb_data.timestamp), **{k: v for k, v in as_dict.items() if k != "timestamp"}}  # Move timestamp to top and format
-    del as_dict["customerId"]
-    return as_dict
+    return {"timestamp": DateTime(pb_data.timestamp), **{k: v for k, v in as_dict.items() if k not in ["timestamp", "customerId"]}}  # Move timestamp to top and format
+
+
+def _enqueue(queue: asyncio.Queue, item: bytes | None) -> bool:
+    """Put item on the bounded stream queue, dropping the oldest message if it is full.
+
+    Returns:
+        bool: True if a message was dropped to make room.
+    """
+    dropped = False
+    if queue.full():
+        queue.get_nowait()
+        dropped = True
+    queue.put_nowait(item)
+    return dropped
+
+
+async def _receive(ws: aiohttp.ClientWebSocketResponse, queue: asyncio.Queue) -> None:
+    """Feed raw websocket payloads to the queue.  No decoding is done here so the receive loop keeps up with the stream."""
+    dropped = 0
+    try:
+        async for msg in ws:
+            if msg.type == aiohttp.WSMsgType.BINARY:
+                if _enqueue(queue, msg.data):
+                    dropped += 1
+                    if dropped == 1 or dropped % STREAM_QUEUE_SIZE == 0:
+                        log.warning(f"Stream renderer is falling behind, {dropped} messages have been dropped.", show=True)
+            elif msg.type == aiohttp.WSMsgType.ERROR:
+                econsole.print(msg.data)
+                break
+            else:
+                econsole.print(f"Got unexpected type {msg.type}")
+    finally:
+        _enqueue(queue, None)  # signal end of stream to the consumer
+
+
+def _render_batch(
+    batch: list[bytes],
+    parser: type[monitoring_pb2.MonitoringInformation] | type[audit_pb2.audit_message],
+    store: StreamStore | None = None,
+) -> None:
+    """Parse, filter, decode, (optionally) persist, and render a batch of raw stream payloads.  Runs in a worker thread."""
+    messages: list[tuple[monitoring_pb2.MonitoringInformation | audit_pb2.audit_message, dict]] = []
+    for raw in batch:
+        stream_data = streaming_pb2.MsgProto()
+        stream_data.ParseFromString(raw)
+
+        pb_data = parser()
+        pb_data.ParseFromString(stream_data.data)
+        if _is_wanted(pb_data):
+            messages.append((pb_data, _pb_to_dict(pb_data)))
+
+    if not messages:
+        return
+
+    if store is not None:
+        store.add("audit" if parser is audit_pb2.audit_message else "monitoring", [as_dict for _, as_dict in messages])
+
+    outputs = [render.output([format_pb_data(pb_data, as_dict=as_dict)], tablefmt="yaml", config=config) for pb_data, as_dict in messages]
+    console.print(Group(*outputs), emoji=False)
+
+
+async def _consume(
+    queue: asyncio.Queue,
+    parser: type[monitoring_pb2.MonitoringInformation] | type[audit_pb2.audit_message],
+    store: StreamStore | None = None,
+) -> None:
+    """Pull whatever is queued (up to RENDER_BATCH_SIZE) and render it off the event loop."""
+    while True:
+        batch = [await queue.get()]
+        while batch[-1] is not None and len(batch) < RENDER_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+
+        done = batch[-1] is None
+        batch = [raw for raw in batch if raw is not None]
+        if batch:
+            try:
+                await asyncio.to_thread(_render_batch, batch, parser, store)
+            except Exception as e:
+                log.exception(f"{repr(e)} while rendering batch of {len(batch)} streaming messages.\n{e}", show=True)
+        if done:
+            return
 
 
 # TODO base_url will be required once not hardcoded, need to determine if base-url can be determined reliably from central base and provide config option for it.
@@ -342,15 +465,13 @@ async def follow_logs(wss_config: WSSConfig, log_type: LogType = "event"):
     base_url = wss_config.base_url  # TODO makes sense for config.url to returl URL object.  All urls should be URL object
 
     if log_type == "event":
-        pb_data = monitoring_pb2.MonitoringInformation()
         parser = monitoring_pb2.MonitoringInformation
         topic = "monitoring"
     else:  # audit
-        pb_data = audit_pb2.audit_message()
         parser = audit_pb2.audit_message
         topic = "audit"
 
-    resp = await api.other.validate_wss_key(base_url.replace(r"wss://", r"https://"), wss_config.key)  # TODO need to cache wss key
+    resp = await api.other.validate_wss_key(base_url.replace(r"wss://", r"https://"), wss_config.key)  # never cached (see httpcache.NEVER_CACHE), the key is replaced when it expires
     if not resp.ok:
         log.error("Unable to validate wss key.", caption=True)
         render.display_results(resp, exit_on_fail=True)
@@ -363,25 +484,15 @@ async def follow_logs(wss_config: WSSConfig, log_type: LogType = "event"):
         headers["UserName"] = config.username
     session = aiohttp.ClientSession(base_url=base_url, headers=headers)
 
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    store = None if not wss_config.store else StreamStore(config.stream_store_file, retention=wss_config.retention)
     try:
         async with session as s:
             async with s.ws_connect('/streaming/api') as ws:
-                async for msg in ws:
-                    if msg.type == aiohttp.WSMsgType.BINARY:
-                        stream_data = streaming_pb2.MsgProto()
-                        stream_data.ParseFromString(msg.data)
-
-                        pb_data = parser()
-                        pb_data.ParseFromString(stream_data.data)
-                        # asyncio.create_task(_clean_data(monitoring_data))
-                        if [t for t in MessageToDict(pb_data).get("dataElements", []) if t not in IGNORED_MSG_TYPES]:
-                            pb_dict = format_pb_data(pb_data)
-                            render.display_results(data=pb_dict, tablefmt="yaml")
-                    elif msg.type == aiohttp.WSMsgType.ERROR:
-                        econsole.print(msg.data)
-                        break
-                    else:
-                        econsole.print(f"Got unexpected type {msg.type}")
+                await asyncio.gather(_receive(ws, queue), _consume(queue, parser, store))
 
     except aiohttp.WSServerHandshakeError as e:
         econsole.print(f"[dark_orange3]\u26a0[/]  {e.message}  Make sure you are subscribed to monitoring logs in Central UI")
+    finally:
+        if store is not None:
+            store.close()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from . import log
+
+PRUNE_INTERVAL = 300  # seconds between retention sweeps while the stream is being persisted
+SERIAL_KEYS = ["serial", "deviceId", "associatedDevice"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts INTEGER NOT NULL,
+    topic TEXT NOT NULL,
+    msg_type TEXT NOT NULL COLLATE NOCASE,
+    serial TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS idx_events_serial ON events (serial, ts);
+CREATE INDEX IF NOT EXISTS idx_events_msg_type ON events (msg_type, ts);
+"""
+
+
+def _rows(topic: str, ts: int, data: dict[str, Any]) -> list[tuple[int, str, str, str | None, str]]:
+    """Explode a decoded streaming message into one row per item.
+
+    Monitoring messages are split by section (i.e. wirelessClients, interfaces) with the section name as the msg_type.
+    Audit messages are stored as a single row with the audit service as the msg_type.
+    """
+    if topic == "audit":
+        return [(ts, topic, data.get("service", "audit"), data.get("target"), json.dumps(data))]
+
+    rows = []
+    for msg_type, items in data.items():
+        if msg_type in ["customerId", "timestamp", "dataElements"] or not isinstance(items, list):
+            continue
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            serial = next((item[k] for k in SERIAL_KEYS if item.get(k)), None)
+            rows.append((ts, topic, msg_type, serial, json.dumps(item)))
+    return rows
+
+
+class StreamStore:
+    """Append only SQLite (WAL) store for decoded streaming API messages, with time based rolling retention.
+
+    Args:
+        file (Path): The SQLite db file.
+        retention (int, optional): Hours of history retained.  Older rows are pruned as new rows are written. Defaults to 24.
+    """
+    def __init__(self, file: Path, retention: int = 24) -> None:
+        self.file = file
+        self.retention = retention * 3600
+        self._last_prune = 0.0
+        # check_same_thread=False as batches are written from a worker thread, writes are serialized by the stream consumer.
+        self.conn = sqlite3.connect(file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __repr__(self) -> str:  # pragma: no cover  used for debug
+        return f"<{type(self).__name__} {self.file.name} (retention: {self.retention // 3600}h)>"
+
+    def __enter__(self) -> StreamStore:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def add(self, topic: str, messages: list[dict[str, Any]]) -> int:
+        """Persist a batch of decoded messages in a single transaction.
+
+        Returns:
+            int: The number of rows written.
+        """
+        ts = int(time.time())
+        rows = [row for data in messages for row in _rows(topic, ts, data)]
+        if rows:
+            with self.conn:
+                self.conn.executemany("INSERT INTO events (ts, topic, msg_type, serial, data) VALUES (?, ?, ?, ?, ?)", rows)
+
+        if time.monotonic() - self._last_prune > PRUNE_INTERVAL:
+            self.prune()
+
+        return len(rows)
+
+    def prune(self) -> int:
+        """Delete rows older than the retention period.
+
+        Returns:
+            int: The number of rows deleted.
+        """
+        with self.conn:
+            deleted = self.conn.execute("DELETE FROM events WHERE ts < ?", (int(time.time()) - self.retention,)).rowcount
+        self._last_prune = time.monotonic()
+        if deleted:
+            log.debug(f"Pruned {deleted} streaming events older than {self.retention // 3600}h from {self.file.name}")
+        return deleted
+
+    def query(
+        self,
+        serial: str | list[str] = None,
+        msg_type: str = None,
+        topic: str = None,
+        start: datetime = None,
+        end: datetime = None,
+        count: int = None,
+    ) -> list[dict[str, Any]]:
+        """Query persisted streaming events, newest first.
+
+        Args:
+            serial (str | list[str], optional): Filter by device serial(s). Defaults to None.
+            msg_type (str, optional): Filter by message type (i.e. wirelessClients), case insensitive. Defaults to None.
+            topic (str, optional): Filter by topic (monitoring or audit). Defaults to None.
+            start (datetime, optional): Only events received at or after start. Defaults to None.
+            end (datetime, optional): Only events received at or before end. Defaults to None.
+            count (int, optional): Max number of events to return. Defaults to None (all).
+
+        Returns:
+            list[dict[str, Any]]: The events, each with ts, topic, msg_type, serial keys plus the message data.
+        """
+        where, params = [], []
+        if serial:
+            serials = [serial] if isinstance(serial, str) else serial
+            where += [f"serial IN ({', '.join('?' * len(serials))})"]
+            params += serials
+        if msg_type:
+            where += ["msg_type = ?"]
+            params += [msg_type]
+        if topic:
+            where += ["topic = ?"]
+            params += [topic]
+        if start:
+            where += ["ts >= ?"]
+            params += [int(start.timestamp())]
+        if end:
+            where += ["ts <= ?"]
+            params += [int(end.timestamp())]
+
+        sql = "SELECT ts, topic, msg_type, serial, data FROM events"
+        if where:
+            sql += f" WHERE {' AND '.join(where)}"
+        sql += " ORDER BY ts DESC, id DESC"
+        if count:
+            sql += " LIMIT ?"
+            params += [count]
+
+        keys = ["ts", "topic", "msg_type", "serial"]
+        return [{**dict(zip(keys, row[:-1])), **json.loads(row[-1])} for row in self.conn.execute(sql, params)]
+
+    def close(self) -> None:
+        self.conn.close()
@@ -16,6 +16,11 @@ def test(s: Session) -> None:
     s.run("python", "-m", "pytest")
 
 
+@session(uv_groups=["bench"])
+def bench(s: Session) -> None:
+    s.run("python", "-m", "pytest", "benchmarks", *s.posargs)
+
+
 @session(uv_only_groups=["lint"])
 def lint(s: Session) -> None:
     s.run("ruff", "check", ".")
@@ -9,12 +9,15 @@ from rich.traceback import install
 from typer.testing import CliRunner
 
 from centralcli import cache, common, config, log
+from centralcli.cache import Cache
+from centralcli.cache.resolver import ResolverCache
+from centralcli.cache.tinydb import CacheResponses
 from centralcli.cli import app
 from centralcli.client import Session
-from centralcli.models.sql import MPSK, Client, Group, Portal, Site, Label, Cert, Subscription, FloorPlanAP
+from centralcli.models.sql import MPSK, Base, Client, Group, Portal, Site, Label, Cert, Subscription, FloorPlanAP
 from centralcli.typedefs import PrimaryDeviceTypes
 from centralcli.cache.sqlite import DBAction
-from sqlalchemy import delete
+from sqlalchemy import create_engine, delete
 from sqlalchemy.orm import Session as SQLSession
 
 from . import mock_sleep, test_data
@@ -259,9 +262,7 @@ def session_setup_teardown():
 
 @pytest.fixture(scope='function', autouse=True)
 def clear_lru_caches():
-    cache.get_inv_identifier.cache_clear()
-    cache.get_combined_inv_dev_identifier.cache_clear()
-    cache.get_name_id_identifier.cache_clear()
+    cache.resolver_cache.clear()
     # for db in cache._tables:
     #     db.clear_cache()
     cache.responses.clear()
@@ -1731,3 +1732,14 @@ def ensure_not_cache_b4_adds():
 def ensure_old_config():
     yield config._mock()
     return config._mock(True)
+
+
+@pytest.fixture(scope="function")
+def memory_cache():
+    """Cache backed by an empty in memory sqlite db (all tables created), independent of the cache file used by the CLI tests."""
+    mem_cache = Cache.__new__(Cache)
+    mem_cache.config, mem_cache.engine, mem_cache.generation, mem_cache.resolver_cache = config, create_engine("sqlite://"), 0, ResolverCache()
+    mem_cache.responses, mem_cache._fuzzy_indexes = CacheResponses(), {}
+    Base.metadata.create_all(mem_cache.engine)
+    yield mem_cache
+    mem_cache.engine.dispose()
@@ -0,0 +1,51 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+from centralcli.auth import AuthManager
+
+
+class FakeAuth:
+    def __init__(self):
+        self.central_info = {"token": {"access_token": "token0"}}
+        self.expires = None
+
+
+def _manager() -> tuple[AuthManager, FakeAuth, list[int], Callable[[], bool]]:
+    auth, calls = FakeAuth(), []
+
+    def refresh() -> bool:
+        time.sleep(0.05)  # blocking token store I/O, ran in a worker thread
+        calls.append(1)
+        auth.central_info["token"]["access_token"] = f"token{len(calls)}"
+        auth.expires = time.time() + 7200
+        return True
+
+    return AuthManager(lambda: auth, lambda a: a.expires), auth, calls, refresh
+
+
+def test_auth_manager_single_flight_refresh():
+    manager, auth, calls, refresh = _manager()
+    assert manager.auth is auth and manager.auth is auth  # built once
+
+    async def on_401():
+        return await manager.refresh(refresh, stale_token="token0")
+
+    async def fan_out():
+        return await asyncio.gather(*[on_401() for _ in range(20)])
+
+    assert all(asyncio.run(fan_out()))
+    assert len(calls) == 1 and manager.access_token == "token1"
+
+
+def test_auth_manager_proactive_refresh():
+    manager, auth, calls, refresh = _manager()
+    asyncio.run(manager.ensure_fresh(refresh))
+    assert not calls  # expiry unknown
+
+    auth.expires = time.time() + 60
+    asyncio.run(manager.ensure_fresh(refresh))
+    assert len(calls) == 1 and not manager.expiring
+
+    asyncio.run(manager.ensure_fresh(refresh))
+    assert len(calls) == 1
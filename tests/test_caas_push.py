@@ -0,0 +1,42 @@
+import asyncio
+
+from centralcli import caas
+from centralcli.response import Response
+
+BULK_EDIT = """# comment
+Mac Address,Group,Hostname,Vlan Id
+aa:bb:cc:dd:ee:01,g1,gw1,10
+aa:bb:cc:dd:ee:02,g1,gw2,10
+aa:bb:cc:dd:ee:03,g2,gw3,20
+"""
+
+
+def _resp(status: int) -> Response:
+    return Response(url="/caasapi/v1/exec/cmd", output={"_global_result": {"status": status}}, status_code=200, ok=True)
+
+
+def test_caas_push_concurrent_with_retry_file(tmp_path, monkeypatch):
+    file = tmp_path / "bulkedit.csv"
+    file.write_text(BULK_EDIT)
+    caasapi, results = caas.CaasAPI(), []
+
+    async def send_commands(group_dev, cli_cmds=None):
+        await asyncio.sleep(0.01)
+        return _resp(1 if group_dev.endswith("02") else 0)
+
+    async def _batch_request(reqs, continue_on_fail=False):
+        return await asyncio.gather(*[r.func(*r.args, **r.kwargs) for r in reqs])
+
+    monkeypatch.setattr(caasapi, "send_commands", send_commands)
+    monkeypatch.setattr(caas.api.session, "_batch_request", _batch_request)
+    cmds_by_dev = {f"g1/aa:bb:cc:dd:ee:0{idx}": [f"hostname gw{idx}", "!"] for idx in range(1, 4)}
+    resps = asyncio.run(caasapi.push_commands(cmds_by_dev, on_result=lambda group_dev, resp: results.append(group_dev)))
+
+    assert list(resps) == list(cmds_by_dev) and sorted(results) == list(cmds_by_dev)
+    failed = [group_dev.split("/")[-1] for group_dev, resp in resps.items() if not caas.push_ok(resp)]
+    assert failed == ["aa:bb:cc:dd:ee:02"]
+
+    retry_file = caasapi.write_retry_file(file, failed)
+    assert retry_file.name == "bulkedit_retry.csv"
+    assert retry_file.read_text().splitlines() == ["Mac Address,Group,Hostname,Vlan Id", "aa:bb:cc:dd:ee:02,g1,gw2,10"]
+    assert list(caasapi.get_bulkedit_data(retry_file)) == ["aa:bb:cc:dd:ee:02"]
@@ -0,0 +1,63 @@
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from centralcli import log
+from centralcli.cache import Cache
+from centralcli.models.sql import Device
+
+
+def _dev(idx: int, type: str = "cx", **kwargs) -> dict:
+    return {
+        "name": f"{type}-{idx}", "status": "Up", "type": type, "model": "6300M", "ip": f"10.0.0.{idx}", "serial": f"CN{idx:08d}",
+        "mac": f"20:4c:03:00:00:{idx:02x}", "group": "g1", "site": "s1", "version": "10.15", "swack_id": None, "switch_role": None, **kwargs
+    }
+
+
+def _add_devs(cache: Cache, devs: list[dict]) -> Cache:
+    with Session(cache.engine) as session:
+        session.execute(insert(Device), devs)
+        session.commit()
+    return cache
+
+
+def test_get_dev_identifiers_bulk_exact_and_prefix(memory_cache: Cache):
+    cache = _add_devs(memory_cache, [_dev(idx) for idx in range(1, 251)] + [_dev(251, "ap")])
+    queries = ["CN00000001", "cx-2", "CX-3", "20:4c:03:00:00:04", "10.0.0.5", "cx-250", "CN00000001"]
+    devs = cache.get_dev_identifiers(queries)
+    assert [d.serial for d in devs] == ["CN00000001", "CN00000002", "CN00000003", "CN00000004", "CN00000005", "CN00000250", "CN00000001"]
+    assert cache.get_dev_identifiers(["ap-25"])[0].serial == "CN00000251"  # prefix match (fallback)
+    assert cache.get_dev_identifiers(["cx-1", "CN00000251"], dev_type="switch", retry=False, exit_on_fail=False)[1] is None
+
+
+def test_get_dev_identifiers_single_refresh_for_all_misses(monkeypatch, memory_cache: Cache):
+    cache = _add_devs(memory_cache, [_dev(idx) for idx in range(1, 11)])
+    refreshes = []
+
+    def check_fresh(**kwargs):
+        refreshes.append(kwargs)
+        _add_devs(cache, [_dev(300), _dev(301), _dev(302)])
+
+    monkeypatch.setattr(cache, "check_fresh", check_fresh)
+    devs = cache.get_dev_identifiers(["cx-1", "cx-300", "CN00000301", "cx-302", "cx-999"], silent=True, exit_on_fail=False)
+    assert [d and d.name for d in devs] == ["cx-1", "cx-300", "cx-301", "cx-302", None]
+    assert refreshes == [{"refresh": True, "dev_type": None, "dev_db": True, "inv_db": False}]  # one refresh for all 4 misses
+
+    refreshes.clear()
+    assert [d.name for d in cache.get_dev_identifiers(["cx-2", "cx-300"])] == ["cx-2", "cx-300"]
+    assert not refreshes  # no misses, no refresh
+
+
+def test_get_dev_identifiers_dev_type_miss(monkeypatch, memory_cache: Cache):
+    cache = _add_devs(memory_cache, [_dev(1), _dev(2, "ap")])
+    refreshes, errors = [], []
+    monkeypatch.setattr(cache, "check_fresh", lambda **kwargs: refreshes.append(kwargs))
+    monkeypatch.setattr(log, "error", lambda msg, **kwargs: errors.append(msg))
+
+    cache.responses.device_type = ["ap"]  # ap devices were already refreshed in this session
+    assert cache.get_dev_identifiers(["ap-2", "cx-1"], dev_type="ap", silent=True, exit_on_fail=False) == [cache.get_dev_identifier("ap-2"), None]
+    assert not refreshes
+    assert "excluded as device type != ap" in errors[-1] and "cx-1" in errors[-1]
+
+    cache.responses.device_type = None
+    cache.get_dev_identifiers(["cx-1"], dev_type="ap", silent=True, exit_on_fail=False)
+    assert refreshes == [{"refresh": True, "dev_type": ["ap"], "dev_db": True, "inv_db": False}]
@@ -0,0 +1,44 @@
+from centralcli.cache.columnar import ColumnarTable
+
+inv = [
+    {"serial": "CN0001", "type": "ap", "model": "AP-635"},
+    {"serial": "CN0002", "type": "cx", "model": "6300M"},
+    {"serial": "CN0003", "type": "gw", "model": "9004"},
+]
+dev = [
+    {"serial": "CN0002", "type": "cx", "model": "6300M 48G", "name": "sw1", "status": "Up"},
+    {"serial": "CN0004", "type": "ap", "model": "AP-515", "name": "ap2", "status": "Down"},
+]
+
+
+def test_columnar_filter():
+    table = ColumnarTable.from_dicts("inventory", inv)
+    assert table.where(type=["cx", "gw"]).get("serial").tolist() == ["CN0002", "CN0003"]
+    assert table.where(not_type="ap").get("serial").tolist() == ["CN0002", "CN0003"]
+
+
+def test_columnar_outer_join_keeps_inventory_model():
+    combined = ColumnarTable.from_dicts("inventory", inv).join(ColumnarTable.from_dicts("devices", dev), how="outer", keep=["model"])
+    by_serial = {d["serial"]: d for d in combined.to_dicts()}
+    assert list(by_serial) == ["CN0001", "CN0002", "CN0003", "CN0004"]
+    assert by_serial["CN0002"]["model"] == "6300M"
+    assert by_serial["CN0002"]["name"] == "sw1"
+    assert by_serial["CN0004"]["model"] == "AP-515"
+
+
+def test_columnar_right_join():
+    combined = ColumnarTable.from_dicts("inventory", inv).join(ColumnarTable.from_dicts("devices", dev), how="right")
+    assert sorted(combined.get("serial").tolist()) == ["CN0002", "CN0004"]
+
+
+def test_columnar_to_dicts_omits_missing_keys():
+    inv_by_serial, dev_by_serial = {d["serial"]: d for d in inv}, {d["serial"]: {**d} for d in dev}
+    dev_by_serial["CN0004"].pop("status")  # keys a row never had are omitted, not None
+    combined = ColumnarTable.from_dicts("inventory", inv).join(ColumnarTable.from_dicts("devices", list(dev_by_serial.values())), how="outer", keep=["model"])
+    expected = {
+        serial: {**inv_by_serial.get(serial, {}), **dev_by_serial.get(serial, {}), "model": inv_by_serial.get(serial, {}).get("model", dev_by_serial.get(serial, {}).get("model"))}
+        for serial in [*inv_by_serial, "CN0004"]
+    }
+    assert {d["serial"]: d for d in combined.to_dicts()} == expected
+    assert "name" not in combined.to_dicts()[0] and combined.to_dicts()[0].get("name", "n/a") == "n/a"
+    assert combined.where(type="ap").to_dicts() == [expected["CN0001"], expected["CN0004"]]
@@ -0,0 +1,51 @@
+from sqlalchemy import insert
+
+from centralcli.cache import Cache
+from centralcli.models.sql import Device
+from centralcli.objects.cache import CacheClient, CacheDevice, CacheInvDevice
+
+DEV = {"name": "ap-1", "status": "Up", "type": "AP", "model": "635", "ip": "10.0.0.1", "serial": "CN00000001", "mac": "20:4c:03:00:00:01", "group": "g1", "site": "s1", "version": "10.7.1.0", "swack_id": "CN00000001", "switch_role": None}
+
+
+def test_cache_record_from_row_matches_dict():
+    dev = CacheDevice(DEV)
+    row_dev = CacheDevice.from_row(tuple(dev[f] for f in CacheDevice.fields))
+    assert not hasattr(dev, "__dict__")
+    assert dev.type == "ap" and dev["type"] == "ap"
+    assert dev.data == row_dev.data == {**DEV, "type": "ap"}
+    assert dev == row_dev and hash(dev) == hash(row_dev)
+    assert dev.text.plain == row_dev.text.plain == "ap-1|ap|Up|CN00000001|20:4c:03:00:00:01|10.0.0.1|635"
+    assert dev.is_dev and not dev.is_inv
+    assert dev.generic_type == "ap"
+
+
+def test_cache_record_mapping_access():
+    inv = CacheInvDevice({"serial": "CN00000001", "mac": "20:4c:03:00:00:01", "type": "ap", "sku": "R7J28A", "services": "advanced-ap"})
+    assert inv.subscription == inv.services == inv["subscription"] == "advanced-ap"
+    assert inv.get("archived") is None and list(inv) == list(CacheInvDevice.fields)
+    assert dict(inv)["sku"] == "R7J28A"
+    client = CacheClient({"mac": "ac:de:48:00:00:01", "name": "c1", "type": "wireless", "site": "s1"})
+    assert client.text.plain == "c1|ac:de:48:00:00:01|s:s1|wireless"
+    client["name"] = "c2"
+    assert client.text.plain.startswith("c2|")
+    assert client.data["name"] == "c2"
+    client.data["site"] = "s2"
+    assert client.site == client["site"] == client.data["site"] == "s2"
+    client.data.update(type="wired")
+    assert client.type == client["type"] == client.data["type"] == "wired"
+    assert client.text.plain == "c2|ac:de:48:00:00:01|s:s2|wired"
+    assert inv["services"] == inv.data["subscription"] == "advanced-ap" and "services" in inv
+    inv["services"] = "foundation-ap"
+    assert inv.subscription == inv.services == inv.data["subscription"] == "foundation-ap"
+    assert inv.get("not_a_field") is None
+
+
+def test_cache_rows_projection_and_streaming(memory_cache: Cache):
+    cache = memory_cache
+    devs = [{**DEV, "name": f"ap-{idx}", "serial": f"CN{idx:08d}", "type": "ap"} for idx in range(25)]
+    with cache.engine.begin() as connection:
+        connection.execute(insert(Device), devs)
+
+    assert [tuple(row) for row in cache.rows(Device, "serial", "name", where=Device.name == "ap-3")] == [("CN00000003", "ap-3")]
+    assert [row.serial for row in cache.rows(Device, "serial", yield_per=10)] == [d["serial"] for d in devs]
+    assert [d.data for d in cache._get_all(Device, CacheDevice)] == devs
@@ -0,0 +1,45 @@
+import asyncio
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from centralcli.cache import Cache
+from centralcli.cache.resolver import _MISSING, ResolverCache
+from centralcli.cache.sqlite import DBAction
+from centralcli.models.sql import Device
+
+
+def test_resolver_cache_lru_eviction():
+    memo = ResolverCache(maxsize=2)
+    memo.set("a", 0, 1)
+    memo.set("b", 0, 2)
+    assert memo.get("a", 0) == 1  # a is now most recently used
+    memo.set("c", 0, 3)
+    assert len(memo) == 2
+    assert memo.get("b", 0) is _MISSING
+    assert memo.get("c", 0) == 3
+
+
+def test_resolver_cache_generation_invalidates():
+    memo = ResolverCache()
+    memo.set("a", 0, 1)
+    assert memo.get("a", 1) is _MISSING
+    assert len(memo) == 0
+    assert (memo.hits, memo.misses) == (0, 1)
+
+
+def test_get_dev_identifier_memo_invalidated_by_update_db(memory_cache: Cache):
+    dev = {
+        "name": "cx-1", "status": "Up", "type": "cx", "model": "6300M", "ip": "10.0.0.1", "serial": "CN00000001",
+        "mac": "20:4c:03:00:00:01", "group": "g1", "site": "s1", "version": "10.15", "swack_id": None, "switch_role": None,
+    }
+    with Session(memory_cache.engine) as session:
+        session.execute(insert(Device), [dev])
+        session.commit()
+
+    assert memory_cache.get_dev_identifier("cx-1").status == "Up"
+    assert memory_cache.get_dev_identifier("cx-1").status == "Up"
+    assert memory_cache.resolver_cache.hits == 1
+
+    asyncio.run(memory_cache._update_db(Device, data=[{**dev, "status": "Down"}], action=DBAction.UPSERT))
+    assert memory_cache.get_dev_identifier("cx-1").status == "Down"  # the generation bump invalidated the memoized lookup
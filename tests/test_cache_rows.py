@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+
+from centralcli.models.cache import Clients, Devices, client_cache_rows, device_cache_rows, inventory_cache_rows
+
+RAW_DEVICES = [
+    {"type": "ap", "name": "ap-1", "status": "Up", "model": "AP-635", "ip_address": "10.0.0.1", "macaddr": "20:4c:03:00:00:01", "serial": "CN00000001", "group_name": "g1", "site": "s1", "firmware_version": "10.7.1.0", "swarm_id": "CN00000001"},
+    {"type": None, "switch_type": "ArubaCX", "name": "cx-1", "status": "Down", "model": "6300M", "ip_address": "10.0.0.2", "macaddr": "20:4c:03:00:00:02", "serial": "CN00000002", "group_name": "g1", "firmware_version": "10.15", "stack_id": None},
+]
+RAW_CLIENTS = [
+    {"macaddr": "ac:de:48:00:00:01", "name": "c1", "ip_address": "10.1.0.1", "client_type": "WIRELESS", "network": "corp", "associated_device": "CN00000001", "group_name": "g1", "site": "s1", "last_connection_time": 1760000000123},
+    {"macaddr": "ac:de:48:00:00:02", "client_type": "WIRED", "interface_port": "1/1/1", "associated_device": "CN00000002"},
+]
+
+
+def test_device_cache_rows_match_model():
+    raw = {"aps": RAW_DEVICES[0:1], "switches": [{k: v for k, v in RAW_DEVICES[1].items() if k != "type"}]}
+    devs = Devices(**raw)
+    assert device_cache_rows(raw) == [d.model_dump() for d in [*devs.aps, *devs.switches]]
+
+
+def test_client_cache_rows_match_model():
+    rows = client_cache_rows(RAW_CLIENTS)
+    assert rows == Clients(RAW_CLIENTS).cache_dump()
+    assert rows[0]["type"] == "wireless" and rows[0]["last_connected"] == 1760000000
+
+
+def test_inventory_cache_rows_validated():
+    row = {"id": "a1b2", "serial": "CN00000001", "mac": "20:4c:03:00:00:01", "type": "ap", "model": "635", "sku": "R7J28A", "subscription": "advanced-ap", "subscription_key": "KEY1", "subscription_expires": 1790000000, "assigned": True, "archived": False}
+    assert inventory_cache_rows([row]) == [row]
+    assert inventory_cache_rows([{"serial": "CN00000002", "mac": "20:4c:03:00:00:02"}])[0]["subscription"] is None  # optional fields default to None
+    with pytest.raises(ValidationError):
+        inventory_cache_rows([{**row, "mac": None}])
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from centralcli.client import _share_response
+from centralcli.coalesce import Coalescer
+from centralcli.response import Response
+
+
+def test_coalescer_shares_in_flight_call():
+    coalescer, calls = Coalescer(), []
+
+    async def get(key: str):
+        async def call():
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return Response(url=f"https://x.central.com/{key}", output=[{"key": key}])
+        return await coalescer.do(key, call, share=_share_response)
+
+    async def main():
+        return await asyncio.gather(*[get("a") for _ in range(5)], get("b"))
+
+    *a, b = asyncio.run(main())
+    assert calls == ["a", "b"] and coalescer.coalesced == 4
+    assert all(r.output == [{"key": "a"}] for r in a) and b.output == [{"key": "b"}]
+    a[1].output.append("mutated")
+    assert a[0].output == [{"key": "a"}]  # each caller gets its own copy
+
+    assert len(asyncio.run(main())) == 6 and len(calls) == 4  # nothing retained once the call completes
+
+
+def test_coalescer_errors_and_cancelled_leader():
+    coalescer, calls = Coalescer(), []
+
+    async def fail():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def errors():
+        return await asyncio.gather(*[coalescer.do("k", fail) for _ in range(3)], return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in asyncio.run(errors())) and len(calls) == 1
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def cancelled_leader():
+        leader = asyncio.create_task(coalescer.do("k", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(coalescer.do("k", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(cancelled_leader()) == "ok"
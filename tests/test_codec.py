@@ -0,0 +1,24 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from centralcli import codec
+from centralcli.objects import DateTime
+
+
+def test_codec_round_trip_custom_types():
+    data = {"ts": DateTime(1760000000), "file": Path("/tmp/x.json"), 1: [1, 2]}
+    out = codec.loads(codec.dumps(data))
+    assert out == {"ts": str(DateTime(1760000000)), "file": "/tmp/x.json", "1": [1, 2]}
+
+
+def test_codec_indent_matches_stdlib():
+    data = [{"name": "ap-1", "serial": "CN00000001"}]
+    assert codec.dumps(data, indent=4) == json.dumps(data, indent=4)
+    assert codec.loads(codec.dumps(data, indent=2).encode()) == data
+
+
+def test_codec_unsupported_type():
+    with pytest.raises(TypeError):
+        codec.dumps({"x": object()})
@@ -0,0 +1,58 @@
+import asyncio
+from types import SimpleNamespace
+
+from centralcli.cache import Cache, sqlite
+from centralcli.classic.api.visualrf import VisualRFAPI
+from centralcli.models.sql import Building, FloorPlanAP, FloorPlanFloor
+
+FLOORS = {"f1": ("b1", 1.0, 150), "f2": ("b1", 2.0, 2), "f3": ("b2", 1.5, 0)}
+
+
+class FakeSession:
+    def __init__(self):
+        self.urls = []
+
+    def _page(self, key: str, items: list, params: dict, **extra) -> SimpleNamespace:
+        page = items[params["offset"]:params["offset"] + params["limit"]]
+        raw = {**extra, key: page, f"{key}_count": len(page)}
+        return SimpleNamespace(ok=True, raw=raw, output=raw, rl=1)
+
+    async def get(self, url: str, params: dict) -> SimpleNamespace:
+        self.urls += [url]
+        _id = url.split("/")[-2 if url.endswith("location") else -1]
+        if url.endswith("/campus"):
+            return self._page("campus", [{"campus_id": "c1", "campus_name": "campus1"}], params)
+        elif "/campus/" in url:
+            bldgs = [{"building_id": b, "building_name": f"bldg {b}", "campus_id": _id, "latitude": 1.0, "longitude": 2.0} for b in ["b1", "b2"]]
+            return self._page("buildings", bldgs, params)
+        elif "/building/" in url:
+            floors = [{"floor_id": f, "floor_name": f"floor {f}", "building_id": b, "floor_level": lvl} for f, (b, lvl, _) in FLOORS.items() if b == _id]
+            return self._page("floors", floors, params)
+        building_id, level, ap_cnt = FLOORS[_id]
+        floor = {"floor_id": _id, "floor_name": f"floor {_id}", "building_id": building_id, "floor_level": level}
+        aps = [{"ap_id": f"{_id}-{idx}", "ap_name": f"ap-{_id}-{idx}", "serial_number": f"CN{_id}{idx:04d}", "ap_eth_mac": f"aa:bb:cc:00:00:{idx % 256:02x}", "floor_id": _id} for idx in range(ap_cnt)]
+        resp = self._page("access_points", aps, params, floor=floor)
+        resp.raw["access_point_count"] = len(resp.raw["access_points"])
+        return resp
+
+
+def test_crawl_floor_plans_paginates_each_level():
+    visualrf = VisualRFAPI(FakeSession())
+    crawl = asyncio.run(visualrf.crawl_floor_plans(concurrency=2))
+    assert crawl.ok and len(crawl.buildings) == 1 and len(crawl.floors) == 2 and len(crawl.aps) == 3
+    f1 = [r for r in crawl.aps if r.raw["floor"]["floor_id"] == "f1"][0]
+    assert len(f1.raw["access_points"]) == f1.raw["access_point_count"] == 150
+
+
+def test_refresh_floor_plan_db(monkeypatch, memory_cache: Cache):
+    cache, session = memory_cache, FakeSession()
+    monkeypatch.setattr(sqlite, "api", SimpleNamespace(visualrf=VisualRFAPI(session)))
+    asyncio.run(cache.refresh_floor_plan_db())
+    assert cache.count(Building) == 2 and cache.count(FloorPlanFloor) == 3 and cache.count(FloorPlanAP) == 152
+    assert cache.get_floor_plan_locations(["CNf20001"]) == {"CNf20001": {"id": "f2-1", "serial": "CNf20001", "building": "bldg b1", "floor": 2}}
+    assert {serial: str(loc["floor"]) for serial, loc in cache.get_floor_plan_locations(["CNf10001", "CNf20001"]).items()} == {"CNf10001": "1", "CNf20001": "2"}  # not 1.0
+
+    session.urls.clear()
+    asyncio.run(cache.refresh_floor_plan_db())  # AP level is always fetched, cache is replaced not duplicated
+    assert len([url for url in session.urls if url.endswith("access_point_location")]) == 4  # f1 is 2 pages
+    assert cache.count(FloorPlanFloor) == 3 and cache.count(FloorPlanAP) == 152
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from centralcli.cache import Cache, fuzzy
+from centralcli.cache.fuzzy import FuzzyIndex
+from centralcli.models.sql import Device
+
+
+@pytest.mark.parametrize("rapidfuzz", [True, False])
+def test_fuzzy_index_top_k_and_filters(monkeypatch, rapidfuzz: bool):
+    monkeypatch.setattr(fuzzy, "RAPIDFUZZ", rapidfuzz)  # False: pure python (fuzzywuzzy) fallback
+    types = ("ap", "cx", "gw")
+    names = [f"{types[idx % 3]}-bldg{idx // 100}-flr{idx % 10}-{idx:05d}" for idx in range(50_000)]
+    index = FuzzyIndex(names, filters={"type": [types[idx % 3] for idx in range(50_000)], "group": ["g1"] * 50_000})
+
+    matches = index.extract("cx-bldg123-flr4-12304", limit=3)
+    assert len(matches) == 3 and matches[0] == ("cx-bldg123-flr4-12304", 100)
+    assert matches[0][1] >= matches[1][1] >= matches[2][1]
+
+    assert index.extract_one("ap_bldg12_flr0_01230")[0] == "ap-bldg12-flr0-01230"  # choices and query are normalized
+    assert all(m[0].startswith("gw") for m in index.extract("bldg123-flr4-12304", type="gw"))
+    assert all(not m[0].startswith("ap") for m in index.extract("bldg123-flr4-12304", type=["cx", "gw"]))
+    assert index.extract("cx-bldg123", group="g2") == []
+    assert index.extract_one("zzzzqqqq") is None
+
+
+def test_cache_fuzzy_index_reused_until_cache_write(memory_cache: Cache):
+    cache = memory_cache
+    with Session(cache.engine) as session:
+        session.execute(insert(Device), [
+            {
+                "name": f"sw-{idx}", "status": "Up", "type": "cx", "model": "6300M", "ip": f"10.0.0.{idx}", "serial": f"CN{idx:08d}",
+                "mac": f"20:4c:03:00:00:{idx:02x}", "group": "g1", "site": "s1", "version": "10.15", "swack_id": None, "switch_role": None
+            }
+            for idx in range(10)
+        ])
+        session.commit()
+
+    index = cache.fuzzy_index(Device)
+    assert len(index) == 10 and cache.fuzzy_index(Device) is index
+    assert cache.fuzzy_index(Device, "serial") is not index
+    cache.generation += 1
+    assert cache.fuzzy_index(Device) is not index
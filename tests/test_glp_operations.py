@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+
+from centralcli.cnx.api.glp import operations
+from centralcli.cnx.api.glp.devices import GreenLakeDevicesAPI
+from centralcli.cnx.api.glp.operations import AsyncOperationTracker, backoff_delays
+from centralcli.response import Response
+
+
+def _resp(status: int = 202, output: dict = None, location: str = None) -> Response:
+    resp = Response(url="https://global.api.greenlake.hpe.com/devices/v1/devices", ok=status < 300, output=output or {}, status_code=status)
+    resp.status = status
+    if location:
+        resp._response = SimpleNamespace(headers={"Location": location})
+    return resp
+
+
+class FakeSession:
+    def __init__(self, polls_until_done: dict[str, int], remain_min: int = None):
+        self.polls_until_done, self.remain_min, self.polled = polls_until_done, remain_min, []
+
+    async def get(self, url: str) -> Response:
+        self.polled.append(url)
+        self.polls_until_done[url] -= 1
+        left = self.polls_until_done[url]
+        if left == -100:
+            return _resp(404, {"message": "not found"})
+        resp = _resp(200, {"sourceResourceUri": "AsyncOperationResource", "status": "RUNNING" if left > 0 else "SUCCEEDED", "result": {"succeededDevices": [{"id": url}]}})
+        if self.remain_min is not None:
+            self.remain_min -= 1
+            resp.rl = SimpleNamespace(is_glp=True, total_min=100, remain_min=self.remain_min, glp_rl_reset=30)
+        return resp
+
+    async def _batch_request(self, reqs, continue_on_fail: bool = False) -> list[Response]:
+        return [await req.func(*req.args, **req.kwargs) for req in reqs]
+
+
+def test_backoff_delays_grow_with_jitter_and_cap():
+    delays = backoff_delays(interval=1, max_interval=8, backoff=2, jitter=0.25)
+    first = [next(delays) for _ in range(6)]
+    assert 0.75 <= first[0] <= 1.25 and 1.5 <= first[1] <= 2.5
+    assert all(6 <= d <= 10 for d in first[3:])
+
+
+def test_tracker_returns_result_for_every_response():
+    session = FakeSession({"/op/1": 1, "/op/2": 3, "/op/3": -99})
+    responses = [_resp(location="/op/1"), _resp(400, {"message": "bad"}), _resp(location="/op/2"), _resp(location="/op/3")]
+    results = asyncio.run(AsyncOperationTracker(session, interval=0.01).track(responses))
+
+    assert [r.status for r in results] == ["SUCCEEDED", "NOT_ASYNC", "SUCCEEDED", "ERROR"]
+    assert [r.polls for r in results] == [1, 0, 3, 1]
+    assert results[0].succeeded_devices == ["/op/1"] and not results[1].ok and not results[3].ok
+    assert session.polled.count("/op/1") == 1  # completed operations are not polled again
+
+
+def test_tracker_times_out_and_respects_rate_limit_budget(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(operations.asyncio, "sleep", sleep)
+    session = FakeSession({"/op/1": 1000, "/op/2": 1000, "/op/3": 1}, remain_min=2)
+    responses = [_resp(location=f"/op/{idx}") for idx in range(1, 4)]
+    responses[-1].rl = SimpleNamespace(is_glp=True, total_min=100, remain_min=2, glp_rl_reset=30)
+    results = asyncio.run(AsyncOperationTracker(session, timeout=5, interval=0.01).track(responses))
+    assert [r.status for r in results] == ["TIMEOUT", "TIMEOUT", "TIMEOUT"]  # budget exhausted, waiting for it to reset would exceed the timeout
+    assert [r.polls for r in results] == [1, 1, 0] and session.remain_min == 0  # never polled beyond the per minute budget
+    assert results[0].summary["status"] == "TIMEOUT" and len(sleeps) == 1
+
+    session = FakeSession({"/op/1": 2})
+    resp = _resp(location="/op/1")
+    api = GreenLakeDevicesAPI(session)
+    assert asyncio.run(api.get_progresss_of_async_ops([resp]))[0].output["async operation response"]["status"] == "SUCCEEDED"
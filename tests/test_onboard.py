@@ -0,0 +1,215 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from centralcli import onboard
+from centralcli.cache import Cache
+from centralcli.clicommon import CLICommon
+from centralcli.cnx.api.glp.devices import GLPIDInvResponse
+from centralcli.models.sql import GLPService, Subscription
+from centralcli.onboard import DONE, FAILED, CallLimiter, Onboarding, StageLimit
+from centralcli.response import Response
+
+DEVS = [{"serial": f"SN{idx:04d}", "mac": f"aa:bb:cc:00:00:{idx:02x}", "subscription": "sub1" if idx % 2 else "sub2"} for idx in range(12)]
+LIMITS = {stage: StageLimit(1000) for stage in ("add", "ids", "service", "subscription")}
+
+
+def _ok(url: str = "/devices/v1/devices") -> Response:
+    return Response(url=url, output={}, status_code=200, ok=True)
+
+
+class FakeDevicesAPI:
+    def __init__(self, missing: set[str] = None, fail_sub: str = None):
+        self.missing, self.fail_sub, self.calls = missing or set(), fail_sub, []
+
+    async def add_to_inventory(self, devices, tags=None, *, track=True, continue_on_fail=False):
+        self.calls.append(("add", [d["serial"] for d in devices]))
+        await asyncio.sleep(0.01)
+        return [_ok() for _ in range(0, len(devices), 5)]
+
+    async def fetch_glp_ids(self, serials, add_results_resp=None, cache=None, *, before_retry=None, silent=False):
+        self.calls.append(("ids", serials))
+        devs = {s: {"serialNumber": s, "id": f"id-{s}"} for s in serials if s not in self.missing}
+        return GLPIDInvResponse(inv_resp=_ok(), new_devs_by_serial=devs, device_ids=[d["id"] for d in devs.values()])
+
+    async def update_devices(self, device_ids, subscription_ids=None, tags=None, application_id=None, region=None):
+        self.calls.append(("service" if application_id else "subscription", device_ids))
+        await asyncio.sleep(0.01)
+        if subscription_ids and subscription_ids == self.fail_sub:
+            return [Response(url="/devices/v2beta1/devices", error="Bad Request", status_code=400, ok=False) for _ in range(0, len(device_ids), 25)]
+        return [_ok() for _ in range(0, len(device_ids), 25)]
+
+
+def test_onboarding_pipelines_chunks_through_stages(tmp_path):
+    onboarding = Onboarding.plan(DEVS, application_id="app1", region="us-west", tags={"site": "hq"}, chunk_size=2, file=tmp_path / "onboard.json")
+    assert [len(c) for c in onboarding.chunks] == [2] * 6 and onboarding.devices["SN0000"].tags == {"site": "hq"}
+
+    glp = SimpleNamespace(devices=FakeDevicesAPI(missing={"SN0005"}))
+    resps = asyncio.run(onboarding.run(glp, limits={**LIMITS, "add": StageLimit(1000, workers=1)}))
+    assert resps and onboarding.status == "incomplete"
+    assert onboarding.devices["SN0005"].state == FAILED and "not found" in onboarding.devices["SN0005"].detail
+    assert all(d.state == DONE and d.id == f"id-{s}" for s, d in onboarding.devices.items() if s != "SN0005")
+
+    calls = [stage for stage, _ in glp.devices.calls]
+    assert calls.index("subscription") < len(calls) - 1 - calls[::-1].index("add")  # a chunk was assigned subscriptions before the last chunk was added
+    assert Onboarding.load(tmp_path / "onboard.json") == onboarding
+
+
+def test_onboarding_resumes_from_checkpoint(tmp_path):
+    file = tmp_path / "onboard.json"
+    onboarding = Onboarding.plan(DEVS, application_id="app1", region="us-west", chunk_size=6, file=file)
+    glp = SimpleNamespace(devices=FakeDevicesAPI(fail_sub="sub2"))
+    asyncio.run(onboarding.run(glp, limits=LIMITS))
+    counts = onboarding.counts()
+    assert counts[DONE] == 6 and counts[FAILED] == 6
+    assert all(d.stage == "subscription" for d in onboarding.devices.values() if d.state == FAILED)
+
+    resumed = Onboarding.load(file)
+    resumed.retry_failed()
+    assert resumed.counts()["subscription"] == 6
+    glp = SimpleNamespace(devices=FakeDevicesAPI())
+    asyncio.run(resumed.run(glp, limits=LIMITS))
+    assert resumed.status == "complete" and all(d.state == DONE for d in resumed.devices.values())
+    assert {stage for stage, _ in glp.devices.calls} == {"subscription"}  # earlier stages are not repeated
+    assert Onboarding.load(file).status == "complete"
+
+
+def test_run_onboarding_pre_provisions_completed_devices(tmp_path, memory_cache: Cache):
+    file = tmp_path / "onboard.json"
+    onboarding = Onboarding.plan([{**d, "group": "grp1" if idx % 3 else None} for idx, d in enumerate(DEVS)], application_id="app1", region="us-west", chunk_size=6, file=file)
+    assert onboarding.devices["SN0001"].group == "grp1" and onboarding.devices["SN0000"].group is None
+
+    pre_provisioned = []
+
+    async def preprovision_device_to_group(group, serials):
+        pre_provisioned.append((group, serials))
+        return _ok("/configuration/v1/preassign")
+
+    def _api_clients(fail_sub: str = None):
+        glp = SimpleNamespace(devices=FakeDevicesAPI(fail_sub=fail_sub), session=SimpleNamespace(request=lambda func, *args, **kwargs: asyncio.run(func(*args, **kwargs))))
+        classic = SimpleNamespace(
+            configuration=SimpleNamespace(preprovision_device_to_group=preprovision_device_to_group),
+            session=SimpleNamespace(batch_request=lambda reqs: [asyncio.run(r.func(*r.args, **r.kwargs)) for r in reqs]),
+        )
+        return SimpleNamespace(glp=glp, classic=classic)
+
+    common = CLICommon(cache=memory_cache)
+    common.run_onboarding(onboarding, api_clients=_api_clients(fail_sub="sub2"))
+    done = [d.serial for d in onboarding.devices.values() if d.state == DONE and d.group]
+    assert pre_provisioned == [("grp1", done)]
+
+    resumed = Onboarding.load(file)  # devices completed before the interruption are not pre-provisioned again
+    assert all(resumed.devices[serial].pre_provisioned for serial in done)
+    resumed.retry_failed()
+    pre_provisioned.clear()
+    common.run_onboarding(resumed, api_clients=_api_clients())
+    assert pre_provisioned == [("grp1", [d.serial for d in resumed.devices.values() if d.group and d.serial not in done])]
+    assert all(d.pre_provisioned for d in Onboarding.load(file).devices.values() if d.group)
+
+
+def test_call_limiter_waits_for_budget(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+        limiter._calls.clear()
+
+    limiter = CallLimiter(5)
+    monkeypatch.setattr("centralcli.onboard.asyncio.sleep", sleep)
+
+    async def main():
+        await limiter.acquire(4)
+        await limiter.acquire(1)
+        assert not sleeps
+        await limiter.acquire(3)
+
+    asyncio.run(main())
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= 60
+
+
+def test_ids_retries_acquire_budget_and_are_silent(monkeypatch):
+    from centralcli.cnx.api.glp import devices as glp_devices
+
+    serials = [d["serial"] for d in DEVS]
+    attempts = []
+
+    async def get_devices(serial_numbers):
+        attempts.append(serial_numbers)
+        found = serial_numbers if len(attempts) == 3 else serial_numbers[:-1]  # GreenLake doesn't return the last device until the 3rd attempt
+        return Response(url="/devices/v1/devices", output=[{"serialNumber": s, "id": f"id-{s}"} for s in found], status_code=200, ok=True)
+
+    async def sleep(delay):
+        pass
+
+    monkeypatch.setattr(glp_devices.asyncio, "sleep", sleep)
+    monkeypatch.setattr(glp_devices.render, "Spinner", None)  # the spinner is not used by pipeline workers
+    api = glp_devices.GreenLakeDevicesAPI(None)
+    monkeypatch.setattr(api, "get_devices", get_devices)
+
+    onboarding = Onboarding.plan(DEVS, chunk_size=len(DEVS))
+    devs = list(onboarding.devices.values())
+    for dev in devs:
+        dev.advance()  # added
+    acquired = []
+    limiter = CallLimiter(1000)
+    monkeypatch.setattr(limiter, "acquire", lambda calls=1: acquired.append(calls) or sleep(0))
+
+    asyncio.run(onboarding._ids(SimpleNamespace(devices=api), devs, None, limiter))
+    assert len(attempts) == 3 and acquired == [onboarding._estimate("ids", devs)] * 2  # the first attempt is acquired by the worker
+    assert all(d.id == f"id-{d.serial}" and d.stage == "service" for d in devs) and attempts[0] == serials
+
+
+def _sub(idx: int) -> dict:
+    return {
+        "id": f"sub-id-{idx}", "name": "advanced-ap", "type": "ap", "key": f"SUBKEY{idx}", "qty": 1000, "available": 1000, "is_eval": False, "sku": "R3V48A",
+        "start_date": 1700000000, "end_date": 4100000000 + idx, "started": True, "expired": False, "valid": True,
+    }
+
+
+@pytest.mark.parametrize("cli_options", [True, False])
+def test_batch_add_devices_glp_plans_onboarding_with_subs_and_tags(monkeypatch, memory_cache: Cache, cli_options: bool):
+    with Session(memory_cache.engine) as session:
+        session.execute(insert(GLPService), [{"id": "app1", "name": "public", "region": "us-west"}])
+        session.execute(insert(Subscription), [_sub(1), _sub(2)])
+        session.commit()
+
+    count = onboard.CHUNK_SIZE + 50
+    if cli_options:  # --sub / --tags
+        data = [{"serial": f"SN{idx:04d}", "mac": f"aa:bb:cc:00:{idx // 256:02x}:{idx % 256:02x}"} for idx in range(count)]
+        kwargs = {"subscription": "SUBKEY1", "tags": {"site": "hq"}}
+    else:  # subscription / tags fields in the import file
+        data = [
+            {"serial": f"SN{idx:04d}", "mac": f"aa:bb:cc:00:{idx // 256:02x}:{idx % 256:02x}", **({} if idx % 2 else {"subscription": "SUBKEY2", "tags": "floor:2, room:b"})}
+            for idx in range(count)
+        ]
+        kwargs = {}
+
+    planned = []
+    plan = Onboarding.plan.__func__
+
+    def _plan(cls, devices, **plan_kwargs):
+        planned.append((devices, plan_kwargs))
+        return plan(cls, devices, **plan_kwargs)
+
+    monkeypatch.setattr(Onboarding, "plan", classmethod(_plan))
+    common = CLICommon(cache=memory_cache)
+    onboardings = []
+    monkeypatch.setattr(common, "run_onboarding", lambda onboarding, api_clients=None: onboardings.append(onboarding) or [_ok()])
+    resp = common.batch_add_devices_glp(data, api_clients=SimpleNamespace(config=memory_cache.config, glp=None), **kwargs)
+    assert len(planned) == 1 and len(resp) == 1
+
+    devices, plan_kwargs = planned[0]
+    assert len(devices) == count and plan_kwargs["application_id"] == "app1" and plan_kwargs["region"] == "us-west"
+    if cli_options:
+        assert plan_kwargs["tags"] == {"site": "hq"}
+        assert {d["subscription"] for d in devices} == {"sub-id-1"}
+        assert {(d.subscription, str(d.tags)) for d in onboardings[0].devices.values()} == {("sub-id-1", str({"site": "hq"}))}
+    else:
+        assert plan_kwargs["tags"] is None
+        assert [d["subscription"] for d in devices[:2]] == ["sub-id-2", None]
+        assert [d["tags"] for d in devices[:2]] == [{"floor": "2", "room": "b"}, None]
+        assert [(d.subscription, d.tags) for d in list(onboardings[0].devices.values())[:2]] == [("sub-id-2", {"floor": "2", "room": "b"}), (None, None)]
+
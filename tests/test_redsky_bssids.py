@@ -0,0 +1,29 @@
+from centralcli.clitree.export import get_redsky_bssids, mac_ranges
+
+APS = [
+    {
+        "name": "ap-1",
+        "serial": "CN00000001",
+        "radio_bssids": [
+            {"index": 0, "macaddr": "20:4c:03:aa:bb:c0", "bssids": [{"essid": "corp", "macaddr": "20:4c:03:aa:bb:c1"}, {"essid": "guest", "macaddr": "22:4c:03:aa:bb:c0"}]},
+            {"index": 1, "macaddr": "20:4c:03:aa:bb:d0", "bssids": []},
+        ],
+    },
+]
+
+
+def test_mac_ranges_carry_and_leading_zero():
+    assert mac_ranges(["00:0b:86:aa:bb:fe"], 3) == [["00:0b:86:aa:bb:fe", "00:0b:86:aa:bb:ff", "00:0b:86:aa:bc:00"]]
+    assert mac_ranges(["20:4c:03:aa:bb:c0", "20-4C-03-AA-BB-D0"], 2) == [["20:4c:03:aa:bb:c0", "20:4c:03:aa:bb:c1"], ["20:4c:03:aa:bb:d0", "20:4c:03:aa:bb:d1"]]
+    assert mac_ranges([], 4) == []
+
+
+def test_get_redsky_bssids_masking():
+    masked = get_redsky_bssids(APS)["CN00000001"]
+    assert masked == {"name": "ap-1", "bssids": ["20:4c:03:aa:bb:c0", "20:4c:03:aa:bb:d0", "22:4c:03:aa:bb:c0"]}
+
+    manual = get_redsky_bssids(APS, mask=False, mask_entries=2)["CN00000001"]["bssids"]
+    assert manual == ["20:4c:03:aa:bb:c0", "20:4c:03:aa:bb:c1", "20:4c:03:aa:bb:d0", "20:4c:03:aa:bb:d1"]
+
+    unmasked = get_redsky_bssids(APS, mask=False)["CN00000001"]["bssids"]
+    assert sorted(unmasked) == ["20:4c:03:aa:bb:c0", "20:4c:03:aa:bb:c1", "20:4c:03:aa:bb:d0", "22:4c:03:aa:bb:c0"]
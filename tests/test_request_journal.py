@@ -0,0 +1,29 @@
+from centralcli.client import LoggedRequests, RequestJournal
+
+
+def _req(url: str, status: int = 200, elapsed: float = 0.1, method: str = "GET") -> LoggedRequests:
+    req = LoggedRequests(url, method, ok=status < 400)
+    req.status, req.elapsed = status, elapsed
+    return req
+
+
+def test_request_journal_bounded_try_counts():
+    journal = RequestJournal(maxlen=3)
+    journal.extend([_req("/a?offset=0"), _req("/a?offset=0", status=429), _req("/b"), _req("/c")])
+    assert len(journal) == 3
+    assert journal.total == 4
+    assert journal.tries("/a?offset=0") == 1  # first request was evicted
+    assert journal.tries("/c") == 1
+    assert journal[-1].url == "/c"
+
+
+def test_request_journal_endpoint_stats():
+    journal = RequestJournal()
+    journal.extend([_req("/a?offset=0", status=429, elapsed=0.5), _req("/a?offset=0", elapsed=0.2), _req("/a?offset=100", elapsed=0.3), _req("/b", elapsed=1.0)])
+    stats = {s["path"]: s for s in journal.summary()}
+    assert stats["/a"]["count"] == 3
+    assert stats["/a"]["retries"] == 1
+    assert stats["/a"]["429s"] == stats["/a"]["failed"] == 1
+    assert stats["/a"]["p50"] == 0.3
+    assert stats["/a"]["p95"] == 0.5
+    assert journal.summary()[0]["path"] == "/a"
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from centralcli.httpcache import ResponseCache
+from centralcli.response import Response
+
+
+def _cache(tmp_path, **kwargs) -> ResponseCache:
+    config = SimpleNamespace(workspace="default", no_cache=False, response_cache={"/troubleshooting/v1/commands": 60, "/configuration/v1/groups/*/templates": 0}, **kwargs)
+    return ResponseCache(config, file=tmp_path / "responses.db")
+
+
+def test_response_cache_ttl_by_endpoint(tmp_path):
+    cache = _cache(tmp_path)
+    assert cache.ttl("GET", "https://x.central.com/troubleshooting/v1/commands?device_type=CX") == 60
+    assert cache.ttl("POST", "https://x.central.com/troubleshooting/v1/commands") == 0
+    assert cache.ttl("GET", "/configuration/v1/groups/g1/templates") == 0
+    assert cache.ttl("GET", "/monitoring/v2/aps") == 0
+
+
+def test_response_cache_round_trip_and_bypass(tmp_path):
+    cache = _cache(tmp_path)
+    key = cache.key("GET", "https://x.central.com/troubleshooting/v1/commands", params={"device_type": "CX"})
+    assert key != cache.key("GET", "https://x.central.com/troubleshooting/v1/commands", params={"device_type": "CX"}, workspace="other")
+    assert cache.get(key) is None
+
+    resp = Response(url="https://x.central.com/troubleshooting/v1/commands", output=[{"command_id": 1}], raw={"commands": [{"command_id": 1}]})
+    assert cache.set(key, resp, 60)
+    cached = cache.get(key)
+    assert cached.ok and cached.output == resp.output and cached.raw == resp.raw and cached.url.path == "/troubleshooting/v1/commands"
+
+    cache.config.no_cache = True
+    assert cache.get(key) is None
+
+    cache.config.no_cache = False
+    cache.set(key, resp, -1)  # expired
+    assert cache.get(key) is None
+
+
+def test_response_cache_never_caches_tokens(tmp_path):
+    cache = _cache(tmp_path)
+    cache.config.response_cache = {"/streaming/token/validate": 3600, "/troubleshooting/*": 60}
+    assert cache.ttl("GET", "https://internal-ui.central.arubanetworks.com/streaming/token/validate") == 0
+    assert cache.ttl("GET", "/troubleshooting/v1/commands", headers={"Authorization": "wss-key"}) == 0
+    assert cache.ttl("GET", "/troubleshooting/v1/commands") == 60
+
+
+def test_response_cache_invalidated_by_mutating_calls(tmp_path):
+    cache = _cache(tmp_path)
+    urls = [
+        "https://x.central.com/configuration/v1/groups",
+        "https://x.central.com/configuration/v1/groups/g1/templates",
+        "https://x.central.com/configuration/v1/groups/g2/templates",
+        "https://x.central.com/troubleshooting/v1/commands?device_type=CX",
+    ]
+    keys = [cache.key("GET", url) for url in urls]
+    for key, url in zip(keys, urls):
+        cache.set(key, Response(url=url, output=[], raw={}), 60)
+
+    assert cache.invalidate("GET", "/configuration/v1/groups/g1") == 0
+    assert cache.invalidate("DELETE", "/configuration/v1/groups/g1") == 2  # the group's templates and the list of groups
+    assert [cache.get(key) is not None for key in keys] == [False, False, True, True]
+    assert cache.invalidate("POST", "https://x.central.com/troubleshooting/v1/commands") == 1
+    assert cache.get(keys[3]) is None
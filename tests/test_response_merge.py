@@ -0,0 +1,22 @@
+from centralcli.response import PageAccumulator, Response
+
+
+def _page(start: int, size: int, total: int) -> Response:
+    data = [{"serial": f"CN{idx:08d}"} for idx in range(start, start + size)]
+    return Response(url="/monitoring/v2/aps", output=data, raw={"aps": data, "count": size, "total": total})
+
+
+def test_page_accumulator_merges_pages():
+    pages = [_page(start, 100, 1000) for start in range(0, 1000, 100)]
+    resp = PageAccumulator(pages[0]).extend(pages[1:]).merge()
+    assert resp is pages[0]
+    assert len(resp.output) == resp.raw["count"] == 1000
+    assert resp.raw["aps"] is resp.output
+    assert [d["serial"] for d in resp.output[99:101]] == ["CN00000099", "CN00000100"]
+
+
+def test_response_add():
+    resp = _page(0, 2, 3) + _page(2, 1, 3)
+    assert resp.data_key == "aps"
+    assert len(resp.output) == resp.raw["count"] == 3
+    assert resp.raw["aps"] is resp.output
@@ -0,0 +1,91 @@
+import asyncio
+from types import SimpleNamespace
+
+from centralcli.response import Response
+import pytest
+
+from centralcli.rollout import FAILED, IDLE, IDLE_POLLS, PENDING, SUCCESS, UPGRADING, Rollout, upgrade_state
+
+
+def _dev(serial: str, site: str, type: str = "cx", swack_id: str = None):
+    return SimpleNamespace(serial=serial, name=f"dev-{serial}", type=type, site=site, group="g1", swack_id=swack_id)
+
+
+DEVS = [_dev("s1", "b"), _dev("s2", "a"), _dev("s3", "a"), _dev("ap1", "a", "ap", "swarm1"), _dev("ap2", "a", "ap", "swarm1")]
+
+
+class FakeAPI:
+    def __init__(self, states: dict[str, str]):
+        self.states, self.upgraded, self.polls = states, [], 0
+        self.firmware = SimpleNamespace(upgrade_firmware=self.upgrade_firmware, get_upgrade_status=self.get_upgrade_status)
+        self.session = SimpleNamespace(_batch_request=self._batch_request)
+
+    async def _batch_request(self, reqs, continue_on_fail=False):
+        return [await r.func(*r.args, **r.kwargs) for r in reqs]
+
+    async def upgrade_firmware(self, swarm_id=None, serial=None, **kwargs):
+        self.upgraded += [swarm_id or serial]
+        return Response(url="/firmware/v1/upgrade", output={}, status_code=200, ok=True)
+
+    async def get_upgrade_status(self, swarm_id=None, serial=None):
+        self.polls += 1
+        state = "Upgrading" if self.polls < 2 else self.states.get(swarm_id or serial, "Upgrade success")
+        output = state if isinstance(state, dict) else {"state": state}
+        return Response(url="/firmware/v1/status", output={"serial": serial, **output}, status_code=200, ok=True)
+
+
+def test_rollout_plan_waves():
+    by_site = Rollout.plan(DEVS, by="site", max_wave_size=3)
+    assert by_site.waves == [["ap1", "ap2", "s2"], ["s3"], ["s1"]]  # APs in a swarm are upgraded together, so stay in the same wave
+    by_pct = Rollout.plan(DEVS, by="percent", percent=40)
+    assert [len(w) for w in by_pct.waves] == [2, 2, 1] and {s for w in by_pct.waves for s in w} == {d.serial for d in DEVS}
+
+
+@pytest.mark.parametrize(
+    "status,version,expected",
+    [
+        [{"state": "Upgrade failed"}, None, FAILED],
+        [{"status": "Upgrade successful"}, None, SUCCESS],
+        [{"state": "Upgrade in progress"}, None, UPGRADING],
+        [{"state": "Image download started"}, "10.13.1000", UPGRADING],
+        [{"state": "none"}, None, IDLE],
+        [{"state": "idle", "firmware_version": "10.12.1000"}, "10.13.1000", IDLE],
+        [{"state": "something new"}, None, IDLE],
+        [{"state": "none", "firmware_version": "10.13.1000"}, "10.13.1000", SUCCESS],  # already on the target version
+    ]
+)
+def test_upgrade_state(status: dict, version: str, expected: str):
+    assert upgrade_state(status, version) == expected
+
+
+def test_rollout_plan_requires_ap_swarm_id():
+    with pytest.raises(ValueError, match="dev-ap3"):
+        Rollout.plan([*DEVS, _dev("ap3", "a", "ap")])
+
+
+def test_rollout_halts_on_threshold_and_resumes(tmp_path):
+    file = tmp_path / "rollout.json"
+    rollout = Rollout.plan(DEVS, "10.13.1000", by="site", threshold=100, file=file)
+    api = FakeAPI({"s3": "Upgrade failed"})
+
+    run = lambda r: asyncio.run(r.run(api, poll_min=0, poll_max=0))  # noqa: E731
+    assert run(rollout) is False
+    assert rollout.status == "halted" and rollout.wave == 0 and rollout.devices["s1"].state == PENDING
+    assert sorted(api.upgraded) == ["s2", "s3", "swarm1"]  # one upgrade call for the swarm
+
+    resumed = Rollout.load(file)
+    assert resumed == rollout and resumed.devices["s3"].state == FAILED
+    resumed.retry_failed()
+    api.states = {}
+    assert run(resumed) is True
+    assert resumed.status == "complete" and all(d.state == SUCCESS for d in resumed.devices.values())
+    assert Rollout.load(file).status == "complete" and api.upgraded[3:] == ["s3", "s1"]
+
+
+def test_rollout_idle_devices_do_not_wait_for_timeout():
+    rollout = Rollout.plan(DEVS[:3], "10.13.1000", by="percent", percent=100, threshold=50)
+    api = FakeAPI({"s1": {"state": "none", "firmware_version": "10.13.1000"}, "s2": {"state": "none", "firmware_version": "10.12.1000"}})
+    assert asyncio.run(rollout.run(api, poll_min=0, poll_max=0, timeout=3600)) is True
+    assert rollout.devices["s1"].state == SUCCESS and rollout.devices["s3"].state == SUCCESS
+    assert rollout.devices["s2"].state == FAILED and "no upgrade in progress" in rollout.devices["s2"].detail
+    assert rollout.devices["s2"].idle_polls == IDLE_POLLS
@@ -0,0 +1,68 @@
+import asyncio
+import sys
+import threading
+
+import pytest
+from aiohttp.client import ClientSession
+
+from centralcli.runner import ClientPool, LoopRunner, get_client
+
+
+def test_loop_runner_reuses_loop_and_drains_tasks():
+    runner, done = LoopRunner(), []
+
+    async def work(value: int) -> tuple[int, int]:
+        async def cache_update():
+            await asyncio.sleep(0.01)
+            done.append(value)
+
+        asyncio.create_task(cache_update())  # not awaited by the caller
+        return value, threading.get_ident()
+
+    try:
+        (one, thread1), (two, thread2) = runner.run(work(1)), runner.run(work(2))
+        assert (one, two) == (1, 2) and thread1 == thread2 != threading.get_ident()
+        assert done == [1, 2]
+
+        async def nested():
+            return runner.run(work(3))
+
+        with pytest.raises(RuntimeError):
+            runner.run(nested())
+    finally:
+        runner.close()
+    assert not runner.running
+
+
+def test_client_pool_shares_and_closes_sessions():
+    factory = lambda: ClientSession()  # noqa: E731
+
+    async def main() -> ClientSession:
+        assert get_client("a", factory) is None  # not pooled
+        async with ClientPool():
+            first, second = get_client("a", factory), get_client("a", factory)
+            assert first is second and get_client("b", factory) is not first
+        return first
+
+    assert asyncio.run(main()).closed
+
+
+def test_loop_runner_reraises_system_exit_in_caller():
+    runner = LoopRunner()
+
+    async def exits():
+        sys.exit(1)
+
+    async def exits_in_thread():
+        await asyncio.to_thread(sys.exit, 2)
+
+    try:
+        with pytest.raises(SystemExit) as exc:
+            runner.run(exits())
+        assert exc.value.code == 1
+        with pytest.raises(SystemExit) as exc:
+            runner.run(exits_in_thread())
+        assert exc.value.code == 2
+        assert runner.running and runner.run(asyncio.sleep(0, result="ok")) == "ok"  # loop thread survived
+    finally:
+        runner.close()
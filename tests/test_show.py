@@ -979,6 +979,8 @@ def test_show_logs(idx: int, args: list[str], pass_condition: Callable):
     [
         [1, ("9999",), lambda r: "⚠" in r],
         [2, ("-a", "--past", "30m",), lambda r: "⚠" in r],
+        [3, ("--local", "--group", test_data["ap"]["group"]), lambda r: "--group" in r and "--local" in r],
+        [4, ("--local", "--site", test_data["ap"]["site"], "--level", "error", "--client", test_data["client"]["wireless"]["mac"]), lambda r: "--site" in r and "--level" in r and "--client" in r],
     ]
 )
 def test_show_logs_invalid(idx: int, args: list[str], pass_condition: Callable):
@@ -0,0 +1,66 @@
+import asyncio
+
+from sqlalchemy import event, func, insert, select
+
+from centralcli.cache import Cache, DBAction
+from centralcli.models.sql import Base, GLPService, Label, Site, TableMeta
+
+
+def test_table_meta_maintained_by_update_db(memory_cache: Cache):
+    cache = memory_cache
+    assert cache.count(Label) == 0 and cache.last_updated(Label) is None  # seeded, no update recorded yet
+    asyncio.run(cache._update_db(Label, [{"id": idx, "name": f"label{idx}", "devices": 0} for idx in range(5)], action=DBAction.REPLACE))
+    assert cache.count(Label) == 5 and cache.last_updated(Label) is not None
+    asyncio.run(cache._update_db(Label, [{"id": 0}], action=DBAction.DELETE, column="id"))
+    assert cache.count(Label) == 4
+
+
+def test_table_meta_count_from_rows_written(memory_cache: Cache):
+    cache, statements = memory_cache, []
+    cache.count(Label)  # seed
+    event.listen(cache.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+    labels = [{"id": idx, "name": f"label{idx}", "devices": 0} for idx in range(5)]
+    asyncio.run(cache._update_db(Label, labels, action=DBAction.REPLACE))
+    asyncio.run(cache._update_db(Label, [{**labels[0], "devices": 2}, {"id": 5, "name": "label5", "devices": 0}]))  # upsert 1 existing, 1 new
+    asyncio.run(cache._update_db(Label, [{"id": 6, "name": "label6", "devices": 0}], action=DBAction.INSERT))
+    asyncio.run(cache._update_db(Label, [{"id": 1, "devices": 3}], action=DBAction.UPDATE, column="id"))
+    asyncio.run(cache._update_db(Label, [{"id": 2}, {"id": 99}], action=DBAction.DELETE, column="id"))
+    asyncio.run(cache._delete_from_db(Label, [{"id": 3}], column="id"))
+    assert not [stmt for stmt in statements if "count(" in stmt.lower()]
+
+    with cache.engine.connect() as connection:
+        assert cache.count(Label) == connection.scalar(select(func.count()).select_from(Label)) == 5
+
+
+def test_table_meta_recount_after_raw_writes(memory_cache: Cache):
+    cache = memory_cache
+    assert cache.count(Label) == 0
+    with cache.engine.begin() as connection:  # i.e. cache migration, not tracked by table_meta
+        connection.execute(insert(Label), [{"id": idx, "name": f"label{idx}", "devices": 0} for idx in range(3)])
+    assert cache.count(Label) == 0
+
+    cache.recount(Label)
+    assert cache.count(Label) == 3 and cache.last_updated(Label) is not None
+    cache.recount()
+    assert {t.name: t.records for t in cache.all_tables}[Label.__tablename__] == 3
+
+
+def test_services_refreshed_only_if_never_cached(monkeypatch, memory_cache: Cache):
+    refreshes = []
+
+    async def refresh_svc_db():
+        refreshes.append(1)
+        await memory_cache._update_db(GLPService, [{"id": "1", "name": "public", "region": "us-west"}], action=DBAction.REPLACE)
+
+    monkeypatch.setattr(memory_cache, "refresh_svc_db", refresh_svc_db)
+    assert [svc.name for svc in memory_cache.services] == ["public"]
+    assert [svc.name for svc in memory_cache.services] == ["public"]
+    assert len(refreshes) == 1
+
+
+def test_all_tables_from_table_meta(memory_cache: Cache):
+    tables = {t.name: t for t in memory_cache.all_tables}
+    assert TableMeta.__tablename__ not in tables
+    assert len(memory_cache) == len(tables) == len(Base.metadata.tables) - 1
+    assert tables["sites"].records == 0 and "name" in tables[Site.__tablename__].fields
@@ -0,0 +1,105 @@
+from functools import partial
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from centralcli import cleaner, workers
+from centralcli.cache import Cache
+from centralcli.models.sql import Device
+
+
+def _square(value: int, *, offset: int = 0) -> int:
+    return value * value + offset
+
+
+def test_map_records_serial_below_threshold():
+    assert workers.map_records(_square, [1, 2, 3], workers=4, offset=1) == [2, 5, 10]
+
+
+def test_map_records_pool_preserves_order(monkeypatch):
+    monkeypatch.setattr(workers.os, "cpu_count", lambda: 4)
+    records = list(range(10_001))
+    assert workers.map_records(_square, records, workers=4, min_records=100, offset=1) == [_square(r, offset=1) for r in records]
+
+
+def test_format_record():
+    record = {"name": "ap-1", "enabled": True, "interface_port": "1/1/1"}
+    assert cleaner.format_record(record, keys=["name", "site"], present_only=True) == {"name": "ap-1"}
+    assert cleaner.format_record(record, strip_keys={"interface_port"}, emoji_bools=True) == {"name": "ap-1", "enabled": "✅"}
+
+
+def _dev(name: str, serial: str, type: str) -> dict:
+    return {
+        "name": name, "status": "Up", "type": type, "model": "6300M", "ip": "10.0.0.1", "serial": serial,
+        "mac": "20:4c:03:00:00:01", "group": "g1", "site": "s1", "version": "10.15", "swack_id": None, "switch_role": None
+    }
+
+
+def _clients() -> list[dict]:
+    return [
+        {
+            "name": "laptop", "ip_address": "10.1.1.10", "macaddr": "aa:bb:cc:00:00:01", "user_role": "employee", "vlan": 10, "network": "corp", "connection": "802.11ax",
+            "associated_device": "CNAP000001", "associated_device_mac": "20:4c:03:00:00:10", "connected_device_type": "AP", "gateway_serial": "CNGW000001",
+            "group_name": "g1", "site": "s1", "last_connection_time": 1700000000000, "client_type": "WIRELESS", "authentication_type": "WPA3", "usage": 123456,
+            "radio_number": 1, "band": 5, "channel": "36", "radio_mac": "20:4c:03:00:00:11", "signal_db": 45, "snr": 40, "health": 90,
+            "client_category": "Computer", "os_type": "Windows", "manufacturer": "Dell", "swarm_id": "x", "group_id": 1
+        },
+        {
+            "name": "printer", "ip_address": "10.1.2.10", "macaddr": "aa:bb:cc:00:00:02", "user_role": "iot", "vlan": 20, "network": "NA", "interface_port": "1/1/5",
+            "associated_device": "SG00000001", "associated_device_mac": "20:4c:03:00:00:20", "connected_device_type": "Switch", "interface_mac": "20:4c:03:00:00:21",
+            "group_name": "g1", "site": "s1", "last_connection_time": 1700000100000, "client_type": "WIRED", "usage": 42, "signal_db": "NA"
+        },
+        {
+            "name": "phone", "ip_address": "10.1.1.11", "macaddr": "aa:bb:cc:00:00:03", "user_role": "guest", "vlan": 30, "network": "guest", "connection": "802.11ac",
+            "associated_device": "CNAP999999", "connected_device_type": "AP", "gateway_serial": "CNGW999999",
+            "group_name": "g1", "site": "s2", "last_connection_time": 1700000200000, "client_type": "WIRELESS"
+        },
+    ]
+
+
+def test_get_clients_matches_previous_cleaner(monkeypatch, memory_cache: Cache):
+    """Expected output captured from get_clients prior to the move to workers.map_records (per client cache lookups).
+
+    The exception is the gateway for phone, the gateway serial is not in the cache so it's displayed in place of the name.
+    """
+    with Session(memory_cache.engine) as session:
+        session.execute(insert(Device), [_dev("ap-1", "CNAP000001", "ap"), _dev("gw-1", "CNGW000001", "gw"), _dev("sw-1", "SG00000001", "cx")])
+        session.commit()
+
+    expected = {
+        0: [
+            {"name": "laptop", "ip": "10.1.1.10", "mac": "aa:bb:cc:00:00:01", "role": "employee", "vlan": 10, "ssid": "corp", "802.11": "ax", "connected device": "ap-1", "gateway": "gw-1", "group": "g1", "site": "s1"},
+            {"name": "printer", "ip": "10.1.2.10", "mac": "aa:bb:cc:00:00:02", "role": "iot", "vlan": 20, "ssid": "wired (1/1/5)", "802.11": None, "connected device": "sw-1", "gateway": None, "group": "g1", "site": "s1"},
+            {"name": "phone", "ip": "10.1.1.11", "mac": "aa:bb:cc:00:00:03", "role": "guest", "vlan": 30, "ssid": "guest", "802.11": "ac", "connected device": "CNAP999999", "gateway": "CNGW999999", "group": "g1", "site": "s2"},
+        ],
+        1: [
+            {
+                "client type": "WIRELESS", "name": "laptop", "ip": "10.1.1.10", "mac": "aa:bb:cc:00:00:01", "role": "employee", "vlan": 10, "ssid": "corp", "auth": "WPA3", "usage": "120.56 KB", "802.11": "ax",
+                "connected device": {"name": "ap-1", "type": "ap", "serial": "CNAP000001", "mac": "20:4c:03:00:00:10"},
+                "gateway": {"name": "gw-1", "serial": "CNGW000001"},
+                "radio": {"radio number": 1, "band": 5, "channel": "36", "radio mac": "20:4c:03:00:00:11"},
+                "signal": {"snr": 40, "signal db": 45, "health": 90},
+                "fingerprint": {"category": "Computer", "OS": "Windows", "manufacturer": "Dell"},
+                "group": "g1", "site": "s1",
+            },
+            {
+                "client type": "WIRED", "name": "printer", "ip": "10.1.2.10", "mac": "aa:bb:cc:00:00:02", "role": "iot", "vlan": 20, "usage": "42 B",
+                "connected device": {"name": "sw-1", "type": "switch", "serial": "SG00000001", "mac": "20:4c:03:00:00:20", "interface": "1/1/5", "interface mac": "20:4c:03:00:00:21"},
+                "group": "g1", "site": "s1",
+            },
+            {
+                "client type": "WIRELESS", "name": "phone", "ip": "10.1.1.11", "mac": "aa:bb:cc:00:00:03", "role": "guest", "vlan": 30, "ssid": "guest", "802.11": "ac",
+                "connected device": {"name": "CNAP999999", "type": "ap", "serial": "CNAP999999"},
+                "gateway": {"serial": "CNGW999999"},
+                "group": "g1", "site": "s2",
+            },
+        ],
+    }
+    serial = {verbosity: cleaner.get_clients(_clients(), verbosity=verbosity, cache=memory_cache) for verbosity in [0, 1, 2]}
+    for verbosity, clients in expected.items():
+        assert [{k: v for k, v in c.items() if k != "last connected"} for c in serial[verbosity]] == clients
+        assert all(c["last connected"] for c in serial[verbosity])
+
+    monkeypatch.setattr(workers.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(workers, "map_records", partial(workers.map_records, workers=2, min_records=0))
+    assert {verbosity: cleaner.get_clients(_clients(), verbosity=verbosity, cache=memory_cache) for verbosity in [0, 1, 2]} == serial
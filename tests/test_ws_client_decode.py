@@ -1,6 +1,8 @@
 import base64
+import json
 
-from centralcli.ws_client import _decode
+from centralcli.protobuf import monitoring_pb2
+from centralcli.ws_client import _decode, _is_wanted, _pb_to_dict
 
 
 def test_decode_ip_from_int():
@@ -25,3 +27,39 @@ def test_decode_ipv6_from_bytes():
     raw = bytes.fromhex("20010db8000000000000000000000001")  # 2001:db8::1
     b64 = base64.b64encode(raw).decode("ascii")
     assert _decode(b64, field_type="ip") == "2001:db8::1"
+
+
+def test_pb_to_dict_decodes_from_fields():
+    pb_data = monitoring_pb2.MonitoringInformation(timestamp=1700000000, data_elements=[monitoring_pb2.DataElement.Value("STAT_CLIENT")])
+    pb_data.wireless_clients.add(
+        macaddr=monitoring_pb2.MacAddress(addr=bytes.fromhex("aabbccddeeff")),
+        ip_address=monitoring_pb2.IpAddress(addr=b"\x0a\x00\x00\x01"),
+        network=b"corp",
+    )
+    as_dict = _pb_to_dict(pb_data)
+    assert as_dict["timestamp"] == 1700000000
+    assert as_dict["dataElements"] == ["STAT_CLIENT"]
+    assert as_dict["wirelessClients"] == [{"macaddr": "aa:bb:cc:dd:ee:ff", "ipAddress": "10.0.0.1", "network": "corp"}]
+
+
+def test_is_wanted_filters_ignored_types():
+    pb_data = monitoring_pb2.MonitoringInformation(data_elements=[monitoring_pb2.DataElement.Value("STAT_CLIENT")])
+    assert not _is_wanted(pb_data)
+    pb_data.data_elements.append(monitoring_pb2.DataElement.Value("STATE_CONTROLLER"))
+    assert _is_wanted(pb_data)
+
+
+def test_pb_to_dict_int_ip_and_json_safe():
+    pb_data = monitoring_pb2.MonitoringInformation()
+    pb_data.uplink_probe_stats.add(device_id="CN12345678", probe_ip_addr=0x08080808, vpnc_ip_addr=0x0a000001, ip_address=monitoring_pb2.IpAddress(addr=b"\x0a\x00\x00\x02"))
+    pb_data.ssid_stats.add(essid=b"\xffcorp")
+    as_dict = _pb_to_dict(pb_data)
+    assert as_dict["uplinkProbeStats"] == [{"deviceId": "CN12345678", "ipAddress": "10.0.0.2", "vpncIpAddr": "10.0.0.1", "probeIpAddr": "8.8.8.8"}]
+    assert as_dict["ssidStats"][0]["essid"].endswith("corp")
+    assert json.loads(json.dumps(as_dict)) == as_dict
+
+
+def test_decode_never_returns_bytes():
+    assert _decode(b"\xde\xad\xbe\xef\x00", field_type="bytes") == "de:ad:be:ef:00"
+    assert _decode(b"\x01\x02\x03", field_type="ip") == "0.1.2.3"  # short address, padded by the int conversion
+    assert _decode(b"\x01" * 17, field_type="ip") == ":".join(["01"] * 17)  # too long for an address
@@ -0,0 +1,26 @@
+import time
+
+from centralcli.ws_store import StreamStore
+
+
+def test_stream_store_add_and_query(tmp_path):
+    with StreamStore(tmp_path / "stream.db") as store:
+        written = store.add(
+            "monitoring",
+            [
+                {"timestamp": 1, "dataElements": ["STATE_CONTROLLER"], "wirelessClients": [{"macaddr": "aa:bb:cc:dd:ee:ff", "associatedDevice": "CN12345678"}]},
+                {"timestamp": 2, "interfaces": [{"deviceId": "CN87654321", "portNumber": "1"}, {"deviceId": "CN12345678", "portNumber": "2"}]},
+            ],
+        )
+        assert written == 3
+        assert [e["msg_type"] for e in store.query(serial="CN12345678")] == ["interfaces", "wirelessClients"]
+        assert [e["portNumber"] for e in store.query(msg_type="INTERFACES")] == ["2", "1"]
+        assert len(store.query(count=1)) == 1
+
+
+def test_stream_store_retention(tmp_path):
+    with StreamStore(tmp_path / "stream.db", retention=1) as store:
+        store.add("audit", [{"service": "CONFIGURATION", "target": "lab"}])
+        store.conn.execute("UPDATE events SET ts = ?", (int(time.time()) - 7200,))
+        assert store.prune() == 1
+        assert store.query() == []